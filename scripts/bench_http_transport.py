@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib import request
+
+from llm_eval.providers.http import close_transport, post_json
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Minimal provider stand-in returning a fixed completion.
+
+    ``connect_delay_seconds`` is paid once per new connection to model the TCP + TLS
+    handshake round trips a real provider endpoint costs; loopback alone has none.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    delay_seconds = 0.0
+    connect_delay_seconds = 0.0
+
+    def setup(self) -> None:
+        super().setup()
+        if self.connect_delay_seconds:
+            time.sleep(self.connect_delay_seconds)
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.delay_seconds:
+            time.sleep(self.delay_seconds)
+        body = json.dumps({"choices": [{"message": {"content": "B"}}]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        _ = (format, args)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Compare per-call urllib connections with the pooled provider transport."
+    )
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--connect-delay-ms", type=float, default=50.0)
+    parser.add_argument("--server-delay-ms", type=float, default=0.0)
+    return parser.parse_args()
+
+
+def _urllib_post(url: str, payload: dict) -> None:
+    req = request.Request(
+        url,
+        data=json.dumps(payload).encode("utf-8"),
+        method="POST",
+        headers={"Content-Type": "application/json"},
+    )
+    with request.urlopen(req, timeout=10) as resp:
+        json.loads(resp.read())
+
+
+def _time_calls(label: str, call, count: int) -> float:
+    latencies = []
+    for index in range(count):
+        started = time.perf_counter()
+        call({"n": index})
+        latencies.append((time.perf_counter() - started) * 1000)
+    median = statistics.median(latencies)
+    print(f"{label:<18} median {median:7.3f} ms   mean {statistics.fmean(latencies):7.3f} ms")
+    return median
+
+
+def main() -> int:
+    args = parse_args()
+    _StandInHandler.delay_seconds = args.server_delay_ms / 1000
+    _StandInHandler.connect_delay_seconds = args.connect_delay_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/v1/chat/completions"
+    try:
+        fresh = _time_calls(
+            "urllib per call", lambda payload: _urllib_post(url, payload), args.requests
+        )
+        pooled = _time_calls(
+            "pooled transport",
+            lambda payload: post_json(url=url, payload=payload, headers={}, timeout_seconds=10),
+            args.requests,
+        )
+    finally:
+        close_transport()
+        server.shutdown()
+        server.server_close()
+    print(f"per-request overhead saved: {fresh - pooled:.3f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -6,11 +6,13 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
+from llm_eval.bundles import export_bundle, find_bundles, import_bundle
+from llm_eval.cache import SQLiteResponseCache, default_cache_path
 from llm_eval.config import build_run_manifest, load_run_config
+from llm_eval.policy import merge_policy
 from llm_eval.reporting import write_reports
 from llm_eval.runner import run_evaluation
-from llm_eval.scoring import load_results, load_summary, score_results
-from llm_eval.stats import add_confidence_intervals, pairwise_significance
+from llm_eval.scoring import score_run
 
 
 def parse_args() -> argparse.Namespace:
@@ -22,14 +24,56 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--env", default=".env")
     parser.add_argument("--artifacts-root", default="artifacts")
     parser.add_argument("--reports-root", default="reports")
+    parser.add_argument(
+        "--cache-bundles",
+        default=None,
+        help="Directory of cache bundles to import before the run and export to after it.",
+    )
     return parser.parse_args()
 
 
+def _open_cache(config_path: str, policy_path: str, artifacts_root: str) -> SQLiteResponseCache:
+    config = load_run_config(config_path)
+    cache_policy = merge_policy(config, policy_path=policy_path).cache
+    return SQLiteResponseCache(default_cache_path(artifacts_root, cache_policy), cache_policy)
+
+
+def restore_cache(args: argparse.Namespace) -> dict[str, int]:
+    cache = _open_cache(args.config, args.policy, args.artifacts_root)
+    totals = {"bundles": 0, "added": 0, "updated": 0, "skipped": 0}
+    try:
+        for path in find_bundles(args.cache_bundles):
+            result = import_bundle(cache, path)
+            totals["bundles"] += 1
+            totals["added"] += result.added
+            totals["updated"] += result.updated
+            totals["skipped"] += result.skipped
+    finally:
+        cache.close()
+    return totals
+
+
+def save_cache(args: argparse.Namespace) -> str:
+    """Export the whole cache; it supersedes the bundles that were restored."""
+    cache = _open_cache(args.config, args.policy, args.artifacts_root)
+    try:
+        path = export_bundle(cache, args.cache_bundles).path
+    finally:
+        cache.close()
+    for stale in find_bundles(args.cache_bundles):
+        if stale != path:
+            stale.unlink()
+    return str(path)
+
+
 def main() -> int:
     args = parse_args()
     config = load_run_config(args.config)
     manifest = build_run_manifest(config)
     started_at = datetime.now(timezone.utc).isoformat()
+    cache_restore = None
+    if args.cache_bundles and Path(args.cache_bundles).exists():
+        cache_restore = restore_cache(args)
 
     summary = run_evaluation(
         config=config,
@@ -39,11 +83,7 @@ def main() -> int:
     )
 
     run_dir = Path(args.artifacts_root) / "runs" / summary.run_id
-    results = load_results(run_dir)
-    summary_payload = load_summary(run_dir)
-    scored = score_results(results, summary_payload)
-    scored = add_confidence_intervals(scored)
-    pairwise = pairwise_significance(results)
+    scored, pairwise = score_run(run_dir)
     outputs = write_reports(
         run_id=summary.run_id,
         scored=scored,
@@ -51,16 +91,20 @@ def main() -> int:
         reports_root=args.reports_root,
     )
 
+    cache_bundle = save_cache(args) if args.cache_bundles else None
+
     job_meta = {
         "job_type": "nightly_eval",
         "started_at": started_at,
         "finished_at": datetime.now(timezone.utc).isoformat(),
         "run_id": summary.run_id,
         "run_name": config.run_name,
-        "status": summary_payload.get("status", "unknown"),
+        "status": scored["status"],
         "total_requests": summary.total_requests,
         "total_errors": summary.total_errors,
         "reports": outputs,
+        "cache_restore": cache_restore,
+        "cache_bundle": cache_bundle,
         "manifest_preview": {
             "run_id": manifest.run_id,
             "providers": manifest.providers,
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import warnings
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from llm_eval.vectorized import correctness_matrix
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy comes with the optional "fast" extra
+    np = None  # type: ignore[assignment]
+
+# Resamples per task. Fixed so that each chunk's random stream, and therefore every
+# interval, is the same whatever the number of workers.
+CHUNK_RESAMPLES = 250
+
+# Fields ``paired_bootstrap`` reads.
+BOOTSTRAP_COLUMNS = ("system_id", "provider", "model", "sample_id", "category", "is_correct")
+
+
+@dataclass
+class BootstrapResult:
+    """Percentile intervals from a paired bootstrap over samples.
+
+    ``systems`` maps system id to ``{"low", "high"}`` accuracy bounds plus
+    ``"categories"``; ``pairs`` maps ``(a, b)`` with a < b to the accuracy difference
+    a - b on their shared samples, its bounds and a two-sided bootstrap p-value.
+    """
+
+    resamples: int
+    confidence: float
+    seed: int
+    systems: dict[str, dict[str, Any]] = field(default_factory=dict)
+    pairs: dict[tuple[str, str], dict[str, float | None]] = field(default_factory=dict)
+
+
+def _ratio(numerator: Any, denominator: Any) -> Any:
+    out = np.full(numerator.shape, np.nan)
+    np.divide(numerator, denominator, out=out, where=denominator > 0)
+    return out
+
+
+def _chunk(task: tuple[Any, int, Any, Any, Any, Any, Any]) -> tuple[Any, Any, Any]:
+    """Draw one chunk of resamples and evaluate every system, category and pair on it."""
+    seed, size, present, right, by_category, pair_left, pair_right = task
+    n_samples = present.shape[1]
+    rng = np.random.default_rng(seed)
+    indices = rng.integers(0, n_samples, size=(size, n_samples))
+    # Row r of ``weights`` counts how often each sample was drawn in resample r, so
+    # every statistic below is one matrix product over all resamples at once.
+    offsets = (np.arange(size) * n_samples)[:, None]
+    weights = np.bincount((indices + offsets).ravel(), minlength=size * n_samples)
+    weights = weights.reshape(size, n_samples).astype(np.float64)
+
+    accuracy = _ratio(weights @ right.T, weights @ present.T)
+    category_accuracy = _ratio(
+        weights @ (right[:, None, :] * by_category).reshape(-1, n_samples).T,
+        weights @ (present[:, None, :] * by_category).reshape(-1, n_samples).T,
+    )
+    shared = present[pair_left] * present[pair_right]
+    difference = _ratio(
+        weights @ (right[pair_left] * present[pair_right]).T
+        - weights @ (right[pair_right] * present[pair_left]).T,
+        weights @ shared.T,
+    )
+    return accuracy, category_accuracy, difference
+
+
+def _bounds(draws: Any, confidence: float) -> tuple[Any, Any]:
+    """Percentile bounds per column, ignoring resamples where the statistic is undefined."""
+    alpha = (1.0 - confidence) / 2
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns stay NaN
+        low, high = np.nanquantile(draws, [alpha, 1.0 - alpha], axis=0)
+    return low, high
+
+
+def _value(number: Any) -> float | None:
+    return None if np.isnan(number) else float(number)
+
+
+def paired_bootstrap(
+    results: Sequence[dict[str, Any]],
+    *,
+    resamples: int = 10_000,
+    confidence: float = 0.95,
+    seed: int = 42,
+    workers: int = 1,
+) -> BootstrapResult:
+    """Paired bootstrap over samples for accuracies, category accuracies and differences.
+
+    Every resample draws sample indices once and reuses them for all systems, so each
+    pair is compared on the same resampled questions. Resamples are evaluated in chunks
+    of ``CHUNK_RESAMPLES``; with ``workers`` > 1 the chunks run in a process pool.
+    Chunk seeds are spawned from ``seed`` (the run's ``RunConfig.seed``), so the result
+    depends only on ``seed`` and ``resamples``. Requires numpy (the "fast" extra).
+    """
+    if np is None:
+        raise RuntimeError('paired_bootstrap needs numpy; install with `pip install ".[fast]"`')
+    result = BootstrapResult(resamples=resamples, confidence=confidence, seed=seed)
+    names, samples, present, right = correctness_matrix(results)
+    if not names or not samples or resamples <= 0:
+        return result
+
+    sample_index = {sample: index for index, sample in enumerate(samples)}
+    category_of: dict[int, str] = {}
+    for row in results:
+        index = sample_index[str(row.get("sample_id"))]
+        category_of.setdefault(index, str(row.get("category", "unknown")))
+    categories = sorted(set(category_of.values()))
+    codes = {category: code for code, category in enumerate(categories)}
+    category_code = np.asarray([codes[category_of[index]] for index in range(len(samples))])
+    by_category = (category_code[None, :] == np.arange(len(categories))[:, None]).astype(
+        np.float64
+    )[None, :, :]
+    pairs = [(i, j) for i in range(len(names)) for j in range(i + 1, len(names))]
+    pair_left = np.asarray([i for i, _ in pairs], dtype=np.intp)
+    pair_right = np.asarray([j for _, j in pairs], dtype=np.intp)
+
+    sizes = [CHUNK_RESAMPLES] * (resamples // CHUNK_RESAMPLES)
+    if resamples % CHUNK_RESAMPLES:
+        sizes.append(resamples % CHUNK_RESAMPLES)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [
+        (chunk_seed, size, present, right, by_category, pair_left, pair_right)
+        for chunk_seed, size in zip(seeds, sizes)
+    ]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunks = list(pool.map(_chunk, tasks))
+    else:
+        chunks = [_chunk(task) for task in tasks]
+    accuracy, category_accuracy, difference = (
+        np.concatenate([chunk[part] for chunk in chunks]) for part in range(3)
+    )
+
+    acc_low, acc_high = _bounds(accuracy, confidence)
+    cat_low, cat_high = _bounds(category_accuracy, confidence)
+    for s, name in enumerate(names):
+        cats: dict[str, dict[str, float | None]] = {}
+        for c, category in enumerate(categories):
+            if not (present[s] * by_category[0, c]).any():
+                continue
+            column = s * len(categories) + c
+            cats[category] = {"low": _value(cat_low[column]), "high": _value(cat_high[column])}
+        result.systems[name] = {
+            "low": _value(acc_low[s]),
+            "high": _value(acc_high[s]),
+            "categories": cats,
+        }
+
+    diff_low, diff_high = _bounds(difference, confidence)
+    shared = present[pair_left] * present[pair_right]
+    observed = _ratio(
+        (right[pair_left] * present[pair_right]).sum(axis=1)
+        - (right[pair_right] * present[pair_left]).sum(axis=1),
+        shared.sum(axis=1),
+    )
+    with np.errstate(invalid="ignore"):
+        finite = ~np.isnan(difference)
+        draws = finite.sum(axis=0)
+        at_most_zero = ((difference <= 0) & finite).sum(axis=0)
+        at_least_zero = ((difference >= 0) & finite).sum(axis=0)
+    for k, (i, j) in enumerate(pairs):
+        p_value = (
+            min(1.0, 2 * float(min(at_most_zero[k], at_least_zero[k])) / float(draws[k]))
+            if draws[k]
+            else None
+        )
+        result.pairs[(names[i], names[j])] = {
+            "accuracy_diff": _value(observed[k]),
+            "low": _value(diff_low[k]),
+            "high": _value(diff_high[k]),
+            "p_value": p_value,
+        }
+    return result
+
+
+def apply_bootstrap(
+    scored: dict[str, Any], pairwise: list[dict[str, Any]], result: BootstrapResult
+) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Attach bootstrap intervals to ``score_results``/``pairwise_significance`` output."""
+    scored["bootstrap"] = {
+        "resamples": result.resamples,
+        "confidence": result.confidence,
+        "seed": result.seed,
+    }
+    for system_id, metrics in scored.get("providers", {}).items():
+        intervals = result.systems.get(system_id)
+        if intervals is None:
+            continue
+        metrics["accuracy_ci_bootstrap"] = {"low": intervals["low"], "high": intervals["high"]}
+        for category, bounds in intervals["categories"].items():
+            if category in metrics.get("categories", {}):
+                metrics["categories"][category]["accuracy_ci_bootstrap"] = bounds
+    for row in pairwise:
+        pair = result.pairs.get((row["provider_a"], row["provider_b"]))
+        if pair is None:
+            continue
+        row["accuracy_diff"] = pair["accuracy_diff"]
+        row["accuracy_diff_ci_bootstrap"] = {"low": pair["low"], "high": pair["high"]}
+        row["p_value_bootstrap"] = pair["p_value"]
+    return scored, pairwise
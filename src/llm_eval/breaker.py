@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Literal
+
+BreakerState = Literal["closed", "open", "half_open", "dropped"]
+
+
+class CircuitBreaker:
+    """Sliding-window circuit breaker for one system.
+
+    ``closed``: requests flow and outcomes fill a window of the last ``window_size``
+    requests; once the window is full and its error rate exceeds ``threshold_percent``
+    the breaker opens. ``open``: no requests for ``cooldown_seconds``. ``half_open``:
+    up to ``probe_requests`` probes are let through; all succeeding closes the breaker
+    with a fresh window, any failing reopens it. A system that opens more than
+    ``max_open_cycles`` times is ``dropped`` for the rest of the run. A disabled
+    breaker stays closed.
+    """
+
+    def __init__(
+        self,
+        *,
+        window_size: int,
+        threshold_percent: float,
+        cooldown_seconds: float,
+        probe_requests: int,
+        max_open_cycles: int,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.window_size = max(1, window_size)
+        self.threshold_percent = threshold_percent
+        self.cooldown_seconds = cooldown_seconds
+        self.probe_requests = max(1, probe_requests)
+        self.max_open_cycles = max_open_cycles
+        self.enabled = enabled
+        self._clock = clock
+        self._window: deque[bool] = deque(maxlen=self.window_size)
+        self._state: BreakerState = "closed"
+        self._opened_at = 0.0
+        self._probes_started = 0
+        self._probe_successes = 0
+        self.open_cycles = 0
+
+    @property
+    def state(self) -> BreakerState:
+        if self._state == "open" and self._clock() - self._opened_at >= self.cooldown_seconds:
+            self._state = "half_open"
+            self._probes_started = 0
+            self._probe_successes = 0
+        return self._state
+
+    def window_error_rate_percent(self) -> float:
+        if not self._window:
+            return 0.0
+        return 100.0 * sum(1 for ok in self._window if not ok) / len(self._window)
+
+    def allow_request(self) -> bool:
+        """True if a request may start now; in half-open this reserves a probe slot."""
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and self._probes_started < self.probe_requests:
+            self._probes_started += 1
+            return True
+        return False
+
+    def seconds_until_probe(self) -> float | None:
+        if self.state != "open":
+            return None
+        return max(0.0, self.cooldown_seconds - (self._clock() - self._opened_at))
+
+    def _trip(self) -> None:
+        self.open_cycles += 1
+        self._window.clear()
+        if self.open_cycles > self.max_open_cycles:
+            self._state = "dropped"
+            return
+        self._state = "open"
+        self._opened_at = self._clock()
+
+    def record(self, success: bool) -> None:
+        if not self.enabled:
+            return
+        state = self.state
+        if state == "half_open":
+            if not success:
+                self._trip()
+                return
+            self._probe_successes += 1
+            if self._probe_successes >= self.probe_requests:
+                self._state = "closed"
+                self._window.clear()
+            return
+        if state != "closed":
+            return
+        self._window.append(success)
+        if (
+            len(self._window) >= self.window_size
+            and self.window_error_rate_percent() > self.threshold_percent
+        ):
+            self._trip()
+
+    def record_retry(self) -> None:
+        """A retryable failure. It fails a half-open probe; in ``closed`` the window waits
+        for the attempt's final outcome instead.
+        """
+        if self.enabled and self.state == "half_open":
+            self._trip()
+
+    def release_probe(self) -> None:
+        """Give back a probe slot whose attempt said nothing about the provider (a cache hit)."""
+        if self._state == "half_open" and self._probes_started > 0:
+            self._probes_started -= 1
+
+    def snapshot(self) -> dict[str, str | int | float]:
+        return {
+            "state": self.state,
+            "open_cycles": self.open_cycles,
+            "window_error_rate_percent": round(self.window_error_rate_percent(), 2),
+        }
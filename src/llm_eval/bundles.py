@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from llm_eval.cache import CacheEntry, CacheKey, MergeResult, SQLiteResponseCache
+
+BUNDLE_FORMAT = "llm-eval-cache-bundle"
+BUNDLE_VERSION = 1
+BUNDLE_SUFFIX = ".jsonl.gz"
+
+
+class BundleError(ValueError):
+    """A cache bundle is malformed or fails its integrity checks."""
+
+
+@dataclass
+class BundleInfo:
+    path: Path
+    entries: int
+    sha256: str
+    filters: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ImportResult(MergeResult):
+    path: Path | None = None
+    entries: int = 0
+
+
+def _entry_line(entry: CacheEntry) -> dict[str, Any]:
+    return {
+        "provider": entry.key.provider,
+        "model": entry.key.model,
+        "prompt_sha256": entry.key.prompt_sha256,
+        "temperature": entry.key.temperature,
+        "max_tokens": entry.key.max_tokens,
+        "key": entry.key.digest,
+        "created_at": entry.created_at,
+        "payload": entry.payload,
+        "payload_sha256": hashlib.sha256(entry.payload.encode("utf-8")).hexdigest(),
+    }
+
+
+def export_bundle(
+    cache: SQLiteResponseCache,
+    out_dir: str | Path,
+    *,
+    providers: list[str] | None = None,
+    models: list[str] | None = None,
+    since: float | None = None,
+    until: float | None = None,
+) -> BundleInfo:
+    """Write matching cache entries to ``<out_dir>/cache-<sha256>.jsonl.gz``.
+
+    The file is a gzip-compressed JSON-lines stream: a header, one line per entry in key
+    order and a trailer holding the SHA-256 of every line before it. The name is derived
+    from that hash, so exporting the same entries twice yields the same file once.
+    """
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    filters = {
+        "providers": providers or [],
+        "models": models or [],
+        "since": since,
+        "until": until,
+    }
+    digest = hashlib.sha256()
+    count = 0
+    fd, tmp_name = tempfile.mkstemp(dir=out, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as raw, gzip.GzipFile(fileobj=raw, mode="wb", mtime=0) as gz:
+
+            def _write(record: dict[str, Any]) -> None:
+                line = (json.dumps(record, ensure_ascii=True, sort_keys=True) + "\n").encode()
+                digest.update(line)
+                gz.write(line)
+
+            _write({"format": BUNDLE_FORMAT, "version": BUNDLE_VERSION, "filters": filters})
+            for entry in cache.iter_entries(
+                providers=providers, models=models, since=since, until=until
+            ):
+                _write(_entry_line(entry))
+                count += 1
+            sha256 = digest.hexdigest()
+            gz.write((json.dumps({"entries": count, "sha256": sha256}) + "\n").encode())
+        path = out / f"cache-{sha256[:16]}{BUNDLE_SUFFIX}"
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return BundleInfo(path=path, entries=count, sha256=sha256, filters=filters)
+
+
+def _read_lines(path: Path) -> Iterator[bytes]:
+    try:
+        with gzip.open(path, "rb") as gz:
+            yield from gz
+    except (OSError, EOFError) as exc:
+        raise BundleError(f"{path}: not a readable gzip bundle ({exc})") from exc
+
+
+def _parse_entry(path: Path, number: int, line: bytes) -> CacheEntry:
+    try:
+        row = json.loads(line)
+        key = CacheKey(
+            provider=str(row["provider"]),
+            model=str(row["model"]),
+            prompt_sha256=str(row["prompt_sha256"]),
+            temperature=float(row["temperature"]),
+            max_tokens=int(row["max_tokens"]),
+        )
+        payload = str(row["payload"])
+        created_at = float(row["created_at"])
+    except (ValueError, KeyError, TypeError) as exc:
+        raise BundleError(f"{path}:{number}: malformed entry") from exc
+    if key.digest != row.get("key"):
+        raise BundleError(f"{path}:{number}: key does not match its request fields")
+    if hashlib.sha256(payload.encode("utf-8")).hexdigest() != row.get("payload_sha256"):
+        raise BundleError(f"{path}:{number}: payload hash mismatch")
+    return CacheEntry(key=key, payload=payload, created_at=created_at)
+
+
+def verify_bundle(path: str | Path) -> dict[str, Any]:
+    """Check every hash in a bundle without importing it; returns its header."""
+    path = Path(path)
+    digest = hashlib.sha256()
+    header: dict[str, Any] | None = None
+    trailer: dict[str, Any] | None = None
+    count = 0
+    for number, line in enumerate(_read_lines(path), start=1):
+        if trailer is not None:
+            raise BundleError(f"{path}:{number}: data after trailer")
+        if header is None:
+            try:
+                header = json.loads(line)
+            except ValueError as exc:
+                raise BundleError(f"{path}: malformed header") from exc
+            if not isinstance(header, dict) or header.get("format") != BUNDLE_FORMAT:
+                raise BundleError(f"{path}: not an llm-eval cache bundle")
+            if header.get("version") != BUNDLE_VERSION:
+                raise BundleError(f"{path}: unsupported bundle version {header.get('version')}")
+            digest.update(line)
+            continue
+        row = json.loads(line) if line.startswith(b'{"entries"') else None
+        if row is not None and "sha256" in row:
+            trailer = row
+            continue
+        _parse_entry(path, number, line)
+        digest.update(line)
+        count += 1
+    if header is None or trailer is None:
+        raise BundleError(f"{path}: truncated bundle")
+    if trailer.get("entries") != count or trailer.get("sha256") != digest.hexdigest():
+        raise BundleError(f"{path}: bundle hash mismatch")
+    return header
+
+
+def iter_bundle(path: str | Path) -> Iterator[CacheEntry]:
+    """Entries of a bundle that has already passed ``verify_bundle``."""
+    path = Path(path)
+    for number, line in enumerate(_read_lines(path), start=1):
+        if number == 1 or line.startswith(b'{"entries"'):
+            continue
+        yield _parse_entry(path, number, line)
+
+
+def import_bundle(cache: SQLiteResponseCache, path: str | Path) -> ImportResult:
+    """Verify a bundle, then merge it; existing keys are kept unless the bundle is newer."""
+    path = Path(path)
+    verify_bundle(path)
+    entries = 0
+
+    def _counted() -> Iterator[CacheEntry]:
+        nonlocal entries
+        for entry in iter_bundle(path):
+            entries += 1
+            yield entry
+
+    merged = cache.merge_entries(_counted())
+    return ImportResult(
+        added=merged.added,
+        updated=merged.updated,
+        skipped=merged.skipped,
+        path=path,
+        entries=entries,
+    )
+
+
+def find_bundles(path: str | Path) -> list[Path]:
+    """A bundle file itself, or every bundle in a directory."""
+    path = Path(path)
+    if path.is_dir():
+        return sorted(path.glob(f"cache-*{BUNDLE_SUFFIX}"))
+    return [path]
@@ -1,29 +1,601 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from copy import deepcopy
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Any
 
+from llm_eval.config import CachePolicy
 
-class ResponseCache:
-    """Simple filesystem cache keyed by deterministic request hash."""
 
-    def __init__(self, root_dir: str | Path):
-        self.root_dir = Path(root_dir)
-        self.root_dir.mkdir(parents=True, exist_ok=True)
+def prompt_sha256(prompt: str) -> str:
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
 
-    def _path_for_key(self, cache_key: str) -> Path:
-        return self.root_dir / f"{cache_key}.json"
 
-    def has(self, cache_key: str) -> bool:
-        return self._path_for_key(cache_key).exists()
+@dataclass(frozen=True)
+class CacheKey:
+    """Everything that determines a response; run name, sample id and run_id are excluded."""
 
-    def get(self, cache_key: str) -> dict[str, Any] | None:
-        path = self._path_for_key(cache_key)
-        if not path.exists():
+    provider: str
+    model: str
+    prompt_sha256: str
+    temperature: float
+    max_tokens: int
+
+    @classmethod
+    def for_request(
+        cls, *, provider: str, model: str, prompt: str, temperature: float, max_tokens: int
+    ) -> CacheKey:
+        return cls(
+            provider=provider,
+            model=model,
+            prompt_sha256=prompt_sha256(prompt),
+            temperature=float(temperature),
+            max_tokens=int(max_tokens),
+        )
+
+    @property
+    def digest(self) -> str:
+        payload = json.dumps(
+            [self.provider, self.model, self.prompt_sha256, self.temperature, self.max_tokens]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_sha256 TEXT NOT NULL,
+    temperature REAL NOT NULL,
+    max_tokens INTEGER NOT NULL,
+    payload TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS responses_provider_model ON responses (provider, model);
+CREATE INDEX IF NOT EXISTS responses_created_at ON responses (created_at);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+_SECONDS_PER_DAY = 86400.0
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+    bytes_saved: int = 0
+    # Subset of ``hits`` answered by the in-process tier without touching the store.
+    memory_hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def store_hits(self) -> int:
+        return self.hits - self.memory_hits
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "memory_hits": self.memory_hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hit_rate, 4),
+            "expired": self.expired,
+            "evictions": self.evictions,
+            "bytes_saved": self.bytes_saved,
+        }
+
+
+_COUNTERS = tuple(field.name for field in fields(CacheStats))
+
+
+@dataclass
+class PruneResult:
+    expired: int = 0
+    evicted: int = 0
+    freed_bytes: int = 0
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """One stored response with the key fields it was written under."""
+
+    key: CacheKey
+    payload: str
+    created_at: float
+
+
+@dataclass
+class MergeResult:
+    added: int = 0
+    updated: int = 0
+    skipped: int = 0
+
+
+class MemoryCacheTier:
+    """Byte-bounded LRU of decoded responses kept in front of one or more stores.
+
+    Entries are keyed by store path and ``CacheKey`` digest so several stores can share
+    one tier. Payloads are copied in and out, so callers never alias cached state.
+    """
+
+    def __init__(self, max_bytes: int = 0):
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[dict[str, Any], int, float]] = (
+            OrderedDict()
+        )
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict()
+
+    def get(
+        self, store: str, digest: str, cutoff: float | None
+    ) -> tuple[dict[str, Any], int] | None:
+        """Payload and stored size, or None when absent or created before ``cutoff``."""
+        with self._lock:
+            entry = self._entries.get((store, digest))
+            if entry is None:
+                return None
+            payload, size, created_at = entry
+            if cutoff is not None and created_at < cutoff:
+                self._drop((store, digest))
+                return None
+            self._entries.move_to_end((store, digest))
+        return deepcopy(payload), size
+
+    def put(
+        self, store: str, digest: str, payload: dict[str, Any], size: int, created_at: float
+    ) -> None:
+        if size > self.max_bytes:
+            self.discard(store, [digest])
+            return
+        entry = (deepcopy(payload), size, created_at)
+        with self._lock:
+            self._drop((store, digest))
+            self._entries[(store, digest)] = entry
+            self._bytes += size
+            self._evict()
+
+    def discard(self, store: str, digests: list[str]) -> None:
+        with self._lock:
+            for digest in digests:
+                self._drop((store, digest))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, key: tuple[str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def _evict(self) -> None:
+        while self._entries and self._bytes > self.max_bytes:
+            _, (_, size, _) = self._entries.popitem(last=False)
+            self._bytes -= size
+            self.evictions += 1
+
+
+_DEFAULT_MEMORY_TIER = MemoryCacheTier()
+
+
+def default_memory_tier(max_bytes: int) -> MemoryCacheTier | None:
+    """The process-wide tier resized to ``max_bytes``, or None when the tier is off."""
+    _DEFAULT_MEMORY_TIER.resize(max_bytes)
+    return _DEFAULT_MEMORY_TIER if max_bytes > 0 else None
+
+
+class SQLiteResponseCache:
+    """Response cache shared across runs in one SQLite file.
+
+    WAL journaling lets readers proceed while another process writes, and a busy
+    timeout serialises concurrent writers (parallel workers, several UI sessions).
+    Connections are per thread, as sqlite3 requires.
+
+    Entries older than ``policy.max_age_days`` are never served. ``prune`` deletes them
+    and then evicts least-recently-used (``lru``) or oldest (``ttl``) entries until
+    ``max_entries`` and ``max_bytes`` hold. ``stats`` counts this instance's activity;
+    ``close`` adds it to the lifetime totals stored in the database.
+
+    With a ``memory`` tier, reads are answered from it first and writes go through to
+    both, so repeated lookups in one process never reach SQLite. Recency of those hits
+    is written back to ``accessed_at`` on ``prune`` and ``close``, and entries the store
+    expires or evicts are dropped from the tier.
+
+    ``read_only`` opens an existing file without creating it, its schema or any rows;
+    ``close`` then leaves recency and the lifetime totals as they were.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        policy: CachePolicy | None = None,
+        busy_timeout_seconds: float = 30.0,
+        memory: MemoryCacheTier | None = None,
+        read_only: bool = False,
+    ):
+        self.path = Path(path)
+        self.read_only = read_only
+        if not read_only:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.policy = policy or CachePolicy()
+        self.busy_timeout_seconds = busy_timeout_seconds
+        self.stats = CacheStats()
+        self._flushed = CacheStats()
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+        self.memory = memory
+        self._store_id = str(self.path.resolve())
+        self._touched: dict[str, float] = {}
+        if not read_only:
+            self._conn().executescript(_SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if self.read_only:
+                conn = sqlite3.connect(
+                    f"{self.path.resolve().as_uri()}?mode=ro",
+                    uri=True,
+                    timeout=self.busy_timeout_seconds,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+            else:
+                conn = sqlite3.connect(
+                    self.path,
+                    timeout=self.busy_timeout_seconds,
+                    isolation_level=None,
+                    check_same_thread=False,
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
+
+    def _expiry_cutoff(self, now: float) -> float | None:
+        if self.policy.max_age_days is None:
+            return None
+        return now - self.policy.max_age_days * _SECONDS_PER_DAY
+
+    def has(self, key: CacheKey) -> bool:
+        cutoff = self._expiry_cutoff(time.time())
+        if self.memory is not None and self.memory.get(self._store_id, key.digest, cutoff):
+            return True
+        row = self._conn().execute(
+            "SELECT 1 FROM responses WHERE key = ? AND created_at >= ?",
+            (key.digest, cutoff if cutoff is not None else float("-inf")),
+        ).fetchone()
+        return row is not None
+
+    def cached_prompts(
+        self, *, provider: str, model: str, temperature: float, max_tokens: int
+    ) -> set[str]:
+        """``prompt_sha256`` of every servable entry for one system's settings, in one query.
+
+        Cheaper than ``has`` per prompt when checking a whole dataset for one system.
+        """
+        cutoff = self._expiry_cutoff(time.time())
+        rows = self._conn().execute(
+            "SELECT prompt_sha256 FROM responses WHERE provider = ? AND model = ? "
+            "AND temperature = ? AND max_tokens = ? AND created_at >= ?",
+            (
+                provider,
+                model,
+                float(temperature),
+                int(max_tokens),
+                cutoff if cutoff is not None else float("-inf"),
+            ),
+        )
+        return {row[0] for row in rows}
+
+    def get(self, key: CacheKey) -> dict[str, Any] | None:
+        now = time.time()
+        cutoff = self._expiry_cutoff(now)
+        if self.memory is not None:
+            found = self.memory.get(self._store_id, key.digest, cutoff)
+            if found is not None:
+                with self._lock:
+                    self._touched[key.digest] = now
+                self.stats.hits += 1
+                self.stats.memory_hits += 1
+                self.stats.bytes_saved += found[1]
+                return found[0]
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT payload, size_bytes, created_at FROM responses WHERE key = ?", (key.digest,)
+        ).fetchone()
+        if row is not None and cutoff is not None and row[2] < cutoff:
+            self.stats.expired += 1
+            row = None
+        if row is None:
+            self.stats.misses += 1
             return None
-        return json.loads(path.read_text(encoding="utf-8"))
+        if not self.read_only:
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key.digest))
+        self.stats.hits += 1
+        self.stats.bytes_saved += int(row[1])
+        payload = json.loads(row[0])
+        if self.memory is not None:
+            self.memory.put(self._store_id, key.digest, payload, int(row[1]), float(row[2]))
+        return payload
+
+    def set(self, key: CacheKey, payload: dict[str, Any]) -> None:
+        text = json.dumps(payload, ensure_ascii=True)
+        size = len(text.encode("utf-8"))
+        now = time.time()
+        self._conn().execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                key.digest,
+                key.provider,
+                key.model,
+                key.prompt_sha256,
+                key.temperature,
+                key.max_tokens,
+                text,
+                size,
+                now,
+                now,
+            ),
+        )
+        if self.memory is not None:
+            self.memory.put(self._store_id, key.digest, payload, size, now)
+
+    def _flush_touched(self) -> None:
+        with self._lock:
+            touched, self._touched = self._touched, {}
+        if touched:
+            self._conn().executemany(
+                "UPDATE responses SET accessed_at = MAX(accessed_at, ?) WHERE key = ?",
+                [(when, digest) for digest, when in touched.items()],
+            )
+
+    def __len__(self) -> int:
+        return int(self._conn().execute("SELECT COUNT(*) FROM responses").fetchone()[0])
+
+    def prune(self, now: float | None = None) -> PruneResult:
+        """Delete expired entries, then evict until the capacity limits hold."""
+        now = time.time() if now is None else now
+        result = PruneResult()
+        self._flush_touched()
+        conn = self._conn()
+        expired: list[tuple[str]] = []
+        doomed: list[tuple[str]] = []
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            cutoff = self._expiry_cutoff(now)
+            if cutoff is not None:
+                rows = conn.execute(
+                    "SELECT key, size_bytes FROM responses WHERE created_at < ?", (cutoff,)
+                ).fetchall()
+                expired = [(key,) for key, _ in rows]
+                conn.executemany("DELETE FROM responses WHERE key = ?", expired)
+                result.expired = len(rows)
+                result.freed_bytes = sum(int(size) for _, size in rows)
+
+            entries, total_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM responses"
+            ).fetchone()
+            max_entries = self.policy.max_entries
+            max_bytes = self.policy.max_bytes
+            order = "accessed_at" if self.policy.eviction == "lru" else "created_at"
+            if (max_entries is not None and entries > max_entries) or (
+                max_bytes is not None and total_bytes > max_bytes
+            ):
+                for key, size in conn.execute(
+                    f"SELECT key, size_bytes FROM responses ORDER BY {order}, key"
+                ):
+                    if (max_entries is None or entries <= max_entries) and (
+                        max_bytes is None or total_bytes <= max_bytes
+                    ):
+                        break
+                    doomed.append((key,))
+                    entries -= 1
+                    total_bytes -= size
+                    result.freed_bytes += size
+                conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+            result.evicted = len(doomed)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if self.memory is not None:
+            self.memory.discard(self._store_id, [key for (key,) in expired + doomed])
+        self.stats.expired += result.expired
+        self.stats.evictions += result.evicted
+        return result
+
+    def _flush_stats(self) -> None:
+        current = self.stats.as_dict()
+        previous = self._flushed.as_dict()
+        deltas = [
+            (name, current[name] - previous[name])
+            for name in _COUNTERS
+            if current[name] != previous[name]
+        ]
+        if deltas:
+            self._conn().executemany(
+                "INSERT INTO stats (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                deltas,
+            )
+        self._flushed = CacheStats(**{name: current[name] for name in _COUNTERS})
+
+    def lifetime_stats(self) -> CacheStats:
+        """Totals over every session that used this store, including unflushed activity."""
+        rows = dict(self._conn().execute("SELECT name, value FROM stats").fetchall())
+        stats = CacheStats()
+        for name in _COUNTERS:
+            value = int(rows.get(name, 0))
+            value += getattr(self.stats, name) - getattr(self._flushed, name)
+            setattr(stats, name, value)
+        return stats
+
+    def iter_entries(
+        self,
+        *,
+        providers: list[str] | None = None,
+        models: list[str] | None = None,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> Iterator[CacheEntry]:
+        """Unexpired entries in key order, optionally filtered by system and write time."""
+        clauses = ["created_at >= ?"]
+        cutoff = self._expiry_cutoff(time.time())
+        params: list[Any] = [max(cutoff if cutoff is not None else float("-inf"), since or 0.0)]
+        if until is not None:
+            clauses.append("created_at < ?")
+            params.append(until)
+        for column, values in (("provider", providers), ("model", models)):
+            if values:
+                clauses.append(f"{column} IN ({', '.join('?' for _ in values)})")
+                params.extend(values)
+        rows = self._conn().execute(
+            "SELECT provider, model, prompt_sha256, temperature, max_tokens, payload, created_at "
+            f"FROM responses WHERE {' AND '.join(clauses)} ORDER BY key",
+            params,
+        )
+        for provider, model, prompt_sha256, temperature, max_tokens, payload, created_at in rows:
+            yield CacheEntry(
+                key=CacheKey(provider, model, prompt_sha256, float(temperature), int(max_tokens)),
+                payload=payload,
+                created_at=float(created_at),
+            )
+
+    def merge_entries(self, entries: Iterable[CacheEntry]) -> MergeResult:
+        """Insert entries from elsewhere; an existing key is only replaced by a newer write.
+
+        Entries already past ``max_age_days`` are skipped.
+        """
+        result = MergeResult()
+        cutoff = self._expiry_cutoff(time.time())
+        replaced: list[str] = []
+        conn = self._conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for entry in entries:
+                digest = entry.key.digest
+                if cutoff is not None and entry.created_at < cutoff:
+                    result.skipped += 1
+                    continue
+                row = conn.execute(
+                    "SELECT created_at FROM responses WHERE key = ?", (digest,)
+                ).fetchone()
+                if row is not None and row[0] >= entry.created_at:
+                    result.skipped += 1
+                    continue
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        digest,
+                        entry.key.provider,
+                        entry.key.model,
+                        entry.key.prompt_sha256,
+                        entry.key.temperature,
+                        entry.key.max_tokens,
+                        entry.payload,
+                        len(entry.payload.encode("utf-8")),
+                        entry.created_at,
+                        entry.created_at,
+                    ),
+                )
+                if row is None:
+                    result.added += 1
+                else:
+                    result.updated += 1
+                    replaced.append(digest)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        if self.memory is not None:
+            self.memory.discard(self._store_id, replaced)
+        return result
+
+    def describe(self) -> dict[str, Any]:
+        """Entry counts and sizes overall and per ``provider:model``."""
+        conn = self._conn()
+        entries, total_bytes, oldest, newest = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0), MIN(created_at), MAX(created_at) "
+            "FROM responses"
+        ).fetchone()
+        systems = {
+            f"{provider}:{model}": {"entries": count, "bytes": size}
+            for provider, model, count, size in conn.execute(
+                "SELECT provider, model, COUNT(*), SUM(size_bytes) FROM responses "
+                "GROUP BY provider, model ORDER BY provider, model"
+            )
+        }
+        return {
+            "path": str(self.path),
+            "entries": int(entries),
+            "bytes": int(total_bytes),
+            "oldest_created_at": oldest,
+            "newest_created_at": newest,
+            "systems": systems,
+            "lifetime": self.lifetime_stats().as_dict(),
+        }
+
+    def close(self) -> None:
+        if self._connections and not self.read_only:
+            self._flush_touched()
+            self._flush_stats()
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+
+def legacy_run_caches(artifacts_root: str | Path) -> list[tuple[Path, int, int]]:
+    """Per-run ``runs/<run_id>/cache`` directories as (path, files, bytes).
+
+    Runs once kept one ``<key>.json`` file per response there; the shared
+    ``SQLiteResponseCache`` replaced that layout, so these are only reported and pruned.
+    """
+    found: list[tuple[Path, int, int]] = []
+    for cache_dir in sorted((Path(artifacts_root) / "runs").glob("*/cache")):
+        files = [path for path in cache_dir.glob("*.json") if path.is_file()]
+        found.append((cache_dir, len(files), sum(path.stat().st_size for path in files)))
+    return found
+
 
-    def set(self, cache_key: str, payload: dict[str, Any]) -> None:
-        path = self._path_for_key(cache_key)
-        path.write_text(json.dumps(payload, ensure_ascii=True), encoding="utf-8")
+def default_cache_path(artifacts_root: str | Path, policy: CachePolicy) -> Path:
+    if policy.path:
+        return Path(policy.path)
+    return Path(artifacts_root) / "cache" / "responses.sqlite3"
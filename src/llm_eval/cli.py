@@ -1,22 +1,34 @@
 from __future__ import annotations
 
 import json
+import shutil
+from datetime import datetime, timezone
 from pathlib import Path
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
+from llm_eval.bootstrap import BOOTSTRAP_COLUMNS, apply_bootstrap, paired_bootstrap
+from llm_eval.bundles import BundleError, export_bundle, find_bundles, import_bundle
 from llm_eval.connectivity import (
     check_connectivity,
     diagnose_openai_endpoints,
     get_key_debug_info,
 )
-from llm_eval.config import build_run_manifest, load_run_config, resolve_provider_keys
+from llm_eval.cache import SQLiteResponseCache, default_cache_path, legacy_run_caches
+from llm_eval.config import (
+    CachePolicy,
+    build_run_manifest,
+    load_run_config,
+    resolve_provider_keys,
+)
+from llm_eval.planning import plan_run, plan_to_dict
+from llm_eval.policy import load_policy_yaml
+from llm_eval.registry import RunRegistry, default_registry_path
 from llm_eval.reporting import write_reports
 from llm_eval.runner import run_evaluation
-from llm_eval.scoring import load_results, load_summary, score_results
-from llm_eval.stats import add_confidence_intervals, pairwise_significance
+from llm_eval.scoring import load_results, score_run
 
 app = typer.Typer(help="LLM multi-model evaluation framework CLI.")
 console = Console()
@@ -144,6 +156,359 @@ def run(
     console.print(f"Artifacts written under [bold]{artifacts_root}/runs/{summary.run_id}[/bold]")
 
 
+def _format_duration(seconds: float | None) -> str:
+    if seconds is None:
+        return "n/a"
+    minutes, secs = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{secs:02d}s" if hours else f"{minutes}m{secs:02d}s"
+
+
+@app.command("plan")
+def plan(
+    config_path: str = typer.Option(
+        "configs/run.example.yaml", "--config", "-c", help="Path to run config YAML."
+    ),
+    policy_path: str = typer.Option(
+        "configs/policy.yaml", "--policy", help="Path to policy YAML."
+    ),
+    artifacts_root: str = typer.Option(
+        "artifacts", "--artifacts-root", help="Directory for run artifacts."
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the plan as JSON."),
+) -> None:
+    """Estimate remaining requests, cost and duration of a run without calling providers."""
+    config = load_run_config(config_path)
+    run_plan = plan_run(config, policy_path=policy_path, artifacts_root=artifacts_root)
+    if as_json:
+        console.print_json(data=plan_to_dict(run_plan))
+        return
+    table = Table(title=f"Run Plan ({run_plan.run_id}, {run_plan.execution_mode})")
+    table.add_column("System")
+    table.add_column("Done")
+    table.add_column("Cached")
+    table.add_column("To Send")
+    table.add_column("Input Tok")
+    table.add_column("Output Tok")
+    table.add_column("Cost (USD)")
+    table.add_column("Max Cost (USD)")
+    table.add_column("Req/s")
+    table.add_column("Duration")
+    for system in run_plan.systems:
+        table.add_row(
+            system.system_id,
+            str(system.completed),
+            str(system.cached),
+            str(system.to_send),
+            str(system.input_tokens),
+            str(system.output_tokens),
+            f"{system.cost_usd:.4f}" if system.priced else "unpriced",
+            f"{system.max_cost_usd:.4f}" if system.priced else "unpriced",
+            f"{system.requests_per_second:.2f}" if system.requests_per_second else "n/a",
+            _format_duration(system.duration_seconds),
+        )
+    console.print(table)
+    console.print(
+        f"Projected cost [bold]${run_plan.cost_usd:.4f}[/bold] "
+        f"(worst case ${run_plan.max_cost_usd:.4f}, already spent ${run_plan.spent_usd:.4f}, "
+        f"budget ${run_plan.max_usd_per_run:.2f}); "
+        f"duration [bold]{_format_duration(run_plan.duration_seconds)}[/bold]"
+    )
+    if not run_plan.within_budget:
+        console.print(
+            "[yellow]Worst-case cost exceeds the run budget; the run may stop early.[/yellow]"
+        )
+
+
+cache_app = typer.Typer(help="Inspect and bound the shared response cache.")
+app.add_typer(cache_app, name="cache")
+
+
+def _open_cache(
+    policy_path: str, artifacts_root: str, **overrides: object
+) -> SQLiteResponseCache:
+    raw = load_policy_yaml(policy_path) if Path(policy_path).exists() else {}
+    cache_policy = CachePolicy.model_validate(
+        {
+            **(raw.get("cache") or {}),
+            **{key: value for key, value in overrides.items() if value is not None},
+        }
+    )
+    return SQLiteResponseCache(default_cache_path(artifacts_root, cache_policy), cache_policy)
+
+
+@cache_app.command("stats")
+def cache_stats(
+    policy_path: str = typer.Option(
+        "configs/policy.yaml", "--policy", help="Path to policy YAML."
+    ),
+    artifacts_root: str = typer.Option(
+        "artifacts", "--artifacts-root", help="Directory for run artifacts."
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the statistics as JSON."),
+) -> None:
+    """Show size, per-system entries and lifetime hit rate of the response cache."""
+    cache = _open_cache(policy_path, artifacts_root)
+    try:
+        described = cache.describe()
+    finally:
+        cache.close()
+    legacy = legacy_run_caches(artifacts_root)
+    described["legacy_run_caches"] = {
+        "directories": len(legacy),
+        "files": sum(files for _, files, _ in legacy),
+        "bytes": sum(size for _, _, size in legacy),
+    }
+    if as_json:
+        console.print_json(data=described)
+        return
+    table = Table(title=f"Response Cache ({described['path']})")
+    table.add_column("System")
+    table.add_column("Entries")
+    table.add_column("Bytes")
+    for sid, row in described["systems"].items():
+        table.add_row(sid, str(row["entries"]), str(row["bytes"]))
+    console.print(table)
+    lifetime = described["lifetime"]
+    console.print(
+        f"{described['entries']} entries, {described['bytes']} bytes; "
+        f"hit rate [bold]{lifetime['hit_rate']:.1%}[/bold] "
+        f"({lifetime['hits']} hits, {lifetime['memory_hits']} from memory / "
+        f"{lifetime['misses']} misses), "
+        f"{lifetime['bytes_saved']} response bytes served from cache, "
+        f"{lifetime['evictions']} evicted, {lifetime['expired']} expired"
+    )
+    if legacy:
+        console.print(
+            f"[yellow]{len(legacy)} legacy per-run cache directories hold "
+            f"{described['legacy_run_caches']['bytes']} bytes; "
+            "remove them with `llm-eval cache prune --legacy-run-caches`.[/yellow]"
+        )
+
+
+@cache_app.command("prune")
+def cache_prune(
+    policy_path: str = typer.Option(
+        "configs/policy.yaml", "--policy", help="Path to policy YAML."
+    ),
+    artifacts_root: str = typer.Option(
+        "artifacts", "--artifacts-root", help="Directory for run artifacts."
+    ),
+    max_entries: int | None = typer.Option(
+        None, "--max-entries", help="Override cache.max_entries."
+    ),
+    max_bytes: int | None = typer.Option(None, "--max-bytes", help="Override cache.max_bytes."),
+    max_age_days: float | None = typer.Option(
+        None, "--max-age-days", help="Override cache.max_age_days."
+    ),
+    legacy: bool = typer.Option(
+        False, "--legacy-run-caches", help="Also delete artifacts/runs/*/cache directories."
+    ),
+) -> None:
+    """Expire and evict cache entries until the policy limits hold."""
+    cache = _open_cache(
+        policy_path,
+        artifacts_root,
+        max_entries=max_entries,
+        max_bytes=max_bytes,
+        max_age_days=max_age_days,
+    )
+    try:
+        result = cache.prune()
+        remaining = len(cache)
+    finally:
+        cache.close()
+    console.print(
+        f"Expired {result.expired}, evicted {result.evicted}, "
+        f"freed {result.freed_bytes} bytes; {remaining} entries remain."
+    )
+    if legacy:
+        removed = legacy_run_caches(artifacts_root)
+        for cache_dir, _, _ in removed:
+            shutil.rmtree(cache_dir)
+        console.print(
+            f"Removed {len(removed)} legacy per-run cache directories "
+            f"({sum(size for _, _, size in removed)} bytes)."
+        )
+
+
+def _parse_timestamp(value: str | None) -> float | None:
+    if value is None:
+        return None
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError as exc:
+        raise typer.BadParameter(f"Not an ISO date or datetime: {value}") from exc
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+
+@cache_app.command("export")
+def cache_export(
+    out_dir: str = typer.Option("cache-bundles", "--out", "-o", help="Directory for the bundle."),
+    policy_path: str = typer.Option(
+        "configs/policy.yaml", "--policy", help="Path to policy YAML."
+    ),
+    artifacts_root: str = typer.Option(
+        "artifacts", "--artifacts-root", help="Directory for run artifacts."
+    ),
+    providers: list[str] | None = typer.Option(
+        None, "--provider", help="Only this provider (repeatable)."
+    ),
+    models: list[str] | None = typer.Option(
+        None, "--model", help="Only this model (repeatable)."
+    ),
+    since: str | None = typer.Option(
+        None, "--since", help="Only entries written at or after this ISO date (UTC)."
+    ),
+    until: str | None = typer.Option(
+        None, "--until", help="Only entries written before this ISO date (UTC)."
+    ),
+) -> None:
+    """Export cached responses to a compressed, hash-checked bundle."""
+    cache = _open_cache(policy_path, artifacts_root)
+    try:
+        info = export_bundle(
+            cache,
+            out_dir,
+            providers=providers or None,
+            models=models or None,
+            since=_parse_timestamp(since),
+            until=_parse_timestamp(until),
+        )
+    finally:
+        cache.close()
+    console.print(f"Exported {info.entries} entries to [bold]{info.path}[/bold]")
+
+
+@cache_app.command("import")
+def cache_import(
+    bundles: list[str] = typer.Argument(..., help="Bundle files or directories of bundles."),
+    policy_path: str = typer.Option(
+        "configs/policy.yaml", "--policy", help="Path to policy YAML."
+    ),
+    artifacts_root: str = typer.Option(
+        "artifacts", "--artifacts-root", help="Directory for run artifacts."
+    ),
+) -> None:
+    """Verify bundles and merge them into the response cache without duplicates."""
+    paths = [path for bundle in bundles for path in find_bundles(bundle)]
+    cache = _open_cache(policy_path, artifacts_root)
+    try:
+        for path in paths:
+            try:
+                result = import_bundle(cache, path)
+            except BundleError as exc:
+                console.print(f"[red]Rejected[/red] {exc}")
+                raise typer.Exit(code=1) from exc
+            console.print(
+                f"{path}: {result.entries} entries, {result.added} added, "
+                f"{result.updated} updated, {result.skipped} already present or expired"
+            )
+    finally:
+        cache.close()
+
+
+runs_app = typer.Typer(help="List and look up runs through the cross-run registry.")
+app.add_typer(runs_app, name="runs")
+
+
+def _open_registry(artifacts_root: str) -> RunRegistry:
+    path = default_registry_path(artifacts_root)
+    existed = path.exists()
+    registry = RunRegistry(path)
+    if not existed:
+        # Artifacts written before the registry existed are indexed on first use.
+        registry.reindex(artifacts_root)
+    return registry
+
+
+@runs_app.command("list")
+def runs_list(
+    artifacts_root: str = typer.Option(
+        "artifacts", "--artifacts-root", help="Directory for run artifacts."
+    ),
+    name: str | None = typer.Option(None, "--name", help="Substring of the run name."),
+    provider: str | None = typer.Option(None, "--provider", help="Only runs with this provider."),
+    model: str | None = typer.Option(None, "--model", help="Only runs with this model."),
+    status: str | None = typer.Option(None, "--status", help="Only runs with this status."),
+    since: str | None = typer.Option(
+        None, "--since", help="Created at or after this ISO date/time (UTC)."
+    ),
+    until: str | None = typer.Option(None, "--until", help="Created before this ISO date/time."),
+    limit: int = typer.Option(20, "--limit", help="Maximum runs to show (newest first)."),
+    as_json: bool = typer.Option(False, "--json", help="Print the runs as JSON."),
+) -> None:
+    """List runs newest first, filtered by name, system, status or creation time."""
+    runs = _open_registry(artifacts_root).list_runs(
+        name=name,
+        provider=provider,
+        model=model,
+        status=status,
+        since=since,
+        until=until,
+        limit=limit,
+    )
+    if as_json:
+        console.print_json(data=runs)
+        return
+    table = Table(title=f"Runs ({artifacts_root})")
+    for column in ("Run ID", "Name", "Created", "Benchmark", "Status", "Best Acc", "Cost (USD)"):
+        table.add_column(column)
+    for run in runs:
+        best = run["best_accuracy"]
+        table.add_row(
+            run["run_id"],
+            run["run_name"],
+            run["created_at"][:19],
+            run["benchmark"],
+            run["status"],
+            "-" if best is None else f"{best:.2%}",
+            f"{run['total_cost_usd'] or 0.0:.6f}",
+        )
+    console.print(table)
+
+
+@runs_app.command("show")
+def runs_show(
+    run_id: str = typer.Argument(..., help="Run id or a unique prefix of one."),
+    artifacts_root: str = typer.Option(
+        "artifacts", "--artifacts-root", help="Directory for run artifacts."
+    ),
+) -> None:
+    """Show one run's registry entry and per-system headline metrics as JSON."""
+    run = _open_registry(artifacts_root).get(run_id)
+    if run is None:
+        raise typer.BadParameter(f"No single run matches: {run_id}")
+    console.print_json(data=run)
+
+
+@runs_app.command("latest")
+def runs_latest(
+    artifacts_root: str = typer.Option(
+        "artifacts", "--artifacts-root", help="Directory for run artifacts."
+    ),
+    status: str | None = typer.Option(None, "--status", help="Only runs with this status."),
+) -> None:
+    """Print the id of the most recently created run."""
+    runs = _open_registry(artifacts_root).list_runs(status=status, limit=1)
+    if not runs:
+        raise typer.Exit(code=1)
+    typer.echo(runs[0]["run_id"])
+
+
+@runs_app.command("reindex")
+def runs_reindex(
+    artifacts_root: str = typer.Option(
+        "artifacts", "--artifacts-root", help="Directory for run artifacts."
+    ),
+) -> None:
+    """Rebuild the registry from every run's manifest.json and summary.json."""
+    count = RunRegistry(default_registry_path(artifacts_root)).reindex(artifacts_root)
+    console.print(f"Indexed {count} runs into {default_registry_path(artifacts_root)}")
+
+
 @app.command("check-connectivity")
 def check_connectivity_command(
     config_path: str = typer.Option(
@@ -239,16 +604,35 @@ def report(
     run_id: str = typer.Option(..., "--run-id", help="Run id from artifacts/runs/<run_id>."),
     artifacts_root: str = typer.Option("artifacts", "--artifacts-root"),
     reports_root: str = typer.Option("reports", "--reports-root"),
+    bootstrap_resamples: int = typer.Option(
+        0,
+        "--bootstrap-resamples",
+        help="Add paired-bootstrap intervals with this many resamples (0 = off; needs numpy).",
+    ),
+    bootstrap_workers: int = typer.Option(
+        1, "--bootstrap-workers", help="Processes to split bootstrap resamples across."
+    ),
 ) -> None:
     """Generate markdown/html/json reports from run artifacts."""
     run_dir = Path(artifacts_root) / "runs" / run_id
     if not run_dir.exists():
         raise typer.BadParameter(f"Run directory does not exist: {run_dir}")
-    results = load_results(run_dir)
-    summary = load_summary(run_dir)
-    scored = score_results(results, summary)
-    scored = add_confidence_intervals(scored)
-    pairwise = pairwise_significance(results)
+    scored, pairwise = score_run(run_dir)
+    if bootstrap_resamples > 0:
+        manifest_path = run_dir / "manifest.json"
+        manifest = (
+            json.loads(manifest_path.read_text(encoding="utf-8")) if manifest_path.exists() else {}
+        )
+        try:
+            result = paired_bootstrap(
+                load_results(run_dir, columns=BOOTSTRAP_COLUMNS),
+                resamples=bootstrap_resamples,
+                seed=int(manifest.get("seed", 42)),
+                workers=bootstrap_workers,
+            )
+        except RuntimeError as exc:
+            raise typer.BadParameter(str(exc)) from exc
+        scored, pairwise = apply_bootstrap(scored, pairwise, result)
     outputs = write_reports(
         run_id=run_id,
         scored=scored,
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+from array import array
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from llm_eval.storage import atomic_write_text, iter_jsonl
+
+COLUMNS_DIR = "results.columns"
+FORMAT_VERSION = 1
+
+# Column name -> storage kind. "str" columns are dictionary-encoded (int32 codes into a
+# JSON list of values, -1 for missing); numeric columns are raw native-endian arrays;
+# "blob" columns are one concatenated UTF-8 file plus int64 end offsets.
+COLUMN_TYPES: dict[str, str] = {
+    "system_id": "str",
+    "provider": "str",
+    "model": "str",
+    "sample_id": "str",
+    "category": "str",
+    "request_key": "str",
+    "predicted": "str",
+    "expected": "str",
+    "is_correct": "bool",
+    "latency_ms": "int",
+    "input_tokens": "int",
+    "output_tokens": "int",
+    "cost_usd": "float",
+    "from_cache": "bool",
+    "response_text": "blob",
+}
+_TYPECODES = {"bool": "b", "int": "q", "float": "d", "str": "i"}
+
+
+def _system_id(row: dict[str, Any]) -> str:
+    if row.get("system_id"):
+        return str(row["system_id"])
+    return f"{row.get('provider', 'unknown')}:{row.get('model', 'unknown')}"
+
+
+def _column_path(root: Path, name: str, suffix: str = ".bin") -> Path:
+    return root / f"{name}{suffix}"
+
+
+def _source_stamp(results_path: Path) -> list[int]:
+    if not results_path.exists():
+        return [0, 0]
+    stat = results_path.stat()
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def write_columnar(run_dir: str | Path) -> Path:
+    """Rebuild ``results.columns/`` from ``results.jsonl``; returns the directory.
+
+    The new directory is assembled next to the old one and swapped in, so readers see
+    either the previous snapshot or the complete new one.
+    """
+    run_dir = Path(run_dir)
+    results_path = run_dir / "results.jsonl"
+    source = _source_stamp(results_path)
+    values: dict[str, array] = {
+        name: array(_TYPECODES[kind]) for name, kind in COLUMN_TYPES.items() if kind != "blob"
+    }
+    dictionaries: dict[str, dict[str, int]] = {
+        name: {} for name, kind in COLUMN_TYPES.items() if kind == "str"
+    }
+    target = run_dir / COLUMNS_DIR
+    staging = Path(tempfile.mkdtemp(dir=run_dir, prefix=f".{COLUMNS_DIR}."))
+    try:
+        offsets = array("q")
+        rows = 0
+        with _column_path(staging, "response_text").open("wb") as blob:
+            for row in iter_jsonl(results_path):
+                rows += 1
+                for name, kind in COLUMN_TYPES.items():
+                    raw = _system_id(row) if name == "system_id" else row.get(name)
+                    if kind == "str":
+                        if raw is None:
+                            values[name].append(-1)
+                        else:
+                            codes = dictionaries[name]
+                            values[name].append(codes.setdefault(str(raw), len(codes)))
+                    elif kind == "bool":
+                        values[name].append(int(bool(raw)))
+                    elif kind == "int":
+                        values[name].append(int(raw or 0))
+                    elif kind == "float":
+                        values[name].append(float(raw or 0.0))
+                    else:
+                        blob.write(str(raw or "").encode("utf-8"))
+                        offsets.append(blob.tell())
+        _column_path(staging, "response_text", ".offsets").write_bytes(offsets.tobytes())
+        for name, column in values.items():
+            _column_path(staging, name).write_bytes(column.tobytes())
+        for name, codes in dictionaries.items():
+            atomic_write_text(_column_path(staging, name, ".dict.json"), json.dumps(list(codes)))
+        atomic_write_text(
+            staging / "meta.json",
+            json.dumps(
+                {
+                    "version": FORMAT_VERSION,
+                    "rows": rows,
+                    "source": source,
+                    "byteorder": sys.byteorder,
+                    "columns": COLUMN_TYPES,
+                },
+                indent=2,
+            ),
+        )
+        retired = None
+        if target.exists():
+            retired = run_dir / f".{COLUMNS_DIR}.old"
+            shutil.rmtree(retired, ignore_errors=True)
+            os.replace(target, retired)
+        os.replace(staging, target)
+        if retired is not None:
+            shutil.rmtree(retired, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    return target
+
+
+def _load_meta(run_dir: Path) -> dict[str, Any] | None:
+    meta_path = run_dir / COLUMNS_DIR / "meta.json"
+    if not meta_path.exists():
+        return None
+    try:
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    except ValueError:
+        return None
+    return meta if meta.get("version") == FORMAT_VERSION else None
+
+
+def columnar_is_fresh(run_dir: str | Path) -> bool:
+    """True when the columns were built from results.jsonl exactly as it is now."""
+    run_dir = Path(run_dir)
+    meta = _load_meta(run_dir)
+    return meta is not None and meta.get("source") == _source_stamp(run_dir / "results.jsonl")
+
+
+def _read_array(path: Path, typecode: str, byteorder: str) -> array:
+    column = array(typecode)
+    column.frombytes(path.read_bytes())
+    if byteorder != sys.byteorder:
+        column.byteswap()
+    return column
+
+
+def read_columns(
+    run_dir: str | Path, columns: Iterable[str] | None = None
+) -> dict[str, list[Any]]:
+    """Typed column lists, reading only the files behind ``columns`` (default: all).
+
+    Missing strings come back as None. Raises ``FileNotFoundError`` when no columnar
+    snapshot exists; check ``columnar_is_fresh`` first to avoid reading a stale one.
+    """
+    root = Path(run_dir) / COLUMNS_DIR
+    meta = _load_meta(Path(run_dir))
+    if meta is None:
+        raise FileNotFoundError(f"No columnar results under {root}")
+    byteorder = str(meta["byteorder"])
+    selected = list(COLUMN_TYPES) if columns is None else list(columns)
+    out: dict[str, list[Any]] = {}
+    for name in selected:
+        kind = COLUMN_TYPES.get(name)
+        if kind is None:
+            raise KeyError(f"Unknown results column: {name}")
+        if kind == "blob":
+            ends = _read_array(_column_path(root, name, ".offsets"), "q", byteorder)
+            data = _column_path(root, name).read_bytes()
+            starts = [0, *ends[:-1]]
+            out[name] = [data[a:b].decode("utf-8") for a, b in zip(starts, ends)]
+            continue
+        column = _read_array(_column_path(root, name), _TYPECODES[kind], byteorder)
+        if kind == "str":
+            labels = json.loads(_column_path(root, name, ".dict.json").read_text("utf-8"))
+            out[name] = [labels[code] if code >= 0 else None for code in column]
+        elif kind == "bool":
+            out[name] = [bool(value) for value in column]
+        else:
+            out[name] = column.tolist()
+    return out
+
+
+def load_rows(run_dir: str | Path, columns: Iterable[str] | None = None) -> list[dict[str, Any]]:
+    """Result rows from a fresh columnar snapshot, rebuilding it from results.jsonl if stale.
+
+    Rows hold only the projected ``columns``, so callers that do not need
+    ``response_text`` never read it. A string field the JSONL row did not have is left
+    out rather than set to None, so ``row.get(name, default)`` reads the same either way.
+    """
+    run_dir = Path(run_dir)
+    if not (run_dir / "results.jsonl").exists():
+        return []
+    if not columnar_is_fresh(run_dir):
+        try:
+            write_columnar(run_dir)
+        except OSError:
+            # Read-only run directory: project straight from the JSONL instead.
+            names = list(COLUMN_TYPES) if columns is None else list(columns)
+            return [
+                {
+                    name: _system_id(row) if name == "system_id" else row.get(name)
+                    for name in names
+                    if name == "system_id" or row.get(name) is not None
+                }
+                for row in iter_jsonl(run_dir / "results.jsonl")
+            ]
+    data = read_columns(run_dir, columns)
+    names = list(data)
+    return [
+        {name: value for name, value in zip(names, values) if value is not None}
+        for values in zip(*data.values())
+    ]
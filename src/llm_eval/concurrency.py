@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Literal
+
+from llm_eval.config import AdaptiveConcurrencyPolicy
+
+AttemptSignal = Literal["ok", "error", "throttled", "overloaded"]
+
+
+def _percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class AdaptiveConcurrencyLimit:
+    """AIMD in-flight limit for one system, bounded by ``ceiling``.
+
+    With ``policy.enabled`` off the limit is pinned at ``ceiling`` and feedback is ignored.
+
+    Healthy completions grow the limit by ``additive_increase`` per window of ``limit``
+    completions (TCP congestion-avoidance style). A 429/5xx, or a window p95 latency above
+    ``latency_spike_factor`` times the best p50 seen so far, multiplies the limit by
+    ``decrease_factor``; further decreases wait until ``limit`` more attempts have finished
+    so one burst of failures from the same in-flight wave only counts once.
+    """
+
+    def __init__(self, ceiling: int, policy: AdaptiveConcurrencyPolicy):
+        self.ceiling = max(1, ceiling)
+        self.policy = policy
+        initial = policy.initial_limit if policy.enabled else self.ceiling
+        self.limit = float(min(self.ceiling, max(1, initial)))
+        self.in_flight = 0
+        self.min_limit = self.limit
+        self.max_limit = self.limit
+        self.increases = 0
+        self.decreases = 0
+        self._latencies: deque[float] = deque(maxlen=policy.latency_window_requests)
+        self._failures: deque[bool] = deque(maxlen=policy.latency_window_requests)
+        self._baseline_p50_ms: float | None = None
+        self._since_decrease = self.current
+
+    @property
+    def current(self) -> int:
+        return max(1, int(self.limit))
+
+    def try_acquire(self) -> bool:
+        if self.in_flight >= self.current:
+            return False
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        self.in_flight = max(0, self.in_flight - 1)
+
+    def _latency_spiking(self) -> bool:
+        if len(self._latencies) < self.policy.latency_window_requests:
+            return False
+        window = list(self._latencies)
+        p50 = _percentile(window, 0.5)
+        if self._baseline_p50_ms is None or p50 < self._baseline_p50_ms:
+            self._baseline_p50_ms = p50
+        return _percentile(window, 0.95) > self.policy.latency_spike_factor * self._baseline_p50_ms
+
+    def _decrease(self) -> None:
+        if self._since_decrease < self.current:
+            return
+        self.limit = max(1.0, self.limit * self.policy.decrease_factor)
+        self.decreases += 1
+        self._since_decrease = 0
+        self.min_limit = min(self.min_limit, self.limit)
+
+    def record(self, latency_ms: float, signal: AttemptSignal) -> None:
+        """Feed one finished provider attempt into the controller."""
+        if not self.policy.enabled:
+            return
+        self._since_decrease += 1
+        self._failures.append(signal != "ok")
+        if signal in ("throttled", "overloaded"):
+            self._decrease()
+            return
+        if signal != "ok":
+            return
+        self._latencies.append(float(latency_ms))
+        if self._latency_spiking():
+            self._decrease()
+            return
+        error_rate_percent = 100.0 * sum(self._failures) / len(self._failures)
+        if error_rate_percent > self.policy.healthy_error_rate_percent:
+            return
+        if self.limit < self.ceiling:
+            step = self.policy.additive_increase / self.limit
+            self.limit = min(float(self.ceiling), self.limit + step)
+            self.increases += 1
+            self.max_limit = max(self.max_limit, self.limit)
+
+    def snapshot(self) -> dict[str, float | int]:
+        return {
+            "limit": self.current,
+            "ceiling": self.ceiling,
+            "min_limit": max(1, int(self.min_limit)),
+            "max_limit": max(1, int(self.max_limit)),
+            "increases": self.increases,
+            "decreases": self.decreases,
+        }
+
+
+def classify_status(status_code: int | None) -> AttemptSignal:
+    if status_code == 429:
+        return "throttled"
+    if status_code is not None and status_code >= 500:
+        return "overloaded"
+    return "error"
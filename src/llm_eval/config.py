@@ -17,20 +17,90 @@ class RetryPolicy(BaseModel):
     retryable_status_codes: list[int] = Field(
         default_factory=lambda: [408, 429, 500, 502, 503, 504]
     )
+    jitter_ratio: float = 0.5
+    max_delay_seconds: float = 60.0
+
+
+class AdaptiveConcurrencyPolicy(BaseModel):
+    enabled: bool = True
+    initial_limit: int = 1
+    additive_increase: float = 1.0
+    decrease_factor: float = 0.5
+    latency_spike_factor: float = 3.0
+    latency_window_requests: int = 20
+    healthy_error_rate_percent: float = 5.0
+
+
+class HttpTransportPolicy(BaseModel):
+    max_connections: int = 20
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 30.0
+    connect_timeout_seconds: float = 10.0
+    http2: bool = False
+    warm_up_connections: bool = True
 
 
 class ReliabilityPolicy(BaseModel):
     max_parallel_requests: int = 3
+    execution_mode: Literal["serial", "parallel", "async"] = "parallel"
+    scheduling: Literal["provider_major", "round_robin", "weighted"] = "provider_major"
     request_timeout_seconds: int = 45
+    http: HttpTransportPolicy = Field(default_factory=HttpTransportPolicy)
     retry: RetryPolicy = Field(default_factory=RetryPolicy)
+    adaptive_concurrency: AdaptiveConcurrencyPolicy = Field(
+        default_factory=AdaptiveConcurrencyPolicy
+    )
     provider_error_rate_window_size_requests: int = 50
     provider_error_rate_hard_stop_percent: int = 10
+    provider_error_rate_cooldown_seconds: float = 30.0
+    provider_error_rate_probe_requests: int = 3
+    provider_error_rate_max_open_cycles: int = 3
+
+
+class TokenPrice(BaseModel):
+    input_per_million: float
+    output_per_million: float
 
 
 class BudgetPolicy(BaseModel):
     max_usd_per_run: float = 5.0
     warn_at_percent: int = 80
     enforce_hard_stop: bool = True
+    pricing: dict[str, TokenPrice] = Field(default_factory=dict)
+
+
+class RateLimit(BaseModel):
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
+
+
+class RateLimitPolicy(BaseModel):
+    throttle_factor: float = 0.5
+    min_fraction: float = 0.1
+    recovery_per_success: float = 0.02
+    limits: dict[str, RateLimit] = Field(default_factory=dict)
+
+
+class CachePolicy(BaseModel):
+    enabled: bool = True
+    # Shared SQLite store; defaults to <artifacts_root>/cache/responses.sqlite3.
+    path: str | None = None
+    max_entries: int | None = None
+    max_bytes: int | None = None
+    max_age_days: float | None = None
+    # Which entries go first when over capacity: least recently used, or oldest written.
+    eviction: Literal["lru", "ttl"] = "lru"
+    # In-process LRU tier in front of the store, shared by every run in this process; 0 = off.
+    memory_max_bytes: int = 64_000_000
+
+
+class ArtifactPolicy(BaseModel):
+    # per_record: write and fsync every row; batched: buffer, flush and fsync every
+    # flush_max_records rows or flush_interval_seconds; on_close: buffer and flush on the
+    # same thresholds, fsync only when the run closes its artifacts.
+    durability: Literal["per_record", "batched", "on_close"] = "batched"
+    flush_max_records: int = 256
+    flush_interval_seconds: float = 1.0
 
 
 class SecurityPolicy(BaseModel):
@@ -45,6 +115,9 @@ class SecurityPolicy(BaseModel):
 class RuntimePolicy(BaseModel):
     budget: BudgetPolicy = Field(default_factory=BudgetPolicy)
     reliability: ReliabilityPolicy = Field(default_factory=ReliabilityPolicy)
+    rate_limits: RateLimitPolicy = Field(default_factory=RateLimitPolicy)
+    cache: CachePolicy = Field(default_factory=CachePolicy)
+    artifacts: ArtifactPolicy = Field(default_factory=ArtifactPolicy)
     security: SecurityPolicy = Field(default_factory=SecurityPolicy)
 
 
@@ -54,6 +127,8 @@ class ProviderConfig(BaseModel):
     api_key_env: str | None = None
     temperature: float = 0.0
     max_tokens: int = 512
+    requests_per_minute: int | None = None
+    tokens_per_minute: int | None = None
 
     @field_validator("temperature")
     @classmethod
@@ -78,6 +153,10 @@ class RunConfig(BaseModel):
     policy: RuntimePolicy = Field(default_factory=RuntimePolicy)
 
 
+# Throughput knobs that do not change model outputs stay out of the run fingerprint.
+_RUNTIME_ONLY_PROVIDER_FIELDS = {"requests_per_minute", "tokens_per_minute"}
+
+
 class RunManifest(BaseModel):
     run_id: str
     run_name: str
@@ -113,7 +192,9 @@ def build_run_manifest(config: RunConfig) -> RunManifest:
         "run_name": config.run_name,
         "seed": config.seed,
         "benchmark": config.benchmark.model_dump(),
-        "providers": [p.model_dump() for p in config.providers],
+        "providers": [
+            p.model_dump(exclude=_RUNTIME_ONLY_PROVIDER_FIELDS) for p in config.providers
+        ],
     }
     run_id = hashlib.sha256(json.dumps(fingerprint_payload, sort_keys=True).encode("utf-8")).hexdigest()[
         :16
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from urllib import error, request
 
 from llm_eval.config import RunConfig, load_env_file
-from llm_eval.providers import InferenceRequest, build_provider_client
+from llm_eval.providers import InferenceRequest, acquire_provider_client, build_provider_client
 
 SECRET_PATTERNS = [
     re.compile(r"sk-[A-Za-z0-9_\-]{8,}"),
@@ -52,9 +52,10 @@ def check_connectivity(config: RunConfig, env_path: str = ".env") -> list[Connec
     results: list[ConnectivityResult] = []
     for provider_cfg in config.providers:
         try:
-            client = build_provider_client(
-                provider_config=provider_cfg,
-                timeout_seconds=config.policy.reliability.request_timeout_seconds,
+            client = acquire_provider_client(
+                provider_cfg,
+                config.policy.reliability.request_timeout_seconds,
+                build_provider_client,
             )
             response = client.generate(
                 InferenceRequest(
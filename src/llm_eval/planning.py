@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from llm_eval.benchmarks.mmlu_subset import MMLUSubsetDataset
+from llm_eval.cache import SQLiteResponseCache, default_cache_path, prompt_sha256
+from llm_eval.config import RunConfig, build_run_manifest
+from llm_eval.policy import merge_policy
+from llm_eval.pricing import TokenUsage, cost_usd, resolve_price
+from llm_eval.ratelimit import RateLimiterRegistry, estimate_tokens
+from llm_eval.runner import request_key_for, system_id
+from llm_eval.storage import iter_jsonl
+
+# Latency history comes from this many most recently written runs, so a plan's cost
+# does not grow with the number of runs kept under the artifacts root.
+HISTORY_RUNS = 20
+
+
+@dataclass
+class LatencyHistory:
+    """Observed (non-cached) request latency and output size for one system."""
+
+    requests: int = 0
+    total_latency_ms: float = 0.0
+    total_output_tokens: int = 0
+
+    @property
+    def mean_latency_ms(self) -> float | None:
+        return self.total_latency_ms / self.requests if self.requests else None
+
+    @property
+    def mean_output_tokens(self) -> float | None:
+        return self.total_output_tokens / self.requests if self.requests else None
+
+
+@dataclass
+class SystemPlan:
+    system_id: str
+    total_requests: int
+    completed: int
+    cached: int
+    to_send: int
+    input_tokens: int
+    output_tokens: int
+    max_output_tokens: int
+    cost_usd: float
+    max_cost_usd: float
+    priced: bool
+    mean_latency_ms: float | None
+    requests_per_second: float | None
+    duration_seconds: float | None
+
+
+@dataclass
+class RunPlan:
+    run_id: str
+    execution_mode: str
+    systems: list[SystemPlan] = field(default_factory=list)
+    duration_seconds: float | None = None
+    spent_usd: float = 0.0
+    max_usd_per_run: float = 0.0
+
+    @property
+    def cost_usd(self) -> float:
+        return sum(plan.cost_usd for plan in self.systems)
+
+    @property
+    def max_cost_usd(self) -> float:
+        return sum(plan.max_cost_usd for plan in self.systems)
+
+    @property
+    def within_budget(self) -> bool:
+        return self.spent_usd + self.max_cost_usd <= self.max_usd_per_run
+
+
+def load_latency_history(
+    artifacts_root: str | Path, max_runs: int = HISTORY_RUNS
+) -> dict[str, LatencyHistory]:
+    """Aggregate provider-served rows from the ``max_runs`` newest runs' results.jsonl."""
+    history: dict[str, LatencyHistory] = {}
+    runs = (Path(artifacts_root) / "runs").glob("*/results.jsonl")
+    newest = sorted(runs, key=lambda path: path.stat().st_mtime, reverse=True)[:max_runs]
+    for results_path in newest:
+        for row in iter_jsonl(results_path):
+            latency = float(row.get("latency_ms") or 0)
+            if row.get("from_cache") or latency <= 0:
+                continue
+            sid = row.get("system_id") or system_id(
+                str(row.get("provider", "unknown")), str(row.get("model", "unknown"))
+            )
+            entry = history.setdefault(str(sid), LatencyHistory())
+            entry.requests += 1
+            entry.total_latency_ms += latency
+            entry.total_output_tokens += int(row.get("output_tokens") or 0)
+    return history
+
+
+def _load_run_state(run_dir: Path) -> tuple[set[str], float]:
+    """Completed request keys and billed spend, without creating dirs."""
+    completed: set[str] = set()
+    spent = 0.0
+    for row in iter_jsonl(run_dir / "results.jsonl"):
+        if row.get("request_key"):
+            completed.add(str(row["request_key"]))
+        if not row.get("from_cache"):
+            spent += float(row.get("cost_usd") or 0.0)
+    return completed, spent
+
+
+def plan_run(
+    config: RunConfig,
+    policy_path: str = "configs/policy.yaml",
+    artifacts_root: str = "artifacts",
+) -> RunPlan:
+    """Project what ``run_evaluation`` would send, cost and take, without network access.
+
+    Work already in results.jsonl or the response cache is excluded; the cache is opened
+    read-only, so planning writes nothing. Prompt tokens use the same ~4 chars/token
+    approximation as the rate limiter; output tokens use each system's mean over the
+    ``HISTORY_RUNS`` newest runs (``max_tokens`` when there is none), with ``max_cost_usd`` as the
+    worst case at ``max_tokens`` per request. Throughput per system is the lowest of the
+    steady-state concurrency over historical mean latency, the RPM limit and the TPM limit.
+    """
+    config.policy = merge_policy(config, policy_path=policy_path)
+    manifest = build_run_manifest(config)
+    if config.benchmark.name != "mmlu_subset":
+        raise NotImplementedError("Current runner supports mmlu_subset only.")
+    dataset = MMLUSubsetDataset(
+        config.benchmark.dataset_path,
+        max_samples=config.benchmark.max_samples,
+    )
+    samples = list(dataset.load())
+    prompts = [(sample.sample_id, sample.prompt()) for sample in samples]
+    prompt_tokens = [estimate_tokens(prompt) for _, prompt in prompts]
+
+    completed, spent = _load_run_state(Path(artifacts_root) / "runs" / manifest.run_id)
+    cache_path = default_cache_path(artifacts_root, config.policy.cache)
+    cache = (
+        SQLiteResponseCache(cache_path, config.policy.cache, read_only=True)
+        if config.policy.cache.enabled and cache_path.exists()
+        else None
+    )
+    history = load_latency_history(artifacts_root)
+    reliability = config.policy.reliability
+    limiters = RateLimiterRegistry(config.policy.rate_limits)
+    # Steady-state slots per system: serial runs one request at a time overall; adaptive
+    # lanes each grow to the ceiling; otherwise the systems share one global cap.
+    if reliability.execution_mode == "serial":
+        concurrency = 1.0
+    elif reliability.adaptive_concurrency.enabled:
+        concurrency = float(max(1, reliability.max_parallel_requests))
+    else:
+        concurrency = max(1, reliability.max_parallel_requests) / max(1, len(config.providers))
+
+    plan = RunPlan(
+        run_id=manifest.run_id,
+        execution_mode=reliability.execution_mode,
+        spent_usd=spent,
+        max_usd_per_run=config.policy.budget.max_usd_per_run,
+    )
+    # Each prompt is encoded and hashed once, then reused for every system's keys.
+    encoded = [(json.dumps(sample_id), json.dumps(prompt)) for sample_id, prompt in prompts]
+    prompt_hashes = (
+        [prompt_sha256(prompt) for _, prompt in prompts] if cache is not None else []
+    )
+    for provider_cfg in config.providers:
+        sid = system_id(provider_cfg.provider, provider_cfg.model)
+        key_for = request_key_for(
+            provider=provider_cfg.provider,
+            model=provider_cfg.model,
+            temperature=provider_cfg.temperature,
+            max_tokens=provider_cfg.max_tokens,
+        )
+        cached = (
+            cache.cached_prompts(
+                provider=provider_cfg.provider,
+                model=provider_cfg.model,
+                temperature=provider_cfg.temperature,
+                max_tokens=provider_cfg.max_tokens,
+            )
+            if cache is not None
+            else set()
+        )
+        done = hits = to_send = input_tokens = 0
+        for index, (sample_json, prompt_json) in enumerate(encoded):
+            if key_for(sample_json, prompt_json) in completed:
+                done += 1
+            elif cached and prompt_hashes[index] in cached:
+                hits += 1
+            else:
+                to_send += 1
+                input_tokens += prompt_tokens[index]
+
+        past = history.get(sid, LatencyHistory())
+        mean_output = past.mean_output_tokens
+        per_request_output = (
+            min(provider_cfg.max_tokens, mean_output) if mean_output else provider_cfg.max_tokens
+        )
+        output_tokens = round(per_request_output * to_send)
+        max_output_tokens = provider_cfg.max_tokens * to_send
+        price = resolve_price(
+            provider_cfg.provider, provider_cfg.model, config.policy.budget.pricing
+        )
+
+        rates: list[float] = []
+        if past.mean_latency_ms:
+            rates.append(concurrency * 1000.0 / past.mean_latency_ms)
+        limiter = limiters.limiter_for(provider_cfg)
+        if limiter.configured_rpm:
+            rates.append(limiter.configured_rpm / 60.0)
+        if limiter.configured_tpm and to_send:
+            tokens_per_request = (input_tokens + output_tokens) / to_send
+            rates.append(limiter.configured_tpm / 60.0 / max(1.0, tokens_per_request))
+        rate = min(rates) if rates else None
+
+        plan.systems.append(
+            SystemPlan(
+                system_id=sid,
+                total_requests=len(prompts),
+                completed=done,
+                cached=hits,
+                to_send=to_send,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                max_output_tokens=max_output_tokens,
+                cost_usd=cost_usd(price, TokenUsage(input_tokens, output_tokens)),
+                max_cost_usd=cost_usd(price, TokenUsage(input_tokens, max_output_tokens)),
+                priced=price is not None,
+                mean_latency_ms=past.mean_latency_ms,
+                requests_per_second=rate,
+                duration_seconds=(to_send / rate) if rate else (0.0 if not to_send else None),
+            )
+        )
+
+    if cache is not None:
+        cache.close()
+    durations = [system.duration_seconds for system in plan.systems]
+    if all(duration is not None for duration in durations):
+        known = [duration for duration in durations if duration is not None]
+        if reliability.execution_mode == "serial":
+            plan.duration_seconds = sum(known)
+        else:
+            plan.duration_seconds = max(known, default=0.0)
+    return plan
+
+
+def plan_to_dict(plan: RunPlan) -> dict[str, Any]:
+    return {
+        "run_id": plan.run_id,
+        "execution_mode": plan.execution_mode,
+        "duration_seconds": plan.duration_seconds,
+        "cost_usd": plan.cost_usd,
+        "max_cost_usd": plan.max_cost_usd,
+        "spent_usd": plan.spent_usd,
+        "max_usd_per_run": plan.max_usd_per_run,
+        "within_budget": plan.within_budget,
+        "systems": [system.__dict__ for system in plan.systems],
+    }
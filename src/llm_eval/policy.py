@@ -4,7 +4,21 @@ from pathlib import Path
 
 import yaml
 
-from llm_eval.config import BudgetPolicy, ReliabilityPolicy, RunConfig, RuntimePolicy, SecurityPolicy
+from llm_eval.config import (
+    AdaptiveConcurrencyPolicy,
+    ArtifactPolicy,
+    BudgetPolicy,
+    CachePolicy,
+    HttpTransportPolicy,
+    RateLimit,
+    RateLimitPolicy,
+    ReliabilityPolicy,
+    RetryPolicy,
+    RunConfig,
+    RuntimePolicy,
+    SecurityPolicy,
+    TokenPrice,
+)
 
 
 def load_policy_yaml(path: str | Path) -> dict:
@@ -19,6 +33,7 @@ def merge_policy(run_config: RunConfig, policy_path: str | Path = "configs/polic
     budget_raw = raw.get("budget", {})
     reliability_raw = raw.get("reliability", {})
     security_raw = raw.get("security", {})
+    rate_limits_raw = raw.get("rate_limits", {})
 
     provider_error = reliability_raw.get("provider_error_rate", {})
 
@@ -28,6 +43,13 @@ def merge_policy(run_config: RunConfig, policy_path: str | Path = "configs/polic
         enforce_hard_stop=bool(
             budget_raw.get("enforce_hard_stop", run_config.policy.budget.enforce_hard_stop)
         ),
+        pricing={
+            **run_config.policy.budget.pricing,
+            **{
+                str(key): TokenPrice.model_validate(value)
+                for key, value in (budget_raw.get("pricing") or {}).items()
+            },
+        },
     )
     merged_reliability = ReliabilityPolicy(
         max_parallel_requests=int(
@@ -35,12 +57,30 @@ def merge_policy(run_config: RunConfig, policy_path: str | Path = "configs/polic
                 "max_parallel_requests", run_config.policy.reliability.max_parallel_requests
             )
         ),
+        execution_mode=reliability_raw.get(
+            "execution_mode", run_config.policy.reliability.execution_mode
+        ),
+        scheduling=reliability_raw.get("scheduling", run_config.policy.reliability.scheduling),
         request_timeout_seconds=int(
             reliability_raw.get(
                 "request_timeout_seconds", run_config.policy.reliability.request_timeout_seconds
             )
         ),
-        retry=run_config.policy.reliability.retry,
+        retry=RetryPolicy.model_validate(
+            {
+                **run_config.policy.reliability.retry.model_dump(),
+                **(reliability_raw.get("retry") or {}),
+            }
+        ),
+        http=HttpTransportPolicy.model_validate(
+            {**run_config.policy.reliability.http.model_dump(), **(reliability_raw.get("http") or {})}
+        ),
+        adaptive_concurrency=AdaptiveConcurrencyPolicy.model_validate(
+            {
+                **run_config.policy.reliability.adaptive_concurrency.model_dump(),
+                **(reliability_raw.get("adaptive_concurrency") or {}),
+            }
+        ),
         provider_error_rate_window_size_requests=int(
             provider_error.get(
                 "window_size_requests",
@@ -52,6 +92,46 @@ def merge_policy(run_config: RunConfig, policy_path: str | Path = "configs/polic
                 "hard_stop_percent", run_config.policy.reliability.provider_error_rate_hard_stop_percent
             )
         ),
+        provider_error_rate_cooldown_seconds=float(
+            provider_error.get(
+                "cooldown_seconds",
+                run_config.policy.reliability.provider_error_rate_cooldown_seconds,
+            )
+        ),
+        provider_error_rate_probe_requests=int(
+            provider_error.get(
+                "probe_requests", run_config.policy.reliability.provider_error_rate_probe_requests
+            )
+        ),
+        provider_error_rate_max_open_cycles=int(
+            provider_error.get(
+                "max_open_cycles",
+                run_config.policy.reliability.provider_error_rate_max_open_cycles,
+            )
+        ),
+    )
+    base_rate_limits = run_config.policy.rate_limits
+    merged_rate_limits = RateLimitPolicy(
+        throttle_factor=float(
+            rate_limits_raw.get("throttle_factor", base_rate_limits.throttle_factor)
+        ),
+        min_fraction=float(rate_limits_raw.get("min_fraction", base_rate_limits.min_fraction)),
+        recovery_per_success=float(
+            rate_limits_raw.get("recovery_per_success", base_rate_limits.recovery_per_success)
+        ),
+        limits={
+            **base_rate_limits.limits,
+            **{
+                str(key): RateLimit.model_validate(value or {})
+                for key, value in (rate_limits_raw.get("limits") or {}).items()
+            },
+        },
+    )
+    merged_cache = CachePolicy.model_validate(
+        {**run_config.policy.cache.model_dump(), **(raw.get("cache") or {})}
+    )
+    merged_artifacts = ArtifactPolicy.model_validate(
+        {**run_config.policy.artifacts.model_dump(), **(raw.get("artifacts") or {})}
     )
     merged_security = SecurityPolicy(
         byok_only=bool(security_raw.get("byok_only", run_config.policy.security.byok_only)),
@@ -67,4 +147,11 @@ def merge_policy(run_config: RunConfig, policy_path: str | Path = "configs/polic
             )
         ),
     )
-    return RuntimePolicy(budget=merged_budget, reliability=merged_reliability, security=merged_security)
+    return RuntimePolicy(
+        budget=merged_budget,
+        reliability=merged_reliability,
+        rate_limits=merged_rate_limits,
+        cache=merged_cache,
+        artifacts=merged_artifacts,
+        security=merged_security,
+    )
@@ -0,0 +1,160 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from llm_eval.config import BudgetPolicy, TokenPrice
+
+logger = logging.getLogger(__name__)
+
+# USD per million tokens (input, output) from each provider's public price list.
+# Keys are model-name prefixes; the longest matching prefix wins so dated snapshots
+# such as ``claude-3-5-haiku-20241022`` resolve to their family price.
+DEFAULT_PRICES: dict[str, dict[str, TokenPrice]] = {
+    "anthropic": {
+        "claude-3-haiku": TokenPrice(input_per_million=0.25, output_per_million=1.25),
+        "claude-3-5-haiku": TokenPrice(input_per_million=0.80, output_per_million=4.00),
+        "claude-3-5-sonnet": TokenPrice(input_per_million=3.00, output_per_million=15.00),
+        "claude-3-7-sonnet": TokenPrice(input_per_million=3.00, output_per_million=15.00),
+        "claude-sonnet-4": TokenPrice(input_per_million=3.00, output_per_million=15.00),
+        "claude-3-opus": TokenPrice(input_per_million=15.00, output_per_million=75.00),
+        "claude-opus-4": TokenPrice(input_per_million=15.00, output_per_million=75.00),
+    },
+    "openai": {
+        "gpt-4o": TokenPrice(input_per_million=2.50, output_per_million=10.00),
+        "gpt-4o-mini": TokenPrice(input_per_million=0.15, output_per_million=0.60),
+        "gpt-4.1": TokenPrice(input_per_million=2.00, output_per_million=8.00),
+        "gpt-4.1-mini": TokenPrice(input_per_million=0.40, output_per_million=1.60),
+        "gpt-4.1-nano": TokenPrice(input_per_million=0.10, output_per_million=0.40),
+        "o3-mini": TokenPrice(input_per_million=1.10, output_per_million=4.40),
+    },
+    "gemini": {
+        "gemini-1.5-flash": TokenPrice(input_per_million=0.075, output_per_million=0.30),
+        "gemini-1.5-pro": TokenPrice(input_per_million=1.25, output_per_million=5.00),
+        "gemini-2.0-flash": TokenPrice(input_per_million=0.10, output_per_million=0.40),
+        "gemini-2.0-flash-lite": TokenPrice(input_per_million=0.075, output_per_million=0.30),
+        "gemini-2.5-flash": TokenPrice(input_per_million=0.30, output_per_million=2.50),
+        "gemini-2.5-pro": TokenPrice(input_per_million=1.25, output_per_million=10.00),
+    },
+    "groq": {
+        "qwen/qwen3-32b": TokenPrice(input_per_million=0.29, output_per_million=0.59),
+        "moonshotai/kimi-k2-instruct": TokenPrice(input_per_million=1.00, output_per_million=3.00),
+        "openai/gpt-oss-120b": TokenPrice(input_per_million=0.15, output_per_million=0.75),
+        "openai/gpt-oss-20b": TokenPrice(input_per_million=0.10, output_per_million=0.50),
+        "llama-3.3-70b-versatile": TokenPrice(input_per_million=0.59, output_per_million=0.79),
+        "llama-3.1-8b-instant": TokenPrice(input_per_million=0.05, output_per_million=0.08),
+    },
+}
+
+
+@dataclass(frozen=True)
+class TokenUsage:
+    input_tokens: int = 0
+    output_tokens: int = 0
+
+
+def _int(usage: dict[str, Any], *keys: str) -> int:
+    return sum(int(usage.get(key) or 0) for key in keys)
+
+
+def normalize_usage(provider: str, usage: dict[str, Any] | None) -> TokenUsage:
+    """Map each provider's usage payload onto input/output token counts."""
+    if not usage:
+        return TokenUsage()
+    if provider == "anthropic":
+        return TokenUsage(
+            input_tokens=_int(
+                usage, "input_tokens", "cache_creation_input_tokens", "cache_read_input_tokens"
+            ),
+            output_tokens=_int(usage, "output_tokens"),
+        )
+    if provider == "gemini":
+        return TokenUsage(
+            input_tokens=_int(usage, "promptTokenCount"),
+            output_tokens=_int(usage, "candidatesTokenCount", "thoughtsTokenCount"),
+        )
+    if provider in ("openai", "groq"):
+        return TokenUsage(
+            input_tokens=_int(usage, "prompt_tokens"),
+            output_tokens=_int(usage, "completion_tokens"),
+        )
+    return TokenUsage(
+        input_tokens=_int(usage, "input_tokens", "prompt_tokens", "promptTokenCount"),
+        output_tokens=_int(usage, "output_tokens", "completion_tokens", "candidatesTokenCount"),
+    )
+
+
+def resolve_price(
+    provider: str, model: str, overrides: dict[str, TokenPrice] | None = None
+) -> TokenPrice | None:
+    """Price for ``provider:model``; policy overrides win over the built-in table."""
+    overrides = overrides or {}
+    if f"{provider}:{model}" in overrides:
+        return overrides[f"{provider}:{model}"]
+    table = DEFAULT_PRICES.get(provider, {})
+    matches = [prefix for prefix in table if model.startswith(prefix)]
+    if not matches:
+        return None
+    return table[max(matches, key=len)]
+
+
+def cost_usd(price: TokenPrice | None, usage: TokenUsage) -> float:
+    if price is None:
+        return 0.0
+    return (
+        usage.input_tokens * price.input_per_million
+        + usage.output_tokens * price.output_per_million
+    ) / 1_000_000
+
+
+class CostMeter:
+    """Live spend against ``BudgetPolicy.max_usd_per_run``.
+
+    Each dispatched request reserves its worst-case cost (estimated prompt tokens plus
+    the full ``max_tokens`` completion) and settles to the actual cost when it returns,
+    so with ``enforce_hard_stop`` the run stops dispatching before it can overspend.
+    """
+
+    def __init__(self, budget: BudgetPolicy, spent_usd: float = 0.0):
+        self.budget = budget
+        self.spent_usd = spent_usd
+        self.reserved_usd = 0.0
+        self.warned = False
+        self.stopped = False
+        self._check_warning()
+
+    def _check_warning(self) -> None:
+        threshold = self.budget.max_usd_per_run * self.budget.warn_at_percent / 100
+        if not self.warned and self.spent_usd >= threshold:
+            self.warned = True
+            logger.warning(
+                "Run spend $%.4f reached %d%% of the $%.2f budget",
+                self.spent_usd,
+                self.budget.warn_at_percent,
+                self.budget.max_usd_per_run,
+            )
+
+    def try_reserve(self, amount_usd: float) -> bool:
+        if (
+            self.budget.enforce_hard_stop
+            and self.spent_usd + self.reserved_usd + amount_usd > self.budget.max_usd_per_run
+        ):
+            self.stopped = True
+            return False
+        self.reserved_usd += amount_usd
+        return True
+
+    def settle(self, reserved_usd: float, actual_usd: float) -> None:
+        self.reserved_usd = max(0.0, self.reserved_usd - reserved_usd)
+        self.spent_usd += actual_usd
+        self._check_warning()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "max_usd_per_run": self.budget.max_usd_per_run,
+            "spent_usd": round(self.spent_usd, 6),
+            "warn_at_percent": self.budget.warn_at_percent,
+            "warned": self.warned,
+            "stopped": self.stopped,
+        }
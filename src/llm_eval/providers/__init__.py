@@ -1,6 +1,12 @@
 from llm_eval.providers.base import InferenceRequest, InferenceResponse, ProviderClient
 from llm_eval.providers.factory import build_provider_client
 from llm_eval.providers.groq_provider import GroqProvider
+from llm_eval.providers.pool import (
+    ProviderClientPool,
+    acquire_provider_client,
+    byok_client_pool,
+    default_client_pool,
+)
 
 __all__ = [
     "ProviderClient",
@@ -8,4 +14,8 @@ __all__ = [
     "InferenceResponse",
     "build_provider_client",
     "GroqProvider",
+    "ProviderClientPool",
+    "acquire_provider_client",
+    "byok_client_pool",
+    "default_client_pool",
 ]
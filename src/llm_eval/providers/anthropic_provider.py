@@ -5,11 +5,12 @@ import time
 from typing import Any
 
 from llm_eval.providers.base import InferenceRequest, InferenceResponse, ProviderClient
-from llm_eval.providers.http import post_json
+from llm_eval.providers.http import apost_json, awarm_connection, post_json, warm_connection
 
 
 class AnthropicProvider(ProviderClient):
     provider_name = "anthropic"
+    base_url = "https://api.anthropic.com/"
 
     def __init__(self, model: str, api_key_env: str, timeout_seconds: int = 45):
         self.model = model
@@ -22,23 +23,24 @@ class AnthropicProvider(ProviderClient):
             raise RuntimeError(f"Missing API key in env var: {self.api_key_env}")
         return key
 
-    def generate(self, request: InferenceRequest) -> InferenceResponse:
-        started = time.perf_counter()
+    def _request_parts(self, request: InferenceRequest) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "model": self.model,
             "max_tokens": request.max_tokens,
             "temperature": request.temperature,
             "messages": [{"role": "user", "content": request.prompt}],
         }
-        data = post_json(
-            url="https://api.anthropic.com/v1/messages",
-            payload=payload,
-            headers={
+        return {
+            "url": "https://api.anthropic.com/v1/messages",
+            "payload": payload,
+            "headers": {
                 "x-api-key": self._api_key(),
                 "anthropic-version": "2023-06-01",
             },
-            timeout_seconds=self.timeout_seconds,
-        )
+            "timeout_seconds": self.timeout_seconds,
+        }
+
+    def _parse_response(self, data: dict[str, Any], started: float) -> InferenceResponse:
         contents = data.get("content", [])
         text_chunks = [item.get("text", "") for item in contents if item.get("type") == "text"]
         latency_ms = int((time.perf_counter() - started) * 1000)
@@ -49,3 +51,17 @@ class AnthropicProvider(ProviderClient):
             latency_ms=latency_ms,
             usage=data.get("usage"),
         )
+
+    def generate(self, request: InferenceRequest) -> InferenceResponse:
+        started = time.perf_counter()
+        return self._parse_response(post_json(**self._request_parts(request)), started)
+
+    async def agenerate(self, request: InferenceRequest) -> InferenceResponse:
+        started = time.perf_counter()
+        return self._parse_response(await apost_json(**self._request_parts(request)), started)
+
+    def warm_up(self) -> None:
+        warm_connection(self.base_url, self.timeout_seconds)
+
+    async def awarm_up(self) -> None:
+        await awarm_connection(self.base_url, self.timeout_seconds)
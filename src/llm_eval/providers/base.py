@@ -1,8 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+
+def key_fingerprint(key: str) -> str:
+    """Short hash that identifies an API key without keeping the key itself."""
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
 
 
 @dataclass(frozen=True)
@@ -19,11 +29,48 @@ class InferenceResponse:
     provider: str
     latency_ms: int | None = None
     usage: dict[str, Any] | None = None
+    # Time to first token, for adapters that stream; None when the call is not streamed.
+    ttft_ms: int | None = None
 
 
 class ProviderClient(ABC):
+    """One provider/model endpoint.
+
+    Lifecycle: ``open`` acquires long-lived resources (SDK clients), ``warm_up`` makes a
+    best-effort connection so the first real request skips the TCP/TLS cold start, and
+    ``close``/``aclose`` release them. All are idempotent no-ops by default, and an
+    unopened or closed client opens on next use, so clients can be pooled and shared
+    across runs.
+    """
+
     provider_name: str
 
+    def open(self) -> None:
+        """Acquire long-lived resources such as SDK clients."""
+
+    def warm_up(self) -> None:
+        """Best-effort connection setup ahead of the first request."""
+
+    async def awarm_up(self) -> None:
+        """Warm connections bound to the running event loop (``async`` execution mode)."""
+
+    def close(self) -> None:
+        """Release what ``open`` acquired."""
+
+    async def aclose(self) -> None:
+        """Release resources bound to the running event loop before it shuts down."""
+
+    def __enter__(self) -> Self:
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     @abstractmethod
     def generate(self, request: InferenceRequest) -> InferenceResponse:
         raise NotImplementedError
+
+    async def agenerate(self, request: InferenceRequest) -> InferenceResponse:
+        """Asyncio entry point; clients without a native transport run ``generate`` on a thread."""
+        return await asyncio.to_thread(self.generate, request)
@@ -7,6 +7,17 @@ from llm_eval.providers.gemini_provider import GeminiProvider
 from llm_eval.providers.groq_provider import GroqProvider
 from llm_eval.providers.openai_provider import OpenAIProvider
 
+DEFAULT_API_KEY_ENVS = {
+    "openai": "OPENAI_API_KEY",
+    "anthropic": "ANTHROPIC_API_KEY",
+    "gemini": "GEMINI_API_KEY",
+    "groq": "GROQ_API_KEY",
+}
+
+
+def api_key_env_for(provider_config: ProviderConfig) -> str:
+    return provider_config.api_key_env or DEFAULT_API_KEY_ENVS.get(provider_config.provider, "")
+
 
 def build_provider_client(
     provider_config: ProviderConfig, timeout_seconds: int
@@ -14,25 +25,25 @@ def build_provider_client(
     if provider_config.provider == "openai":
         return OpenAIProvider(
             model=provider_config.model,
-            api_key_env=provider_config.api_key_env or "OPENAI_API_KEY",
+            api_key_env=api_key_env_for(provider_config),
             timeout_seconds=timeout_seconds,
         )
     if provider_config.provider == "anthropic":
         return AnthropicProvider(
             model=provider_config.model,
-            api_key_env=provider_config.api_key_env or "ANTHROPIC_API_KEY",
+            api_key_env=api_key_env_for(provider_config),
             timeout_seconds=timeout_seconds,
         )
     if provider_config.provider == "gemini":
         return GeminiProvider(
             model=provider_config.model,
-            api_key_env=provider_config.api_key_env or "GEMINI_API_KEY",
+            api_key_env=api_key_env_for(provider_config),
             timeout_seconds=timeout_seconds,
         )
     if provider_config.provider == "groq":
         return GroqProvider(
             model=provider_config.model,
-            api_key_env=provider_config.api_key_env or "GROQ_API_KEY",
+            api_key_env=api_key_env_for(provider_config),
             timeout_seconds=timeout_seconds,
         )
     raise NotImplementedError(
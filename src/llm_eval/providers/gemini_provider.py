@@ -5,11 +5,12 @@ import time
 from typing import Any
 
 from llm_eval.providers.base import InferenceRequest, InferenceResponse, ProviderClient
-from llm_eval.providers.http import post_json
+from llm_eval.providers.http import apost_json, awarm_connection, post_json, warm_connection
 
 
 class GeminiProvider(ProviderClient):
     provider_name = "gemini"
+    base_url = "https://generativelanguage.googleapis.com/"
 
     def __init__(self, model: str, api_key_env: str, timeout_seconds: int = 45):
         self.model = model
@@ -22,8 +23,7 @@ class GeminiProvider(ProviderClient):
             raise RuntimeError(f"Missing API key in env var: {self.api_key_env}")
         return key
 
-    def generate(self, request: InferenceRequest) -> InferenceResponse:
-        started = time.perf_counter()
+    def _request_parts(self, request: InferenceRequest) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "contents": [{"parts": [{"text": request.prompt}]}],
             "generationConfig": {
@@ -32,12 +32,14 @@ class GeminiProvider(ProviderClient):
             },
         }
         key = self._api_key()
-        data = post_json(
-            url=f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={key}",
-            payload=payload,
-            headers={},
-            timeout_seconds=self.timeout_seconds,
-        )
+        return {
+            "url": f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent?key={key}",
+            "payload": payload,
+            "headers": {},
+            "timeout_seconds": self.timeout_seconds,
+        }
+
+    def _parse_response(self, data: dict[str, Any], started: float) -> InferenceResponse:
         candidates = data.get("candidates", [])
         content_parts = (
             candidates[0].get("content", {}).get("parts", []) if candidates else []
@@ -51,3 +53,17 @@ class GeminiProvider(ProviderClient):
             latency_ms=latency_ms,
             usage=data.get("usageMetadata"),
         )
+
+    def generate(self, request: InferenceRequest) -> InferenceResponse:
+        started = time.perf_counter()
+        return self._parse_response(post_json(**self._request_parts(request)), started)
+
+    async def agenerate(self, request: InferenceRequest) -> InferenceResponse:
+        started = time.perf_counter()
+        return self._parse_response(await apost_json(**self._request_parts(request)), started)
+
+    def warm_up(self) -> None:
+        warm_connection(self.base_url, self.timeout_seconds)
+
+    async def awarm_up(self) -> None:
+        await awarm_connection(self.base_url, self.timeout_seconds)
@@ -1,9 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import os
+import threading
 import time
+import weakref
+from typing import Any
 
-from llm_eval.providers.base import InferenceRequest, InferenceResponse, ProviderClient
+from llm_eval.providers.base import (
+    InferenceRequest,
+    InferenceResponse,
+    ProviderClient,
+    key_fingerprint,
+)
+from llm_eval.providers.http import ProviderHTTPError
+
+_GROQ_MISSING = "groq package is required for GroqProvider. Install with: pip install groq"
 
 
 class GroqProvider(ProviderClient):
@@ -13,6 +26,15 @@ class GroqProvider(ProviderClient):
         self.model = model
         self.api_key_env = api_key_env
         self.timeout_seconds = timeout_seconds
+        # The SDK clients own httpx pools, so they are built once and reused; a changed
+        # key (tracked by fingerprint, never stored) rebuilds them. AsyncGroq is bound to
+        # the loop that created it.
+        self._client: Any = None
+        self._client_fingerprint = ""
+        self._lock = threading.Lock()
+        self._async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any] = (
+            weakref.WeakKeyDictionary()
+        )
 
     def _api_key(self) -> str:
         key = os.getenv(self.api_key_env, "").strip()
@@ -20,22 +42,17 @@ class GroqProvider(ProviderClient):
             raise RuntimeError(f"Missing API key in env var: {self.api_key_env}")
         return key
 
-    def generate(self, request: InferenceRequest) -> InferenceResponse:
-        try:
-            from groq import Groq
-        except ImportError as exc:  # pragma: no cover - runtime environment specific
-            raise RuntimeError("groq package is required for GroqProvider. Install with: pip install groq") from exc
+    def _completion_kwargs(self, request: InferenceRequest) -> dict[str, Any]:
+        return {
+            "model": self.model,
+            "messages": [{"role": "user", "content": request.prompt}],
+            "temperature": request.temperature,
+            "max_completion_tokens": request.max_tokens,
+            "top_p": 1,
+            "stream": False,
+        }
 
-        started = time.perf_counter()
-        client = Groq(api_key=self._api_key())
-        completion = client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": request.prompt}],
-            temperature=request.temperature,
-            max_completion_tokens=request.max_tokens,
-            top_p=1,
-            stream=False,
-        )
+    def _parse_completion(self, completion: Any, started: float) -> InferenceResponse:
         text = completion.choices[0].message.content if completion.choices else ""
         text = text or ""
         latency_ms = int((time.perf_counter() - started) * 1000)
@@ -46,3 +63,84 @@ class GroqProvider(ProviderClient):
             latency_ms=latency_ms,
             usage=completion.usage.model_dump() if completion.usage else None,
         )
+
+    def open(self) -> None:
+        self._sync_client()
+
+    def _sync_client(self) -> Any:
+        try:
+            from groq import Groq
+        except ImportError as exc:  # pragma: no cover - runtime environment specific
+            raise RuntimeError(_GROQ_MISSING) from exc
+
+        key = self._api_key()
+        fingerprint = key_fingerprint(key)
+        with self._lock:
+            if self._client is None or self._client_fingerprint != fingerprint:
+                if self._client is not None:
+                    self._client.close()
+                self._client = Groq(api_key=key, timeout=self.timeout_seconds)
+                self._client_fingerprint = fingerprint
+            return self._client
+
+    async def _async_client(self) -> Any:
+        try:
+            from groq import AsyncGroq
+        except ImportError as exc:  # pragma: no cover - runtime environment specific
+            raise RuntimeError(_GROQ_MISSING) from exc
+
+        key = self._api_key()
+        fingerprint = key_fingerprint(key)
+        loop = asyncio.get_running_loop()
+        entry = self._async_clients.get(loop)
+        if entry is None or entry[0] != fingerprint:
+            if entry is not None:
+                await entry[1].close()
+            entry = (fingerprint, AsyncGroq(api_key=key, timeout=self.timeout_seconds))
+            self._async_clients[loop] = entry
+        return entry[1]
+
+    def warm_up(self) -> None:
+        with contextlib.suppress(Exception):  # warm-up is best effort
+            self._sync_client().models.list()
+
+    async def awarm_up(self) -> None:
+        with contextlib.suppress(Exception):  # warm-up is best effort
+            await (await self._async_client()).models.list()
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        entry = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].close()
+
+    def generate(self, request: InferenceRequest) -> InferenceResponse:
+        client = self._sync_client()
+        from groq import APIStatusError
+
+        started = time.perf_counter()
+        try:
+            completion = client.chat.completions.create(**self._completion_kwargs(request))
+        except APIStatusError as exc:
+            raise ProviderHTTPError(
+                exc.status_code, str(exc.message)[:500], dict(exc.response.headers.items())
+            ) from exc
+        return self._parse_completion(completion, started)
+
+    async def agenerate(self, request: InferenceRequest) -> InferenceResponse:
+        client = await self._async_client()
+        from groq import APIStatusError
+
+        started = time.perf_counter()
+        try:
+            completion = await client.chat.completions.create(**self._completion_kwargs(request))
+        except APIStatusError as exc:
+            raise ProviderHTTPError(
+                exc.status_code, str(exc.message)[:500], dict(exc.response.headers.items())
+            ) from exc
+        return self._parse_completion(completion, started)
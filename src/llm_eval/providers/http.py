@@ -1,15 +1,110 @@
 from __future__ import annotations
 
+import asyncio
+import atexit
+import importlib.util
 import json
+import threading
+import weakref
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any
-from urllib import error, request
+
+import httpx
+
+from llm_eval.config import HttpTransportPolicy
 
 
 class ProviderHTTPError(RuntimeError):
-    def __init__(self, status_code: int, message: str):
+    def __init__(self, status_code: int, message: str, headers: Mapping[str, str] | None = None):
         super().__init__(f"HTTP {status_code}: {message}")
         self.status_code = status_code
         self.message = message
+        self.headers = {key.lower(): value for key, value in (headers or {}).items()}
+
+    @property
+    def retry_after_seconds(self) -> float | None:
+        """Server retry hint from ``Retry-After`` (delta-seconds or HTTP-date), if any."""
+        return parse_retry_after(self.headers.get("retry-after"))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# Process-wide transport settings; ``configure_transport`` swaps them between runs.
+_SETTINGS = HttpTransportPolicy()
+_SYNC_CLIENT: httpx.Client | None = None
+_SYNC_LOCK = threading.Lock()
+
+
+def _client_options(settings: HttpTransportPolicy) -> dict[str, Any]:
+    if settings.http2 and importlib.util.find_spec("h2") is None:
+        raise RuntimeError(
+            "reliability.http.http2 is enabled but the 'h2' package is not installed; "
+            "install it with: pip install 'llm-eval-framework[http2]'"
+        )
+    return {
+        "limits": httpx.Limits(
+            max_connections=settings.max_connections,
+            max_keepalive_connections=settings.max_keepalive_connections,
+            keepalive_expiry=settings.keepalive_expiry_seconds,
+        ),
+        "http2": settings.http2,
+    }
+
+
+def _timeout(timeout_seconds: float) -> httpx.Timeout:
+    return httpx.Timeout(timeout_seconds, connect=_SETTINGS.connect_timeout_seconds)
+
+
+def configure_transport(settings: HttpTransportPolicy) -> None:
+    """Apply pool/timeout/HTTP-2 settings; pooled clients are rebuilt only if they changed."""
+    global _SETTINGS
+    if settings == _SETTINGS:
+        return
+    _client_options(settings)
+    close_transport()
+    _SETTINGS = settings.model_copy()
+
+
+def _sync_client() -> httpx.Client:
+    global _SYNC_CLIENT
+    with _SYNC_LOCK:
+        if _SYNC_CLIENT is None or _SYNC_CLIENT.is_closed:
+            _SYNC_CLIENT = httpx.Client(**_client_options(_SETTINGS))
+        return _SYNC_CLIENT
+
+
+def close_transport() -> None:
+    """Close the shared blocking client and its keep-alive connections."""
+    global _SYNC_CLIENT
+    with _SYNC_LOCK:
+        client, _SYNC_CLIENT = _SYNC_CLIENT, None
+    if client is not None:
+        client.close()
+
+
+atexit.register(close_transport)
+
+
+def _decode(resp: httpx.Response) -> dict[str, Any]:
+    if resp.status_code >= 400:
+        raise ProviderHTTPError(resp.status_code, resp.text[:500], dict(resp.headers.items()))
+    return json.loads(resp.content.decode("utf-8", errors="replace"))
 
 
 def post_json(
@@ -19,17 +114,67 @@ def post_json(
     headers: dict[str, str],
     timeout_seconds: int,
 ) -> dict[str, Any]:
-    body = json.dumps(payload).encode("utf-8")
-    req = request.Request(
+    """POST JSON over the shared keep-alive pool; HTTP errors raise ``ProviderHTTPError``."""
+    resp = _sync_client().post(
         url,
-        data=body,
-        method="POST",
+        content=json.dumps(payload).encode("utf-8"),
         headers={**headers, "Content-Type": "application/json"},
+        timeout=_timeout(timeout_seconds),
     )
+    return _decode(resp)
+
+
+def warm_connection(url: str, timeout_seconds: float) -> None:
+    """Open a pooled keep-alive connection to ``url``'s host; failures are ignored."""
+    try:
+        _sync_client().head(url, timeout=_timeout(timeout_seconds))
+    except httpx.HTTPError:
+        pass
+
+
+async def awarm_connection(url: str, timeout_seconds: float) -> None:
+    """``warm_connection`` for the running loop's AsyncClient."""
     try:
-        with request.urlopen(req, timeout=timeout_seconds) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
-            return json.loads(raw)
-    except error.HTTPError as exc:
-        text = exc.read().decode("utf-8", errors="replace")
-        raise ProviderHTTPError(exc.code, text[:500]) from exc
+        await _async_client().head(url, timeout=_timeout(timeout_seconds))
+    except httpx.HTTPError:
+        pass
+
+
+# One AsyncClient per event loop: httpx async connections are bound to the loop that
+# opened them, and a single client lets every in-flight request share its pool.
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _async_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _ASYNC_CLIENTS.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(**_client_options(_SETTINGS))
+        _ASYNC_CLIENTS[loop] = client
+    return client
+
+
+async def aclose_async_transport() -> None:
+    """Close the running loop's shared AsyncClient; call before the loop shuts down."""
+    client = _ASYNC_CLIENTS.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def apost_json(
+    *,
+    url: str,
+    payload: dict[str, Any],
+    headers: dict[str, str],
+    timeout_seconds: int,
+) -> dict[str, Any]:
+    """Asyncio counterpart of ``post_json`` with the same error contract."""
+    resp = await _async_client().post(
+        url,
+        content=json.dumps(payload).encode("utf-8"),
+        headers={**headers, "Content-Type": "application/json"},
+        timeout=_timeout(timeout_seconds),
+    )
+    return _decode(resp)
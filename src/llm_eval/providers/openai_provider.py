@@ -5,11 +5,12 @@ import time
 from typing import Any
 
 from llm_eval.providers.base import InferenceRequest, InferenceResponse, ProviderClient
-from llm_eval.providers.http import post_json
+from llm_eval.providers.http import apost_json, awarm_connection, post_json, warm_connection
 
 
 class OpenAIProvider(ProviderClient):
     provider_name = "openai"
+    base_url = "https://api.openai.com/"
 
     def __init__(
         self,
@@ -31,8 +32,7 @@ class OpenAIProvider(ProviderClient):
             raise RuntimeError(f"Missing API key in env var: {self.api_key_env}")
         return key
 
-    def generate(self, request: InferenceRequest) -> InferenceResponse:
-        started = time.perf_counter()
+    def _request_parts(self, request: InferenceRequest) -> dict[str, Any]:
         payload: dict[str, Any] = {
             "model": self.model,
             "messages": [{"role": "user", "content": request.prompt}],
@@ -46,13 +46,14 @@ class OpenAIProvider(ProviderClient):
         organization_id = os.getenv(self.organization_id_env, "").strip()
         if organization_id:
             headers["OpenAI-Organization"] = organization_id
+        return {
+            "url": "https://api.openai.com/v1/chat/completions",
+            "payload": payload,
+            "headers": headers,
+            "timeout_seconds": self.timeout_seconds,
+        }
 
-        data = post_json(
-            url="https://api.openai.com/v1/chat/completions",
-            payload=payload,
-            headers=headers,
-            timeout_seconds=self.timeout_seconds,
-        )
+    def _parse_response(self, data: dict[str, Any], started: float) -> InferenceResponse:
         text = (
             data.get("choices", [{}])[0]
             .get("message", {})
@@ -66,3 +67,17 @@ class OpenAIProvider(ProviderClient):
             latency_ms=latency_ms,
             usage=data.get("usage"),
         )
+
+    def generate(self, request: InferenceRequest) -> InferenceResponse:
+        started = time.perf_counter()
+        return self._parse_response(post_json(**self._request_parts(request)), started)
+
+    async def agenerate(self, request: InferenceRequest) -> InferenceResponse:
+        started = time.perf_counter()
+        return self._parse_response(await apost_json(**self._request_parts(request)), started)
+
+    def warm_up(self) -> None:
+        warm_connection(self.base_url, self.timeout_seconds)
+
+    async def awarm_up(self) -> None:
+        await awarm_connection(self.base_url, self.timeout_seconds)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import atexit
+import contextlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from llm_eval.config import ProviderConfig
+from llm_eval.providers.base import ProviderClient, key_fingerprint
+from llm_eval.providers.factory import api_key_env_for, build_provider_client
+
+ClientFactory = Callable[[ProviderConfig, int], ProviderClient]
+
+# Clients kept open at once; the least recently acquired one is closed past this.
+DEFAULT_MAX_CLIENTS = 32
+
+# Clients for per-job keys (BYOK) live in a smaller pool of their own and are closed
+# once unused for this long, so a UI session's jobs share them but a key does not
+# stay in memory long after the session stops submitting jobs.
+BYOK_MAX_CLIENTS = 8
+BYOK_IDLE_SECONDS = 600.0
+
+
+def credential_fingerprint(provider_config: ProviderConfig) -> str:
+    """Short hash of the provider's current API key so pooled clients never mix keys."""
+    key = os.getenv(api_key_env_for(provider_config), "").strip()
+    if not key:
+        return "none"
+    return key_fingerprint(key)
+
+
+class ProviderClientPool:
+    """Opened provider clients keyed by provider, model, timeout and credential fingerprint.
+
+    Runs, connectivity checks and UI jobs acquire clients here instead of building them,
+    so SDK clients and their connection pools survive across requests and runs; a
+    different key (e.g. a BYOK override) gets its own client. ``factory`` is part of the
+    key so clients from different builders are never confused. Acquiring does not
+    connect: clients open on their first request or warm-up, so a missing key fails
+    that request rather than the caller. At most ``max_clients`` stay pooled; acquiring
+    another closes the least recently acquired one (a closed client reopens if a run
+    still holds it). With ``idle_ttl_seconds``, clients not acquired for that long are
+    closed too, on the next ``acquire`` or ``close_idle``.
+    """
+
+    def __init__(
+        self,
+        max_clients: int = DEFAULT_MAX_CLIENTS,
+        idle_ttl_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.max_clients = max(1, max_clients)
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._clock = clock
+        self._clients: OrderedDict[tuple[Any, ...], ProviderClient] = OrderedDict()
+        self._last_acquired: dict[tuple[Any, ...], float] = {}
+        self._warmed: set[int] = set()
+        self._lock = threading.Lock()
+
+    def acquire(
+        self,
+        provider_config: ProviderConfig,
+        timeout_seconds: int,
+        factory: ClientFactory = build_provider_client,
+    ) -> ProviderClient:
+        key = (
+            factory,
+            provider_config.provider,
+            provider_config.model,
+            api_key_env_for(provider_config),
+            timeout_seconds,
+            credential_fingerprint(provider_config),
+        )
+        with self._lock:
+            now = self._clock()
+            evicted = self._pop_idle(now)
+            client = self._clients.get(key)
+            if client is None:
+                client = factory(provider_config, timeout_seconds)
+                self._clients[key] = client
+                while len(self._clients) > self.max_clients:
+                    evicted.append(self._pop_oldest())
+            else:
+                self._clients.move_to_end(key)
+            self._last_acquired[key] = now
+        for old in evicted:
+            _close(old)
+        return client
+
+    def close_idle(self) -> int:
+        """Close clients idle past ``idle_ttl_seconds``; returns how many were closed."""
+        with self._lock:
+            evicted = self._pop_idle(self._clock())
+        for old in evicted:
+            _close(old)
+        return len(evicted)
+
+    def _pop_idle(self, now: float) -> list[ProviderClient]:
+        # Clients are kept in acquisition order, so the idle ones are at the front.
+        evicted: list[ProviderClient] = []
+        if self.idle_ttl_seconds is None:
+            return evicted
+        while self._clients:
+            oldest = next(iter(self._clients))
+            if now - self._last_acquired[oldest] < self.idle_ttl_seconds:
+                break
+            evicted.append(self._pop_oldest())
+        return evicted
+
+    def _pop_oldest(self) -> ProviderClient:
+        key, client = self._clients.popitem(last=False)
+        del self._last_acquired[key]
+        self._warmed.discard(id(client))
+        return client
+
+    def warm_up(self, clients: Iterable[ProviderClient]) -> None:
+        """Warm each client once per process, concurrently; failures are ignored."""
+        with self._lock:
+            pending = [
+                client
+                for client in {id(client): client for client in clients}.values()
+                if id(client) not in self._warmed and hasattr(client, "warm_up")
+            ]
+            # Only pooled clients are remembered; others are warmed every time.
+            pooled = {id(client) for client in self._clients.values()}
+            self._warmed.update(id(client) for client in pending if id(client) in pooled)
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=len(pending)) as pool:
+            list(pool.map(_safe_warm_up, pending))
+
+    def close(self) -> None:
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+            self._last_acquired.clear()
+            self._warmed.clear()
+        for client in clients:
+            _close(client)
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+
+def _close(client: ProviderClient) -> None:
+    close_client = getattr(client, "close", None)
+    if close_client is not None:
+        close_client()
+
+
+def _safe_warm_up(client: ProviderClient) -> None:
+    with contextlib.suppress(Exception):  # warm-up is best effort
+        client.warm_up()
+
+
+_DEFAULT_POOL = ProviderClientPool()
+atexit.register(_DEFAULT_POOL.close)
+_BYOK_POOL = ProviderClientPool(BYOK_MAX_CLIENTS, idle_ttl_seconds=BYOK_IDLE_SECONDS)
+atexit.register(_BYOK_POOL.close)
+
+
+def default_client_pool() -> ProviderClientPool:
+    return _DEFAULT_POOL
+
+
+def byok_client_pool() -> ProviderClientPool:
+    """Short-lived pool for clients built from per-job keys, kept apart from the default."""
+    return _BYOK_POOL
+
+
+def acquire_provider_client(
+    provider_config: ProviderConfig,
+    timeout_seconds: int,
+    factory: ClientFactory = build_provider_client,
+) -> ProviderClient:
+    """Process-wide pooled counterpart of ``build_provider_client``."""
+    return _DEFAULT_POOL.acquire(provider_config, timeout_seconds, factory)
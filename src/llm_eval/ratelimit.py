@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections.abc import Callable
+
+from llm_eval.config import ProviderConfig, RateLimitPolicy
+
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap tokenizer approximation (~4 characters per token for English prose)."""
+    return max(1, math.ceil(len(text) / CHARS_PER_TOKEN))
+
+
+def estimate_request_tokens(prompt: str, max_tokens: int) -> int:
+    """Budget a request at its prompt estimate plus the full completion allowance."""
+    return estimate_tokens(prompt) + max_tokens
+
+
+class TokenBucket:
+    """Continuous-refill token bucket; ``rate_per_minute`` also bounds the burst size."""
+
+    def __init__(self, rate_per_minute: float, clock: Callable[[], float] = time.monotonic):
+        self.rate_per_minute = float(rate_per_minute)
+        self.capacity = float(rate_per_minute)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated)
+        self._updated = now
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate_per_minute / 60.0)
+
+    def delay_for(self, amount: float) -> float:
+        """Seconds until ``amount`` tokens are available (0.0 when they are now)."""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self._tokens >= amount:
+            return 0.0
+        return (amount - self._tokens) * 60.0 / self.rate_per_minute
+
+    def consume(self, amount: float) -> None:
+        self._refill()
+        self._tokens -= min(amount, self.capacity)
+
+    def set_rate(self, rate_per_minute: float) -> None:
+        self._refill()
+        self.rate_per_minute = float(rate_per_minute)
+        self.capacity = float(rate_per_minute)
+        self._tokens = min(self._tokens, self.capacity)
+
+
+class ProviderRateLimiter:
+    """Requests-per-minute and tokens-per-minute budget for one provider/model pair.
+
+    A 429 multiplies the effective budget by ``throttle_factor`` (never below
+    ``min_fraction`` of the configured rate); each success restores
+    ``recovery_per_success`` of the configured rate until the ceiling is reached again.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: int | None,
+        tokens_per_minute: int | None,
+        *,
+        throttle_factor: float = 0.5,
+        min_fraction: float = 0.1,
+        recovery_per_success: float = 0.02,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.configured_rpm = requests_per_minute
+        self.configured_tpm = tokens_per_minute
+        self.throttle_factor = throttle_factor
+        self.min_fraction = min_fraction
+        self.recovery_per_success = recovery_per_success
+        self.fraction = 1.0
+        self.throttle_events = 0
+        self._requests = TokenBucket(requests_per_minute, clock) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute, clock) if tokens_per_minute else None
+
+    @property
+    def unlimited(self) -> bool:
+        return self._requests is None and self._tokens is None
+
+    def reserve(self, tokens: int) -> float:
+        """Consume one request and ``tokens`` if both fit now, else return the wait in seconds."""
+        delay = 0.0
+        if self._requests is not None:
+            delay = max(delay, self._requests.delay_for(1))
+        if self._tokens is not None:
+            delay = max(delay, self._tokens.delay_for(tokens))
+        if delay > 0:
+            return delay
+        if self._requests is not None:
+            self._requests.consume(1)
+        if self._tokens is not None:
+            self._tokens.consume(tokens)
+        return 0.0
+
+    async def acquire(self, tokens: int) -> None:
+        while True:
+            delay = self.reserve(tokens)
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def _apply_fraction(self) -> None:
+        if self._requests is not None and self.configured_rpm:
+            self._requests.set_rate(self.configured_rpm * self.fraction)
+        if self._tokens is not None and self.configured_tpm:
+            self._tokens.set_rate(self.configured_tpm * self.fraction)
+
+    def on_throttled(self) -> None:
+        self.throttle_events += 1
+        self.fraction = max(self.min_fraction, self.fraction * self.throttle_factor)
+        self._apply_fraction()
+
+    def on_success(self) -> None:
+        if self.fraction >= 1.0:
+            return
+        self.fraction = min(1.0, self.fraction + self.recovery_per_success)
+        self._apply_fraction()
+
+    def snapshot(self) -> dict[str, float | int | None]:
+        return {
+            "requests_per_minute": self.configured_rpm,
+            "tokens_per_minute": self.configured_tpm,
+            "effective_fraction": round(self.fraction, 4),
+            "throttle_events": self.throttle_events,
+        }
+
+
+class RateLimiterRegistry:
+    """One limiter per ``provider:model``, resolved from provider config then policy."""
+
+    def __init__(self, policy: RateLimitPolicy, clock: Callable[[], float] = time.monotonic):
+        self.policy = policy
+        self._clock = clock
+        self._limiters: dict[str, ProviderRateLimiter] = {}
+
+    def limiter_for(self, provider_cfg: ProviderConfig) -> ProviderRateLimiter:
+        key = f"{provider_cfg.provider}:{provider_cfg.model}"
+        limiter = self._limiters.get(key)
+        if limiter is None:
+            model_limit = self.policy.limits.get(key)
+            provider_limit = self.policy.limits.get(provider_cfg.provider)
+            rpm = provider_cfg.requests_per_minute
+            tpm = provider_cfg.tokens_per_minute
+            for fallback in (model_limit, provider_limit):
+                if fallback is None:
+                    continue
+                rpm = rpm if rpm is not None else fallback.requests_per_minute
+                tpm = tpm if tpm is not None else fallback.tokens_per_minute
+            limiter = ProviderRateLimiter(
+                rpm,
+                tpm,
+                throttle_factor=self.policy.throttle_factor,
+                min_fraction=self.policy.min_fraction,
+                recovery_per_success=self.policy.recovery_per_success,
+                clock=self._clock,
+            )
+            self._limiters[key] = limiter
+        return limiter
+
+    def snapshot(self) -> dict[str, dict[str, float | int | None]]:
+        return {key: limiter.snapshot() for key, limiter in self._limiters.items()}
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    run_name TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    benchmark TEXT NOT NULL,
+    providers TEXT NOT NULL,
+    status TEXT NOT NULL,
+    total_requests INTEGER,
+    total_errors INTEGER,
+    total_cost_usd REAL,
+    best_accuracy REAL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS runs_created_at ON runs (created_at);
+CREATE INDEX IF NOT EXISTS runs_status ON runs (status);
+CREATE INDEX IF NOT EXISTS runs_run_name ON runs (run_name);
+CREATE TABLE IF NOT EXISTS run_systems (
+    run_id TEXT NOT NULL,
+    system_id TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    model TEXT NOT NULL,
+    attempted INTEGER,
+    correct INTEGER,
+    errors INTEGER,
+    accuracy REAL,
+    cost_usd REAL,
+    PRIMARY KEY (run_id, system_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS run_systems_model ON run_systems (model);
+CREATE INDEX IF NOT EXISTS run_systems_provider ON run_systems (provider);
+"""
+
+_RUN_COLUMNS = (
+    "run_id",
+    "run_name",
+    "created_at",
+    "benchmark",
+    "providers",
+    "status",
+    "total_requests",
+    "total_errors",
+    "total_cost_usd",
+    "best_accuracy",
+)
+
+
+def default_registry_path(artifacts_root: str | Path) -> Path:
+    return Path(artifacts_root) / "runs.sqlite3"
+
+
+class RunRegistry:
+    """SQLite index over every run's manifest and summary under one artifacts root.
+
+    ``ArtifactStore`` keeps it current as runs write their manifest and summary; the
+    files stay the source of truth and ``reindex`` rebuilds the index from them. Each
+    call opens its own short-lived connection, so runs in several processes can update
+    it concurrently.
+    """
+
+    def __init__(self, path: str | Path, busy_timeout_seconds: float = 30.0):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.busy_timeout_seconds = busy_timeout_seconds
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout_seconds)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def record_manifest(self, manifest: dict[str, Any]) -> None:
+        """Register a run as ``running``; a resumed run keeps its previous metrics."""
+        benchmark = manifest.get("benchmark") or {}
+        providers = [
+            f"{provider.get('provider')}:{provider.get('model')}"
+            for provider in manifest.get("providers") or []
+        ]
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO runs (run_id, run_name, created_at, benchmark, providers, status) "
+                "VALUES (?, ?, ?, ?, ?, 'running') "
+                "ON CONFLICT(run_id) DO UPDATE SET run_name = excluded.run_name, "
+                "created_at = excluded.created_at, benchmark = excluded.benchmark, "
+                "providers = excluded.providers, status = 'running'",
+                (
+                    str(manifest["run_id"]),
+                    str(manifest.get("run_name", "")),
+                    str(manifest.get("created_at", "")),
+                    str(benchmark.get("name", "")),
+                    json.dumps(providers),
+                ),
+            )
+
+    def record_summary(self, summary: dict[str, Any]) -> None:
+        run_id = str(summary["run_id"])
+        metrics: dict[str, dict[str, Any]] = summary.get("provider_metrics") or {}
+        accuracies = [float(m.get("accuracy") or 0.0) for m in metrics.values()]
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO runs (run_id, run_name, created_at, benchmark, providers, status) "
+                "VALUES (?, '', '', '', ?, ?) "
+                "ON CONFLICT(run_id) DO UPDATE SET status = excluded.status",
+                (run_id, json.dumps(list(metrics)), str(summary.get("status", "unknown"))),
+            )
+            conn.execute(
+                "UPDATE runs SET total_requests = ?, total_errors = ?, total_cost_usd = ?, "
+                "best_accuracy = ? WHERE run_id = ?",
+                (
+                    summary.get("total_requests"),
+                    summary.get("total_errors"),
+                    sum(float(m.get("cost_usd") or 0.0) for m in metrics.values()),
+                    max(accuracies) if accuracies else None,
+                    run_id,
+                ),
+            )
+            conn.execute("DELETE FROM run_systems WHERE run_id = ?", (run_id,))
+            conn.executemany(
+                "INSERT INTO run_systems VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        run_id,
+                        sid,
+                        str(m.get("provider") or sid.split(":", 1)[0]),
+                        str(m.get("model") or sid.split(":", 1)[-1]),
+                        m.get("attempted"),
+                        m.get("correct"),
+                        m.get("errors"),
+                        m.get("accuracy"),
+                        m.get("cost_usd"),
+                    )
+                    for sid, m in metrics.items()
+                ],
+            )
+
+    def list_runs(
+        self,
+        *,
+        name: str | None = None,
+        provider: str | None = None,
+        model: str | None = None,
+        status: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int | None = 50,
+    ) -> list[dict[str, Any]]:
+        """Runs newest first; ``name`` is a substring match, ``since``/``until`` ISO prefixes."""
+        clauses: list[str] = []
+        params: list[Any] = []
+        if name:
+            clauses.append("run_name LIKE ?")
+            params.append(f"%{name}%")
+        if status:
+            clauses.append("status = ?")
+            params.append(status)
+        if since:
+            clauses.append("created_at >= ?")
+            params.append(since)
+        if until:
+            clauses.append("created_at < ?")
+            params.append(until)
+        for column, value in (("provider", provider), ("model", model)):
+            if value:
+                clauses.append(
+                    f"run_id IN (SELECT run_id FROM run_systems WHERE {column} = ?)"
+                )
+                params.append(value)
+        sql = f"SELECT {', '.join(_RUN_COLUMNS)} FROM runs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY created_at DESC, run_id"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with closing(self._connect()) as conn:
+            return [_run_row(row) for row in conn.execute(sql, params)]
+
+    def get(self, run_id: str) -> dict[str, Any] | None:
+        """One run with per-system metrics; a unique run_id prefix is enough."""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT {', '.join(_RUN_COLUMNS)} FROM runs WHERE run_id LIKE ? LIMIT 2",
+                (f"{run_id}%",),
+            ).fetchall()
+            if len(rows) != 1:
+                return None
+            run = _run_row(rows[0])
+            systems = conn.execute(
+                "SELECT * FROM run_systems WHERE run_id = ? ORDER BY system_id", (run["run_id"],)
+            )
+            run["systems"] = {row["system_id"]: dict(row) for row in systems}
+            for system in run["systems"].values():
+                del system["run_id"]
+        return run
+
+    def reindex(self, artifacts_root: str | Path) -> int:
+        """Rebuild entries from every ``runs/<run_id>`` manifest and summary; returns runs."""
+        count = 0
+        for manifest_path in sorted((Path(artifacts_root) / "runs").glob("*/manifest.json")):
+            run_dir = manifest_path.parent
+            self.record_manifest(json.loads(manifest_path.read_text(encoding="utf-8")))
+            summary_path = run_dir / "summary.json"
+            if summary_path.exists():
+                self.record_summary(json.loads(summary_path.read_text(encoding="utf-8")))
+            count += 1
+        return count
+
+
+def _run_row(row: sqlite3.Row) -> dict[str, Any]:
+    run = {key: row[key] for key in _RUN_COLUMNS}
+    run["providers"] = json.loads(run["providers"])
+    return run
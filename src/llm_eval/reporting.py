@@ -13,25 +13,70 @@ def _provider_table_rows(scored: dict[str, Any]) -> list[tuple[str, dict[str, An
     )
 
 
+def _format_usd(value: float | None) -> str:
+    return "n/a" if value is None else f"{value:.4f}"
+
+
+def _format_interval(bounds: dict[str, Any] | None) -> str:
+    if not bounds or bounds.get("low") is None or bounds.get("high") is None:
+        return "n/a"
+    return f"[{bounds['low']:.3f}, {bounds['high']:.3f}]"
+
+
+def _has_bootstrap(scored: dict[str, Any]) -> bool:
+    return "bootstrap" in scored
+
+
+def _has_ttft(scored: dict[str, Any]) -> bool:
+    return any(
+        metrics.get("ttft_p50_ms") is not None for metrics in scored.get("providers", {}).values()
+    )
+
+
+def _latency_cells(metrics: dict[str, Any], prefix: str = "latency") -> list[str]:
+    """p50/p95/p99 in ms from the run's latency sketches, "n/a" when not recorded."""
+    cells = []
+    for quantile in ("p50", "p95", "p99"):
+        value = metrics.get(f"{prefix}_{quantile}_ms")
+        cells.append("n/a" if value is None else f"{value:.1f}")
+    return cells
+
+
+_LATENCY_HEADERS = ["p50 (ms)", "p95 (ms)", "p99 (ms)"]
+_TTFT_HEADERS = ["TTFT p50 (ms)", "TTFT p95 (ms)", "TTFT p99 (ms)"]
+
+
 def build_markdown_report(run_id: str, scored: dict[str, Any], pairwise: list[dict[str, Any]]) -> str:
     lines: list[str] = []
     lines.append(f"# Evaluation Report: {run_id}")
     lines.append("")
     lines.append(f"- Status: `{scored.get('status', 'unknown')}`")
     lines.append(f"- Total evaluated rows: `{scored.get('total_rows', 0)}`")
+    lines.append(f"- Total cost (USD): `{scored.get('total_cost_usd', 0.0):.4f}`")
     lines.append("")
     lines.append("## Leaderboard")
     lines.append("")
-    lines.append("| System | Attempted | Correct | Accuracy | CI95 | Avg Latency (ms) | Errors |")
-    lines.append("|---|---:|---:|---:|---:|---:|---:|")
+    ttft = _has_ttft(scored)
+    latency_headers = _LATENCY_HEADERS + (_TTFT_HEADERS if ttft else [])
+    lines.append(
+        "| System | Attempted | Correct | Accuracy | CI95 | Avg Latency (ms) | "
+        + " | ".join(latency_headers)
+        + " | Errors | Cost (USD) | Cost/Correct (USD) |"
+    )
+    lines.append("|---|" + "---:|" * (8 + len(latency_headers)))
     for provider, metrics in _provider_table_rows(scored):
         ci = metrics.get("accuracy_ci95", {"low": 0.0, "high": 0.0})
+        latency_cells = _latency_cells(metrics) + (_latency_cells(metrics, "ttft") if ttft else [])
         lines.append(
             "| "
             f"{provider} | {metrics.get('attempted', 0)} | {metrics.get('correct', 0)} | "
             f"{metrics.get('accuracy', 0.0):.3f} | "
             f"[{ci.get('low', 0.0):.3f}, {ci.get('high', 0.0):.3f}] | "
-            f"{metrics.get('avg_latency_ms', 0.0):.1f} | {metrics.get('errors', 0)} |"
+            f"{metrics.get('avg_latency_ms', 0.0):.1f} | "
+            + " | ".join(latency_cells)
+            + f" | {metrics.get('errors', 0)} | "
+            f"{_format_usd(metrics.get('cost_usd', 0.0))} | "
+            f"{_format_usd(metrics.get('cost_per_correct_usd'))} |"
         )
 
     lines.append("")
@@ -40,13 +85,37 @@ def build_markdown_report(run_id: str, scored: dict[str, Any], pairwise: list[di
     if not pairwise:
         lines.append("No provider pairs available.")
     else:
-        lines.append("| System A | System B | Wins A | Wins B | Ties | p-value |")
-        lines.append("|---|---|---:|---:|---:|---:|")
-        for row in pairwise:
+        bootstrap = _has_bootstrap(scored)
+        if bootstrap:
             lines.append(
+                "| System A | System B | Wins A | Wins B | Ties | p-value "
+                "| Acc A - B | Bootstrap CI95 | Bootstrap p |"
+            )
+            lines.append("|---|---|---:|---:|---:|---:|---:|---:|---:|")
+        else:
+            lines.append("| System A | System B | Wins A | Wins B | Ties | p-value |")
+            lines.append("|---|---|---:|---:|---:|---:|")
+        for row in pairwise:
+            line = (
                 f"| {row['provider_a']} | {row['provider_b']} | {row['wins_a']} | "
                 f"{row['wins_b']} | {row['ties']} | {row['p_value_two_sided']:.4f} |"
             )
+            if bootstrap:
+                diff = row.get("accuracy_diff")
+                p_boot = row.get("p_value_bootstrap")
+                line += (
+                    f" {'n/a' if diff is None else f'{diff:+.3f}'} | "
+                    f"{_format_interval(row.get('accuracy_diff_ci_bootstrap'))} | "
+                    f"{'n/a' if p_boot is None else f'{p_boot:.4f}'} |"
+                )
+            lines.append(line)
+        if bootstrap:
+            info = scored["bootstrap"]
+            lines.append("")
+            lines.append(
+                f"Paired bootstrap: {info['resamples']} resamples of samples, "
+                f"seed {info['seed']}, {info['confidence']:.0%} percentile intervals."
+            )
 
     lines.append("")
     lines.append("## Category Breakdown")
@@ -54,39 +123,69 @@ def build_markdown_report(run_id: str, scored: dict[str, Any], pairwise: list[di
     for provider, metrics in _provider_table_rows(scored):
         lines.append(f"### {provider}")
         lines.append("")
-        lines.append("| Category | Attempted | Correct | Accuracy |")
-        lines.append("|---|---:|---:|---:|")
+        bootstrap = _has_bootstrap(scored)
+        if bootstrap:
+            lines.append(
+                "| Category | Attempted | Correct | Accuracy | p50 (ms) | p95 (ms) | p99 (ms) "
+                "| Bootstrap CI95 |"
+            )
+            lines.append("|---|---:|---:|---:|---:|---:|---:|---:|")
+        else:
+            lines.append(
+                "| Category | Attempted | Correct | Accuracy | p50 (ms) | p95 (ms) | p99 (ms) |"
+            )
+            lines.append("|---|---:|---:|---:|---:|---:|---:|")
         categories = sorted(metrics.get("categories", {}).items(), key=lambda x: x[0])
         for cat_name, cat in categories:
-            lines.append(
+            line = (
                 f"| {cat_name} | {cat.get('attempted', 0)} | {cat.get('correct', 0)} | "
-                f"{cat.get('accuracy', 0.0):.3f} |"
+                f"{cat.get('accuracy', 0.0):.3f} | " + " | ".join(_latency_cells(cat)) + " |"
             )
+            if bootstrap:
+                line += f" {_format_interval(cat.get('accuracy_ci_bootstrap'))} |"
+            lines.append(line)
         lines.append("")
     return "\n".join(lines).strip() + "\n"
 
 
 def build_html_report(run_id: str, scored: dict[str, Any], pairwise: list[dict[str, Any]]) -> str:
     rows = _provider_table_rows(scored)
+    ttft = _has_ttft(scored)
+    latency_headers = _LATENCY_HEADERS + (_TTFT_HEADERS if ttft else [])
     provider_rows = []
     for provider, metrics in rows:
         ci = metrics.get("accuracy_ci95", {"low": 0.0, "high": 0.0})
+        latency_cells = _latency_cells(metrics) + (_latency_cells(metrics, "ttft") if ttft else [])
         provider_rows.append(
             "<tr>"
             f"<td>{provider}</td><td>{metrics.get('attempted', 0)}</td>"
             f"<td>{metrics.get('correct', 0)}</td><td>{metrics.get('accuracy', 0.0):.3f}</td>"
             f"<td>[{ci.get('low', 0.0):.3f}, {ci.get('high', 0.0):.3f}]</td>"
             f"<td>{metrics.get('avg_latency_ms', 0.0):.1f}</td>"
-            f"<td>{metrics.get('errors', 0)}</td></tr>"
+            + "".join(f"<td>{cell}</td>" for cell in latency_cells)
+            + f"<td>{metrics.get('errors', 0)}</td>"
+            f"<td>{_format_usd(metrics.get('cost_usd', 0.0))}</td>"
+            f"<td>{_format_usd(metrics.get('cost_per_correct_usd'))}</td></tr>"
         )
+    bootstrap = _has_bootstrap(scored)
     pair_rows = []
     for row in pairwise:
+        extra = ""
+        if bootstrap:
+            diff = row.get("accuracy_diff")
+            p_boot = row.get("p_value_bootstrap")
+            extra = (
+                f"<td>{'n/a' if diff is None else f'{diff:+.3f}'}</td>"
+                f"<td>{_format_interval(row.get('accuracy_diff_ci_bootstrap'))}</td>"
+                f"<td>{'n/a' if p_boot is None else f'{p_boot:.4f}'}</td>"
+            )
         pair_rows.append(
             "<tr>"
             f"<td>{row['provider_a']}</td><td>{row['provider_b']}</td>"
             f"<td>{row['wins_a']}</td><td>{row['wins_b']}</td><td>{row['ties']}</td>"
-            f"<td>{row['p_value_two_sided']:.4f}</td></tr>"
+            f"<td>{row['p_value_two_sided']:.4f}</td>{extra}</tr>"
         )
+    pair_columns = 9 if bootstrap else 6
     return (
         "<!doctype html><html><head><meta charset='utf-8'>"
         f"<title>Evaluation Report {run_id}</title>"
@@ -95,17 +194,27 @@ def build_html_report(run_id: str, scored: dict[str, Any], pairwise: list[dict[s
         "</head><body>"
         f"<h1>Evaluation Report: {run_id}</h1>"
         f"<p>Status: <code>{scored.get('status', 'unknown')}</code><br>"
-        f"Total evaluated rows: <code>{scored.get('total_rows', 0)}</code></p>"
+        f"Total evaluated rows: <code>{scored.get('total_rows', 0)}</code><br>"
+        f"Total cost (USD): <code>{scored.get('total_cost_usd', 0.0):.4f}</code></p>"
         "<h2>Leaderboard</h2><table><thead><tr>"
         "<th>System</th><th>Attempted</th><th>Correct</th><th>Accuracy</th>"
-        "<th>CI95</th><th>Avg Latency (ms)</th><th>Errors</th>"
+        "<th>CI95</th><th>Avg Latency (ms)</th>"
+        + "".join(f"<th>{header}</th>" for header in latency_headers)
+        + "<th>Errors</th><th>Cost (USD)</th><th>Cost/Correct (USD)</th>"
         "</tr></thead><tbody>"
         + "".join(provider_rows)
         + "</tbody></table>"
         "<h2>Pairwise Significance</h2><table><thead><tr>"
         "<th>System A</th><th>System B</th><th>Wins A</th><th>Wins B</th><th>Ties</th><th>p-value</th>"
-        "</tr></thead><tbody>"
-        + ("".join(pair_rows) if pair_rows else "<tr><td colspan='6'>No pairs available</td></tr>")
+        + (
+            "<th>Acc A - B</th><th>Bootstrap CI95</th><th>Bootstrap p</th>" if bootstrap else ""
+        )
+        + "</tr></thead><tbody>"
+        + (
+            "".join(pair_rows)
+            if pair_rows
+            else f"<tr><td colspan='{pair_columns}'>No pairs available</td></tr>"
+        )
         + "</tbody></table>"
         "</body></html>"
     )
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import random
+import time
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from llm_eval.config import RetryPolicy
+
+T = TypeVar("T")
+
+
+class RetryScheduler(Generic[T]):
+    """Delay queue for failed work items so a backoff never holds a worker slot.
+
+    The delay for attempt ``n`` is ``backoff_seconds[n - 1]`` with equal jitter
+    (uniformly between ``1 - jitter_ratio`` and ``1`` times the step), raised to the
+    server's ``Retry-After`` hint when that is longer and capped at ``max_delay_seconds``.
+    Jitter is drawn from a seeded RNG so a run's retry timeline is reproducible.
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        seed: int = 0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.policy = policy
+        self._rng = random.Random(seed)
+        self._clock = clock
+        self._heap: list[tuple[float, int, T]] = []
+        self._sequence = itertools.count()
+        self.scheduled = 0
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def delay_for(self, attempt: int, retry_after: float | None = None) -> float:
+        steps = self.policy.backoff_seconds or [0]
+        base = float(steps[min(attempt - 1, len(steps) - 1)])
+        delay = base * (1.0 - self.policy.jitter_ratio * self._rng.random())
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return min(delay, self.policy.max_delay_seconds)
+
+    def schedule(self, entry: T, attempt: int, retry_after: float | None = None) -> float:
+        """Queue ``entry`` after its failed ``attempt``; returns the chosen delay."""
+        delay = self.delay_for(attempt, retry_after)
+        heapq.heappush(self._heap, (self._clock() + delay, next(self._sequence), entry))
+        self.scheduled += 1
+        return delay
+
+    def pop_due(self) -> list[T]:
+        """Remove and return every entry whose delay has elapsed, earliest first."""
+        now = self._clock()
+        due: list[T] = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[2])
+        return due
+
+    def seconds_until_next(self) -> float | None:
+        if not self._heap:
+            return None
+        return max(0.0, self._heap[0][0] - self._clock())
@@ -1,24 +1,68 @@
 from __future__ import annotations
 
-import os
+import asyncio
 import hashlib
+import heapq
 import json
+import os
 import random
 import re
 import time
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, replace
+from typing import Any, Literal
 
+from llm_eval.benchmarks.base import BenchmarkSample
 from llm_eval.benchmarks.mmlu_subset import MMLUSubsetDataset
-from llm_eval.cache import ResponseCache
-from llm_eval.config import RunConfig, build_run_manifest, load_env_file
+from llm_eval.breaker import CircuitBreaker
+from llm_eval.cache import (
+    CacheKey,
+    SQLiteResponseCache,
+    default_cache_path,
+    default_memory_tier,
+)
+from llm_eval.columnar import write_columnar
+from llm_eval.concurrency import AdaptiveConcurrencyLimit, classify_status
+from llm_eval.config import (
+    ProviderConfig,
+    ReliabilityPolicy,
+    RetryPolicy,
+    RunConfig,
+    TokenPrice,
+    build_run_manifest,
+    load_env_file,
+)
 from llm_eval.policy import merge_policy
-from llm_eval.providers import InferenceRequest, build_provider_client
-from llm_eval.providers.http import ProviderHTTPError
+from llm_eval.pricing import CostMeter, TokenUsage, cost_usd, normalize_usage, resolve_price
+from llm_eval.providers import (
+    InferenceRequest,
+    InferenceResponse,
+    ProviderClient,
+    build_provider_client,
+    byok_client_pool,
+    default_client_pool,
+)
+from llm_eval.providers.http import (
+    ProviderHTTPError,
+    aclose_async_transport,
+    configure_transport,
+)
+from llm_eval.ratelimit import (
+    ProviderRateLimiter,
+    RateLimiterRegistry,
+    estimate_request_tokens,
+    estimate_tokens,
+)
+from llm_eval.retry import RetryScheduler
+from llm_eval.scheduling import interleave
+from llm_eval.scoring import ScoringState
 from llm_eval.storage import ArtifactStore
 
 OPTION_RE = re.compile(r"\b([A-Z])\b")
+# Dispatcher sleep when work is parked but nothing has a known wake-up time.
+_IDLE_POLL_SECONDS = 0.05
 
 
 @dataclass
@@ -29,7 +73,35 @@ class ExecutionSummary:
     provider_metrics: dict[str, dict[str, Any]]
 
 
-def _system_id(provider: str, model: str) -> str:
+@dataclass(frozen=True)
+class _WorkItem:
+    """One (provider, sample) request; ``index`` fixes its position in results.jsonl."""
+
+    index: int
+    provider_cfg: ProviderConfig
+    system_id: str
+    sample: BenchmarkSample
+    prompt: str
+    request_key: str
+    cache_key: CacheKey
+
+
+@dataclass
+class _WorkOutcome:
+    response_text: str = ""
+    latency_ms: int = 0
+    ttft_ms: int | None = None
+    usage: dict[str, Any] | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost_usd: float = 0.0
+    from_cache: bool = False
+    error_type: str | None = None
+    error: str | None = None
+    attempt: int = 0
+
+
+def system_id(provider: str, model: str) -> str:
     return f"{provider}:{model}"
 
 
@@ -37,9 +109,11 @@ def _finalize_metrics(provider_metrics: dict[str, dict[str, Any]]) -> None:
     for metrics in provider_metrics.values():
         attempted = metrics["attempted"]
         metrics["accuracy"] = (metrics["correct"] / attempted) if attempted else 0.0
+        correct = metrics["correct"]
+        metrics["cost_per_correct_usd"] = (metrics["cost_usd"] / correct) if correct else None
 
 
-def _request_key(
+def request_key(
     *,
     provider: str,
     model: str,
@@ -48,15 +122,33 @@ def _request_key(
     temperature: float,
     max_tokens: int,
 ) -> str:
-    payload = {
-        "provider": provider,
-        "model": model,
-        "sample_id": sample_id,
-        "prompt": prompt,
-        "temperature": temperature,
-        "max_tokens": max_tokens,
-    }
-    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:24]
+    key = request_key_for(
+        provider=provider, model=model, temperature=temperature, max_tokens=max_tokens
+    )
+    return key(json.dumps(sample_id), json.dumps(prompt))
+
+
+def request_key_for(
+    *, provider: str, model: str, temperature: float, max_tokens: int
+) -> Callable[[str, str], str]:
+    """``request_key`` for one system, called with the JSON-encoded sample id and prompt.
+
+    The hashed text is ``json.dumps`` of the six fields with sorted keys, assembled around
+    the encoded values, so callers keying many systems encode each prompt only once.
+    """
+    head = hashlib.sha256(
+        f'{{"max_tokens": {json.dumps(max_tokens)}, "model": {json.dumps(model)}, "prompt": '
+        .encode()
+    )
+    middle = f', "provider": {json.dumps(provider)}, "sample_id": '
+    tail = f', "temperature": {json.dumps(temperature)}}}'
+
+    def key(sample_id_json: str, prompt_json: str) -> str:
+        digest = head.copy()
+        digest.update(f"{prompt_json}{middle}{sample_id_json}{tail}".encode())
+        return digest.hexdigest()[:24]
+
+    return key
 
 
 def _extract_option_letter(text: str) -> str | None:
@@ -86,6 +178,330 @@ def _temporary_env(overrides: dict[str, str] | None):
                 os.environ[key] = old_value
 
 
+ProviderInvoker = Callable[[ProviderClient, InferenceRequest], Awaitable[InferenceResponse]]
+
+
+@dataclass
+class _SystemLane:
+    """Per-system execution state shared by every work item of one provider/model."""
+
+    client: ProviderClient
+    limiter: ProviderRateLimiter
+    concurrency: AdaptiveConcurrencyLimit
+    breaker: CircuitBreaker
+    price: TokenPrice | None
+    skipped: int = 0
+
+
+@dataclass(frozen=True)
+class _RetryRequest:
+    """A retryable failure; the coordinator re-queues the item instead of sleeping."""
+
+    retry_after: float | None
+
+
+async def _execute_item(
+    item: _WorkItem,
+    attempt: int,
+    lane: _SystemLane,
+    invoke: ProviderInvoker,
+    cache: SQLiteResponseCache | None,
+    retry: RetryPolicy,
+) -> _WorkOutcome | _RetryRequest:
+    """Make one attempt at a work item without touching shared run state."""
+    cached = cache.get(item.cache_key) if cache is not None else None
+    if cached is not None:
+        usage = normalize_usage(item.provider_cfg.provider, cached.get("usage"))
+        return _WorkOutcome(
+            response_text=str(cached["text"]),
+            latency_ms=int(cached.get("latency_ms") or 0),
+            ttft_ms=cached.get("ttft_ms"),
+            usage=cached.get("usage"),
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            cost_usd=cost_usd(lane.price, usage),
+            from_cache=True,
+        )
+
+    await lane.limiter.acquire(estimate_request_tokens(item.prompt, item.provider_cfg.max_tokens))
+    started = time.perf_counter()
+    try:
+        response = await invoke(
+            lane.client,
+            InferenceRequest(
+                prompt=item.prompt,
+                temperature=item.provider_cfg.temperature,
+                max_tokens=item.provider_cfg.max_tokens,
+            ),
+        )
+    except ProviderHTTPError as exc:
+        lane.concurrency.record(
+            (time.perf_counter() - started) * 1000, classify_status(exc.status_code)
+        )
+        if exc.status_code == 429:
+            lane.limiter.on_throttled()
+        if attempt < retry.max_attempts and exc.status_code in retry.retryable_status_codes:
+            return _RetryRequest(retry_after=exc.retry_after_seconds)
+        return _WorkOutcome(error_type="ProviderHTTPError", error=str(exc), attempt=attempt)
+    except Exception as exc:  # noqa: BLE001
+        lane.concurrency.record((time.perf_counter() - started) * 1000, "error")
+        return _WorkOutcome(error_type=type(exc).__name__, error=str(exc), attempt=attempt)
+
+    lane.limiter.on_success()
+    lane.concurrency.record((time.perf_counter() - started) * 1000, "ok")
+    usage = normalize_usage(item.provider_cfg.provider, response.usage)
+    return _WorkOutcome(
+        response_text=response.text,
+        latency_ms=response.latency_ms or 0,
+        ttft_ms=response.ttft_ms,
+        usage=response.usage,
+        input_tokens=usage.input_tokens,
+        output_tokens=usage.output_tokens,
+        cost_usd=cost_usd(lane.price, usage),
+        attempt=attempt,
+    )
+
+
+def _estimated_cost(item: _WorkItem, lane: _SystemLane) -> float:
+    """Worst-case cost of one attempt: estimated prompt plus a full-length completion."""
+    return cost_usd(
+        lane.price,
+        TokenUsage(
+            input_tokens=estimate_tokens(item.prompt),
+            output_tokens=item.provider_cfg.max_tokens,
+        ),
+    )
+
+
+def _schedule(
+    queues: dict[str, list[_WorkItem]],
+    lanes: dict[str, _SystemLane],
+    scheduling: str,
+) -> list[_WorkItem]:
+    """Order work items, which fixes both start order and results.jsonl order.
+
+    ``provider_major`` keeps config order, one system after another. ``round_robin``
+    alternates systems sample by sample. ``weighted`` interleaves in proportion to each
+    system's configured requests_per_minute; systems without an RPM limit get the
+    largest configured weight, and with no limits at all it matches ``round_robin``.
+    """
+    ordered = list(queues.values())
+    if scheduling == "provider_major":
+        return [item for queue in ordered for item in queue]
+    if scheduling == "round_robin":
+        return interleave(ordered)
+    rpms = [lanes[sid].limiter.configured_rpm for sid in queues]
+    fallback = max((rpm for rpm in rpms if rpm), default=1)
+    return interleave(ordered, [float(rpm or fallback) for rpm in rpms])
+
+
+async def _dispatch(
+    items: list[_WorkItem],
+    lanes: dict[str, _SystemLane],
+    execute: Callable[[_WorkItem, int], Coroutine[Any, Any, _WorkOutcome | _RetryRequest]],
+    commit: Callable[[_WorkItem, _WorkOutcome], None],
+    max_in_flight: int,
+    retries: RetryScheduler[_WorkItem],
+    meter: CostMeter,
+    estimate_cost: Callable[[_WorkItem], float],
+    lane_queues: bool = False,
+) -> None:
+    """Start items in order within the global and per-system in-flight limits.
+
+    A retryable failure frees its slot and waits on ``retries``; items whose backoff has
+    elapsed are started ahead of new work. Items of a system whose breaker is open are
+    parked until it lets probes through, so the other systems keep running, and items
+    of a dropped system are skipped. Outcomes are committed strictly in item order and
+    ``commit`` only ever runs on the event loop, so metric updates, cache writes and
+    artifact appends never race and results.jsonl keeps the order a serial run produces.
+
+    Every attempt first reserves ``estimate_cost`` on ``meter``. Once a reservation is
+    refused nothing new starts; in-flight attempts finish, settle their actual cost and
+    whatever completed is committed in item order, leaving the rest for a resumed run.
+    With ``lane_queues`` an item whose system is at its own in-flight limit waits in that
+    system's queue and later items of other systems may start past it, so one saturated
+    provider does not hold back the rest; without it starts stay in strict item order.
+    """
+    completed: dict[int, _WorkOutcome | None] = {}
+    in_flight: dict[asyncio.Task[_WorkOutcome | _RetryRequest], _WorkItem] = {}
+    attempts: dict[int, int] = {}
+    reserved: dict[int, float] = {}
+    # Per-system heaps (by item index) of retries and items parked behind a breaker.
+    parked: dict[str, list[tuple[int, _WorkItem]]] = {sid: [] for sid in lanes}
+    next_start = 0
+    next_commit = 0
+
+    def _try_start(item: _WorkItem) -> Literal["started", "skipped", "park", "full", "blocked"]:
+        if meter.stopped:
+            return "blocked"
+        lane = lanes[item.system_id]
+        state = lane.breaker.state
+        if state == "dropped":
+            lane.skipped += 1
+            completed[item.index] = None
+            return "skipped"
+        if state == "open":
+            return "park"
+        if len(in_flight) >= max_in_flight:
+            return "blocked"
+        if not lane.concurrency.try_acquire():
+            return "full"
+        amount = estimate_cost(item)
+        if not meter.try_reserve(amount):
+            lane.concurrency.release()
+            return "blocked"
+        if not lane.breaker.allow_request():
+            lane.concurrency.release()
+            meter.settle(amount, 0.0)
+            return "park"
+        reserved[item.index] = amount
+        attempts[item.index] = attempts.get(item.index, 0) + 1
+        in_flight[asyncio.create_task(execute(item, attempts[item.index]))] = item
+        return "started"
+
+    def _fill() -> None:
+        nonlocal next_start
+        for item in retries.pop_due():
+            heapq.heappush(parked[item.system_id], (item.index, item))
+        # Parked work is older than anything new, so it goes first.
+        for heap in parked.values():
+            while heap and _try_start(heap[0][1]) in ("started", "skipped"):
+                heapq.heappop(heap)
+        while next_start < len(items):
+            item = items[next_start]
+            status = _try_start(item)
+            if status == "blocked" or (status == "full" and not lane_queues):
+                return
+            if status in ("park", "full"):
+                heapq.heappush(parked[item.system_id], (item.index, item))
+            next_start += 1
+
+    def _next_wakeup() -> float | None:
+        candidates = [retries.seconds_until_next()]
+        candidates.extend(
+            lanes[sid].breaker.seconds_until_probe() for sid, heap in parked.items() if heap
+        )
+        timeouts = [value for value in candidates if value is not None]
+        return min(timeouts) if timeouts else None
+
+    _fill()
+    while in_flight or (not meter.stopped and (len(retries) or any(parked.values()))):
+        if in_flight:
+            done, _ = await asyncio.wait(
+                in_flight, timeout=_next_wakeup(), return_when=asyncio.FIRST_COMPLETED
+            )
+        else:
+            done = set()
+            wakeup = _next_wakeup()
+            await asyncio.sleep(_IDLE_POLL_SECONDS if wakeup is None else wakeup)
+        for task in done:
+            item = in_flight.pop(task)
+            lane = lanes[item.system_id]
+            lane.concurrency.release()
+            result = task.result()
+            amount = reserved.pop(item.index)
+            # Every attempt settles its breaker probe slot, if it took one: a retry fails
+            # the probe and a cache hit hands the slot back.
+            if isinstance(result, _RetryRequest):
+                meter.settle(amount, 0.0)
+                lane.breaker.record_retry()
+                retries.schedule(item, attempts[item.index], result.retry_after)
+                continue
+            meter.settle(amount, 0.0 if result.from_cache else result.cost_usd)
+            if result.from_cache:
+                lane.breaker.release_probe()
+            else:
+                lane.breaker.record(result.error_type is None)
+            completed[item.index] = result
+        while next_commit < len(items) and next_commit in completed:
+            outcome = completed.pop(next_commit)
+            if outcome is not None:
+                commit(items[next_commit], outcome)
+            next_commit += 1
+        _fill()
+    # After a budget stop, gaps are items that never ran; commit what did complete.
+    for index in sorted(completed):
+        outcome = completed[index]
+        if outcome is not None:
+            commit(items[index], outcome)
+
+
+async def _run_items(
+    items: list[_WorkItem],
+    lanes: dict[str, _SystemLane],
+    cache: SQLiteResponseCache | None,
+    commit: Callable[[_WorkItem, _WorkOutcome], None],
+    reliability: ReliabilityPolicy,
+    retries: RetryScheduler[_WorkItem],
+    meter: CostMeter,
+) -> None:
+    """Drive the work items under the configured execution mode.
+
+    ``serial`` and ``parallel`` call the blocking ``generate`` on a worker pool;
+    ``async`` awaits ``agenerate`` directly so every in-flight request shares the event
+    loop instead of holding a thread. ``max_parallel_requests`` caps each system's
+    adaptive limit; without adaptation it stays the global cap as before.
+    """
+    loop = asyncio.get_running_loop()
+    if reliability.execution_mode == "serial":
+        max_in_flight = 1
+    elif reliability.adaptive_concurrency.enabled:
+        max_in_flight = max(1, reliability.max_parallel_requests) * max(1, len(lanes))
+    else:
+        max_in_flight = max(1, reliability.max_parallel_requests)
+    pool: ThreadPoolExecutor | None = None
+    if reliability.execution_mode == "async":
+
+        async def invoke(client: ProviderClient, request: InferenceRequest) -> InferenceResponse:
+            return await client.agenerate(request)
+
+    else:
+        pool = ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix="llm-eval")
+
+        async def invoke(client: ProviderClient, request: InferenceRequest) -> InferenceResponse:
+            return await loop.run_in_executor(pool, client.generate, request)
+
+    async def execute(item: _WorkItem, attempt: int) -> _WorkOutcome | _RetryRequest:
+        return await _execute_item(
+            item, attempt, lanes[item.system_id], invoke, cache, reliability.retry
+        )
+
+    def estimate_cost(item: _WorkItem) -> float:
+        # Cache hits are free; only consult the cache for items that would cost money.
+        amount = _estimated_cost(item, lanes[item.system_id])
+        if amount and cache is not None and cache.has(item.cache_key):
+            return 0.0
+        return amount
+
+    clients = list({id(lane.client): lane.client for lane in lanes.values()}.values())
+    if reliability.execution_mode == "async" and reliability.http.warm_up_connections:
+        await asyncio.gather(
+            *(client.awarm_up() for client in clients if hasattr(client, "awarm_up")),
+            return_exceptions=True,
+        )
+    try:
+        await _dispatch(
+            items,
+            lanes,
+            execute,
+            commit,
+            max_in_flight,
+            retries,
+            meter,
+            estimate_cost,
+            lane_queues=reliability.scheduling != "provider_major",
+        )
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        # Pooled clients stay open for later runs; only loop-bound resources go here.
+        await asyncio.gather(
+            *(client.aclose() for client in clients if hasattr(client, "aclose")),
+            return_exceptions=True,
+        )
+        await aclose_async_transport()
+
+
 def run_evaluation(
     config: RunConfig,
     policy_path: str = "configs/policy.yaml",
@@ -99,14 +515,25 @@ def run_evaluation(
         config.policy = merged_policy
         manifest = build_run_manifest(config)
 
-        random.seed(config.seed)
-        store = ArtifactStore(artifacts_root=artifacts_root, run_id=manifest.run_id)
-        cache = ResponseCache(store.run_dir / "cache")
-        store.write_manifest(manifest.model_dump())
-
         if config.benchmark.name != "mmlu_subset":
             raise NotImplementedError("Current runner supports mmlu_subset only.")
 
+        random.seed(config.seed)
+        store = ArtifactStore(
+            artifacts_root=artifacts_root, run_id=manifest.run_id, policy=config.policy.artifacts
+        )
+        cache_policy = config.policy.cache
+        cache = (
+            SQLiteResponseCache(
+                default_cache_path(artifacts_root, cache_policy),
+                cache_policy,
+                memory=default_memory_tier(cache_policy.memory_max_bytes),
+            )
+            if cache_policy.enabled
+            else None
+        )
+        store.write_manifest(manifest.model_dump())
+
         dataset = MMLUSubsetDataset(
             config.benchmark.dataset_path,
             max_samples=config.benchmark.max_samples,
@@ -114,9 +541,10 @@ def run_evaluation(
         samples = list(dataset.load())
 
         completed_keys = store.load_completed_keys()
+        scoring = ScoringState.open(store.run_dir)
         provider_metrics: dict[str, dict[str, Any]] = {}
         for provider in config.providers:
-            sid = _system_id(provider.provider, provider.model)
+            sid = system_id(provider.provider, provider.model)
             provider_metrics[sid] = {
                 "provider": provider.provider,
                 "model": provider.model,
@@ -124,20 +552,45 @@ def run_evaluation(
                 "errors": 0,
                 "correct": 0,
                 "attempted": 0,
+                "input_tokens": 0,
+                "output_tokens": 0,
+                "cost_usd": 0.0,
             }
 
-        total_requests = 0
-        total_errors = 0
-
+        reliability = config.policy.reliability
+        configure_transport(reliability.http)
+        limiters = RateLimiterRegistry(config.policy.rate_limits)
+        lanes: dict[str, _SystemLane] = {}
+        queues: dict[str, list[_WorkItem]] = {}
+        # Clients built from per-job keys (BYOK) come from their own short-lived pool, so
+        # jobs with the same key share them without those keys reaching the default pool.
+        client_pool = byok_client_pool() if env_overrides else default_client_pool()
         for provider_cfg in config.providers:
-            sid = _system_id(provider_cfg.provider, provider_cfg.model)
-            client = build_provider_client(
-                provider_config=provider_cfg,
-                timeout_seconds=config.policy.reliability.request_timeout_seconds,
+            sid = system_id(provider_cfg.provider, provider_cfg.model)
+            client = client_pool.acquire(
+                provider_cfg, reliability.request_timeout_seconds, build_provider_client
+            )
+            lanes[sid] = _SystemLane(
+                client=client,
+                limiter=limiters.limiter_for(provider_cfg),
+                concurrency=AdaptiveConcurrencyLimit(
+                    reliability.max_parallel_requests, reliability.adaptive_concurrency
+                ),
+                breaker=CircuitBreaker(
+                    window_size=reliability.provider_error_rate_window_size_requests,
+                    threshold_percent=reliability.provider_error_rate_hard_stop_percent,
+                    cooldown_seconds=reliability.provider_error_rate_cooldown_seconds,
+                    probe_requests=reliability.provider_error_rate_probe_requests,
+                    max_open_cycles=reliability.provider_error_rate_max_open_cycles,
+                    enabled=config.policy.budget.enforce_hard_stop,
+                ),
+                price=resolve_price(
+                    provider_cfg.provider, provider_cfg.model, config.policy.budget.pricing
+                ),
             )
             for sample in samples:
                 prompt = sample.prompt()
-                req_key = _request_key(
+                req_key = request_key(
                     provider=provider_cfg.provider,
                     model=provider_cfg.model,
                     sample_id=sample.sample_id,
@@ -147,160 +600,161 @@ def run_evaluation(
                 )
                 if req_key in completed_keys:
                     continue
-
-                provider_metrics[sid]["requests"] += 1
-                provider_metrics[sid]["attempted"] += 1
-                total_requests += 1
-
-                cached = cache.get(req_key)
-                if cached is not None:
-                    response_text = str(cached["text"])
-                    latency_ms = int(cached.get("latency_ms") or 0)
-                    usage = cached.get("usage")
-                else:
-                    attempt = 0
-                    response_text = ""
-                    latency_ms = 0
-                    usage = None
-                    while True:
-                        attempt += 1
-                        try:
-                            response = client.generate(
-                                InferenceRequest(
-                                    prompt=prompt,
-                                    temperature=provider_cfg.temperature,
-                                    max_tokens=provider_cfg.max_tokens,
-                                )
-                            )
-                            response_text = response.text
-                            latency_ms = response.latency_ms or 0
-                            usage = response.usage
-                            cache.set(
-                                req_key,
-                                {
-                                    "text": response_text,
-                                    "latency_ms": latency_ms,
-                                    "usage": usage,
-                                },
-                            )
-                            break
-                        except ProviderHTTPError as exc:
-                            retryable = (
-                                exc.status_code
-                                in config.policy.reliability.retry.retryable_status_codes
-                            )
-                            if (
-                                attempt < config.policy.reliability.retry.max_attempts
-                                and retryable
-                            ):
-                                backoff = config.policy.reliability.retry.backoff_seconds[
-                                    min(
-                                        attempt - 1,
-                                        len(config.policy.reliability.retry.backoff_seconds) - 1,
-                                    )
-                                ]
-                                time.sleep(backoff)
-                                continue
-                            provider_metrics[sid]["errors"] += 1
-                            total_errors += 1
-                            store.append_error(
-                                {
-                                    "run_id": manifest.run_id,
-                                    "provider": provider_cfg.provider,
-                                    "model": provider_cfg.model,
-                                    "sample_id": sample.sample_id,
-                                    "request_key": req_key,
-                                    "error_type": "ProviderHTTPError",
-                                    "error": str(exc),
-                                    "attempt": attempt,
-                                }
-                            )
-                            break
-                        except Exception as exc:  # noqa: BLE001
-                            provider_metrics[sid]["errors"] += 1
-                            total_errors += 1
-                            store.append_error(
-                                {
-                                    "run_id": manifest.run_id,
-                                    "provider": provider_cfg.provider,
-                                    "model": provider_cfg.model,
-                                    "sample_id": sample.sample_id,
-                                    "request_key": req_key,
-                                    "error_type": type(exc).__name__,
-                                    "error": str(exc),
-                                    "attempt": attempt,
-                                }
-                            )
-                            break
-
-                predicted = _extract_option_letter(response_text or "")
-                expected = _correct_letter(sample.answer_index)
-                is_correct = predicted == expected
-                if is_correct:
-                    provider_metrics[sid]["correct"] += 1
-
-                store.append_result(
+                queues.setdefault(sid, []).append(
+                    _WorkItem(
+                        index=0,
+                        provider_cfg=provider_cfg,
+                        system_id=sid,
+                        sample=sample,
+                        prompt=prompt,
+                        request_key=req_key,
+                        cache_key=CacheKey.for_request(
+                            provider=provider_cfg.provider,
+                            model=provider_cfg.model,
+                            prompt=prompt,
+                            temperature=provider_cfg.temperature,
+                            max_tokens=provider_cfg.max_tokens,
+                        ),
+                    )
+                )
+        items = [
+            replace(item, index=index)
+            for index, item in enumerate(_schedule(queues, lanes, reliability.scheduling))
+        ]
+
+        totals = {"requests": 0, "errors": 0}
+
+        def _commit(item: _WorkItem, outcome: _WorkOutcome) -> None:
+            """Record one outcome in results order."""
+            sid = item.system_id
+            provider_metrics[sid]["requests"] += 1
+            provider_metrics[sid]["attempted"] += 1
+            provider_metrics[sid]["input_tokens"] += outcome.input_tokens
+            provider_metrics[sid]["output_tokens"] += outcome.output_tokens
+            provider_metrics[sid]["cost_usd"] += outcome.cost_usd
+            totals["requests"] += 1
+
+            if outcome.error_type is not None:
+                provider_metrics[sid]["errors"] += 1
+                totals["errors"] += 1
+                store.append_error(
                     {
                         "run_id": manifest.run_id,
-                        "system_id": sid,
-                        "provider": provider_cfg.provider,
-                        "model": provider_cfg.model,
-                        "sample_id": sample.sample_id,
-                        "category": sample.category,
-                        "request_key": req_key,
-                        "predicted": predicted,
-                        "expected": expected,
-                        "is_correct": is_correct,
-                        "latency_ms": latency_ms,
-                        "usage": usage,
-                        "response_text": response_text,
+                        "provider": item.provider_cfg.provider,
+                        "model": item.provider_cfg.model,
+                        "sample_id": item.sample.sample_id,
+                        "request_key": item.request_key,
+                        "error_type": outcome.error_type,
+                        "error": outcome.error,
+                        "attempt": outcome.attempt,
                     }
                 )
-
-                requests_for_provider = provider_metrics[sid]["requests"]
-                errors_for_provider = provider_metrics[sid]["errors"]
-                if requests_for_provider > 0:
-                    error_rate_percent = (errors_for_provider / requests_for_provider) * 100
-                    if (
-                        config.policy.budget.enforce_hard_stop
-                        and requests_for_provider
-                        >= config.policy.reliability.provider_error_rate_window_size_requests
-                        and error_rate_percent
-                        > config.policy.reliability.provider_error_rate_hard_stop_percent
-                    ):
-                        _finalize_metrics(provider_metrics)
-                        summary = ExecutionSummary(
-                            run_id=manifest.run_id,
-                            total_requests=total_requests,
-                            total_errors=total_errors,
-                            provider_metrics=provider_metrics,
-                        )
-                        store.write_summary(
-                            {
-                                "run_id": summary.run_id,
-                                "status": "stopped_due_to_error_rate",
-                                "total_requests": summary.total_requests,
-                                "total_errors": summary.total_errors,
-                                "provider_metrics": summary.provider_metrics,
-                            }
-                        )
-                        return summary
-
+            elif not outcome.from_cache and cache is not None:
+                payload = {
+                    "text": outcome.response_text,
+                    "latency_ms": outcome.latency_ms,
+                    "usage": outcome.usage,
+                }
+                if outcome.ttft_ms is not None:
+                    payload["ttft_ms"] = outcome.ttft_ms
+                cache.set(item.cache_key, payload)
+
+            predicted = _extract_option_letter(outcome.response_text or "")
+            expected = _correct_letter(item.sample.answer_index)
+            is_correct = predicted == expected
+            if is_correct:
+                provider_metrics[sid]["correct"] += 1
+
+            record = {
+                "run_id": manifest.run_id,
+                "system_id": sid,
+                "provider": item.provider_cfg.provider,
+                "model": item.provider_cfg.model,
+                "sample_id": item.sample.sample_id,
+                "category": item.sample.category,
+                "request_key": item.request_key,
+                "predicted": predicted,
+                "expected": expected,
+                "is_correct": is_correct,
+                "latency_ms": outcome.latency_ms,
+                "usage": outcome.usage,
+                "input_tokens": outcome.input_tokens,
+                "output_tokens": outcome.output_tokens,
+                "cost_usd": outcome.cost_usd,
+                "from_cache": outcome.from_cache,
+                "response_text": outcome.response_text,
+            }
+            if outcome.ttft_ms is not None:
+                record["ttft_ms"] = outcome.ttft_ms
+            store.append_result(record)
+            scoring.add(record)
+
+        if reliability.http.warm_up_connections and reliability.execution_mode != "async":
+            client_pool.warm_up(lane.client for lane in lanes.values())
+        retries: RetryScheduler[_WorkItem] = RetryScheduler(reliability.retry, seed=config.seed)
+        # Resumed runs start from what earlier attempts of this run_id already paid for.
+        meter = CostMeter(config.policy.budget, spent_usd=store.load_spent_usd())
+        try:
+            asyncio.run(_run_items(items, lanes, cache, _commit, reliability, retries, meter))
+        finally:
+            # Buffered rows reach disk on every exit: completion, budget or error-rate
+            # stops, and KeyboardInterrupt/SIGINT unwinding out of asyncio.run.
+            store.close()
+            scoring.checkpoint()
+            cache_summary: dict[str, Any] | None = None
+            if cache is not None:
+                # Bound the shared store once per run rather than on every write.
+                pruned = cache.prune()
+                cache_summary = {
+                    **cache.stats.as_dict(),
+                    "entries": len(cache),
+                    "memory_entries": len(cache.memory) if cache.memory is not None else 0,
+                    "pruned_expired": pruned.expired,
+                    "pruned_evicted": pruned.evicted,
+                    "pruned_bytes": pruned.freed_bytes,
+                }
+                cache.close()
+
+        for sid, lane in lanes.items():
+            provider_metrics[sid]["concurrency"] = lane.concurrency.snapshot()
+            provider_metrics[sid]["breaker"] = lane.breaker.snapshot()
+            provider_metrics[sid]["skipped"] = lane.skipped
+        # Result counts cover every invocation of this run_id; requests and errors
+        # stay per invocation.
+        run_totals = scoring.scores.result({})["providers"]
+        for sid, metrics in provider_metrics.items():
+            if sid in run_totals:
+                for field in ("attempted", "correct", "input_tokens", "output_tokens", "cost_usd"):
+                    metrics[field] = run_totals[sid][field]
         _finalize_metrics(provider_metrics)
+        dropped = [sid for sid, lane in lanes.items() if lane.breaker.state == "dropped"]
+        if meter.stopped:
+            status = "stopped_due_to_budget"
+        elif dropped and len(dropped) == len(lanes):
+            status = "stopped_due_to_error_rate"
+        elif dropped:
+            status = "completed_with_dropped_systems"
+        else:
+            status = "completed"
 
         summary = ExecutionSummary(
             run_id=manifest.run_id,
-            total_requests=total_requests,
-            total_errors=total_errors,
+            total_requests=totals["requests"],
+            total_errors=totals["errors"],
             provider_metrics=provider_metrics,
         )
         store.write_summary(
             {
                 "run_id": summary.run_id,
-                "status": "completed",
+                "status": status,
                 "total_requests": summary.total_requests,
                 "total_errors": summary.total_errors,
                 "provider_metrics": summary.provider_metrics,
+                "rate_limits": limiters.snapshot(),
+                "retries_scheduled": retries.scheduled,
+                "budget": meter.snapshot(),
+                "cache": cache_summary,
             }
         )
+        write_columnar(store.run_dir)
         return summary
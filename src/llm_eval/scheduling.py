@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+def interleave(queues: Sequence[Sequence[T]], weights: Sequence[float] | None = None) -> list[T]:
+    """Merge per-provider queues into one order, round-robin or smooth weighted round-robin.
+
+    Without ``weights`` the queues take turns. With weights, each step every non-empty
+    queue gains its weight in credit and the queue with the most credit (first queue on
+    ties) emits its next item and pays back the total weight of the non-empty queues, so
+    weights 3:1 give ``A A B A A A B A ...`` spread evenly rather than in bursts. The order
+    depends only on the inputs, so it is as deterministic as provider-major iteration.
+    """
+    if weights is None:
+        # Plain cycle; exhausted queues simply drop out of the rotation.
+        depth = max((len(queue) for queue in queues), default=0)
+        return [queue[row] for row in range(depth) for queue in queues if row < len(queue)]
+    if len(weights) != len(queues):
+        raise ValueError("weights must match queues")
+    positions = [0] * len(queues)
+    credit = [0.0] * len(queues)
+    merged: list[T] = []
+    total = sum(len(queue) for queue in queues)
+    while len(merged) < total:
+        active = [i for i, queue in enumerate(queues) if positions[i] < len(queue)]
+        for i in active:
+            credit[i] += max(weights[i], 1e-9)
+        chosen = max(active, key=lambda i: (credit[i], -i))
+        credit[chosen] -= sum(max(weights[i], 1e-9) for i in active)
+        merged.append(queues[chosen][positions[chosen]])
+        positions[chosen] += 1
+    return merged
@@ -1,21 +1,37 @@
 from __future__ import annotations
 
 import json
-from collections import defaultdict
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
+from llm_eval import vectorized
+from llm_eval.columnar import load_rows
+from llm_eval.sketch import LatencySketch
+from llm_eval.stats import PairwiseAccumulator, add_confidence_intervals
+from llm_eval.storage import atomic_write_text, iter_jsonl
 
-def load_results(run_dir: str | Path) -> list[dict[str, Any]]:
-    path = Path(run_dir) / "results.jsonl"
-    if not path.exists():
-        return []
-    rows: list[dict[str, Any]] = []
-    with path.open("r", encoding="utf-8") as file:
-        for line in file:
-            if line.strip():
-                rows.append(json.loads(line))
-    return rows
+# Fields ``score_results`` reads; pass them to ``load_results`` to skip response text.
+SCORING_COLUMNS = (
+    "system_id",
+    "provider",
+    "model",
+    "category",
+    "is_correct",
+    "latency_ms",
+    "input_tokens",
+    "output_tokens",
+    "cost_usd",
+)
+
+
+def load_results(
+    run_dir: str | Path, columns: Iterable[str] | None = None
+) -> list[dict[str, Any]]:
+    """Result rows; with ``columns``, only those fields, read from the columnar store."""
+    if columns is not None:
+        return load_rows(run_dir, columns)
+    return list(iter_jsonl(Path(run_dir) / "results.jsonl"))
 
 
 def load_summary(run_dir: str | Path) -> dict[str, Any]:
@@ -25,6 +41,20 @@ def load_summary(run_dir: str | Path) -> dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def _manifest_systems(run_dir: Path) -> list[str] | None:
+    """``provider:model`` ids from the run's manifest.json, or None without one."""
+    path = run_dir / "manifest.json"
+    if not path.exists():
+        return None
+    try:
+        manifest = json.loads(path.read_text(encoding="utf-8"))
+        return sorted(
+            f"{provider['provider']}:{provider['model']}" for provider in manifest["providers"]
+        )
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
 def _resolve_system_id(row: dict[str, Any]) -> str:
     if row.get("system_id"):
         return str(row["system_id"])
@@ -33,54 +63,327 @@ def _resolve_system_id(row: dict[str, Any]) -> str:
     return f"{provider}:{model}"
 
 
-def score_results(results: list[dict[str, Any]], summary: dict[str, Any]) -> dict[str, Any]:
-    by_system: dict[str, dict[str, Any]] = defaultdict(
-        lambda: {
-            "provider": "",
-            "model": "",
-            "attempted": 0,
-            "correct": 0,
-            "accuracy": 0.0,
-            "avg_latency_ms": 0.0,
-            "categories": defaultdict(lambda: {"attempted": 0, "correct": 0, "accuracy": 0.0}),
-        }
-    )
+def _new_bucket() -> dict[str, Any]:
+    return {
+        "attempted": 0,
+        "correct": 0,
+        "latency_ms": 0.0,
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "cost_usd": 0.0,
+        "categories": {},
+        "latency": LatencySketch(),
+        "ttft": LatencySketch(),
+        "category_latency": {},
+    }
 
-    for row in results:
+
+class ScoreAccumulator:
+    """Running per-system and per-category totals behind ``score_results``.
+
+    Rows are folded in one at a time, so state grows with systems x categories and
+    never with the number of rows: latency and time-to-first-token percentiles come
+    from fixed-size ``LatencySketch`` histograms rather than the raw values.
+    """
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self._systems: dict[str, dict[str, Any]] = {}
+
+    def add(self, row: dict[str, Any]) -> None:
+        self.rows += 1
         system_id = _resolve_system_id(row)
-        provider = str(row.get("provider", "unknown"))
-        model = str(row.get("model", "unknown"))
         is_correct = bool(row.get("is_correct", False))
-        category = str(row.get("category", "unknown"))
+        bucket = self._systems.get(system_id)
+        if bucket is None:
+            bucket = self._systems[system_id] = _new_bucket()
+        bucket["provider"] = str(row.get("provider", "unknown"))
+        bucket["model"] = str(row.get("model", "unknown"))
+        bucket["attempted"] += 1
+        bucket["correct"] += int(is_correct)
         latency = float(row.get("latency_ms") or 0)
+        bucket["latency_ms"] += latency
+        bucket["latency"].add(latency)
+        if row.get("ttft_ms") is not None:
+            bucket["ttft"].add(float(row["ttft_ms"]))
+        bucket["input_tokens"] += int(row.get("input_tokens") or 0)
+        bucket["output_tokens"] += int(row.get("output_tokens") or 0)
+        bucket["cost_usd"] += float(row.get("cost_usd") or 0.0)
+        category_name = str(row.get("category", "unknown"))
+        category = bucket["categories"].setdefault(category_name, [0, 0])
+        category[0] += 1
+        category[1] += int(is_correct)
+        category_latency = bucket["category_latency"].get(category_name)
+        if category_latency is None:
+            category_latency = bucket["category_latency"][category_name] = LatencySketch()
+        category_latency.add(latency)
 
-        system_bucket = by_system[system_id]
-        system_bucket["provider"] = provider
-        system_bucket["model"] = model
-        system_bucket["attempted"] += 1
-        system_bucket["correct"] += int(is_correct)
-        system_bucket["avg_latency_ms"] += latency
+    def merge(self, other: ScoreAccumulator) -> None:
+        """Fold in another accumulator, e.g. one per shard or per run of a sweep."""
+        self.rows += other.rows
+        for system_id, theirs in other._systems.items():
+            bucket = self._systems.get(system_id)
+            if bucket is None:
+                bucket = self._systems[system_id] = _new_bucket()
+            bucket["provider"] = theirs["provider"]
+            bucket["model"] = theirs["model"]
+            for key in ("attempted", "correct", "latency_ms", "input_tokens", "output_tokens"):
+                bucket[key] += theirs[key]
+            bucket["cost_usd"] += theirs["cost_usd"]
+            for name, (attempted, correct) in theirs["categories"].items():
+                category = bucket["categories"].setdefault(name, [0, 0])
+                category[0] += attempted
+                category[1] += correct
+            bucket["latency"].merge(theirs["latency"])
+            bucket["ttft"].merge(theirs["ttft"])
+            for name, sketch in theirs["category_latency"].items():
+                bucket["category_latency"].setdefault(name, LatencySketch()).merge(sketch)
 
-        category_bucket = system_bucket["categories"][category]
-        category_bucket["attempted"] += 1
-        category_bucket["correct"] += int(is_correct)
+    def to_dict(self) -> dict[str, Any]:
+        systems = {}
+        for system_id, bucket in self._systems.items():
+            systems[system_id] = {
+                **bucket,
+                "latency": bucket["latency"].to_dict(),
+                "ttft": bucket["ttft"].to_dict(),
+                "category_latency": {
+                    name: sketch.to_dict() for name, sketch in bucket["category_latency"].items()
+                },
+            }
+        return {"rows": self.rows, "systems": systems}
 
-    for system_id, metrics in by_system.items():
-        attempted = metrics["attempted"]
-        metrics["accuracy"] = (metrics["correct"] / attempted) if attempted else 0.0
-        metrics["avg_latency_ms"] = (metrics["avg_latency_ms"] / attempted) if attempted else 0.0
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ScoreAccumulator:
+        accumulator = cls()
+        accumulator.rows = int(data["rows"])
+        for system_id, bucket in data["systems"].items():
+            accumulator._systems[system_id] = {
+                **bucket,
+                "latency": LatencySketch.from_dict(bucket["latency"]),
+                "ttft": LatencySketch.from_dict(bucket["ttft"]),
+                "category_latency": {
+                    name: LatencySketch.from_dict(sketch)
+                    for name, sketch in bucket["category_latency"].items()
+                },
+            }
+        return accumulator
 
-        metrics["errors"] = int(summary.get("provider_metrics", {}).get(system_id, {}).get("errors", 0))
+    def result(self, summary: dict[str, Any]) -> dict[str, Any]:
+        """The ``score_results`` payload for everything added so far."""
+        errors = summary.get("provider_metrics", {})
+        providers: dict[str, dict[str, Any]] = {}
+        for system_id, bucket in self._systems.items():
+            attempted = bucket["attempted"]
+            correct = bucket["correct"]
+            providers[system_id] = {
+                "provider": bucket["provider"],
+                "model": bucket["model"],
+                "attempted": attempted,
+                "correct": correct,
+                "accuracy": (correct / attempted) if attempted else 0.0,
+                "avg_latency_ms": (bucket["latency_ms"] / attempted) if attempted else 0.0,
+                **bucket["latency"].quantiles("latency"),
+                **bucket["ttft"].quantiles("ttft"),
+                "input_tokens": bucket["input_tokens"],
+                "output_tokens": bucket["output_tokens"],
+                "cost_usd": bucket["cost_usd"],
+                "categories": {
+                    name: {
+                        "attempted": cat_attempted,
+                        "correct": cat_correct,
+                        "accuracy": (cat_correct / cat_attempted) if cat_attempted else 0.0,
+                        **bucket["category_latency"][name].quantiles("latency"),
+                    }
+                    for name, (cat_attempted, cat_correct) in bucket["categories"].items()
+                },
+                "cost_per_correct_usd": (bucket["cost_usd"] / correct) if correct else None,
+                "errors": int(errors.get(system_id, {}).get("errors", 0)),
+            }
+        return {
+            "providers": providers,
+            "total_rows": self.rows,
+            "total_cost_usd": sum(metrics["cost_usd"] for metrics in providers.values()),
+            "status": summary.get("status", "unknown"),
+        }
 
-        for cat_name, cat in metrics["categories"].items():
-            cat_attempted = cat["attempted"]
-            cat["accuracy"] = (cat["correct"] / cat_attempted) if cat_attempted else 0.0
-            metrics["categories"][cat_name] = dict(cat)
 
-        metrics["categories"] = dict(metrics["categories"])
+def score_results(results: Iterable[dict[str, Any]], summary: dict[str, Any]) -> dict[str, Any]:
+    if vectorized.should_vectorize(results):
+        state = vectorized.score_state(results)
+        return ScoreAccumulator.from_dict(state).result(summary)
+    accumulator = ScoreAccumulator()
+    for row in results:
+        accumulator.add(row)
+    return accumulator.result(summary)
 
-    return {
-        "providers": dict(by_system),
-        "total_rows": len(results),
-        "status": summary.get("status", "unknown"),
-    }
+
+SCORING_STATE_FILE = "scoring_state.json"
+SCORING_STATE_VERSION = 3
+# Rows ``catch_up`` parses before folding them in, which lets a long backlog (e.g. a
+# full rebuild) go through the array engine while memory stays bounded.
+CATCH_UP_BATCH_ROWS = 50_000
+_STATE_COLUMNS = (*SCORING_COLUMNS, "sample_id", "ttft_ms")
+
+
+class ScoringState:
+    """Persisted score and pairwise accumulators for one run, kept next to its results.
+
+    ``scoring_state.json`` records how many bytes of ``results.jsonl`` it covers, so
+    opening the state only folds in rows appended since it was saved. The runner also
+    ``add``s every row it appends and ``checkpoint``s when it closes the store; if the
+    file gained other rows in the meantime, the in-memory rows are discarded and the
+    state catches up from the file instead. A results file shorter than the covered
+    offset (rewritten or truncated) triggers a rebuild from the start.
+
+    ``systems`` (by default the run's manifest providers) lets the pairwise accumulator
+    pack each sample into one integer once every system has answered it, so the state
+    stays small while a later duplicate row can still replace an earlier answer.
+    """
+
+    def __init__(self, run_dir: str | Path, systems: Iterable[str] | None = None):
+        self.run_dir = Path(run_dir)
+        self.path = self.run_dir / SCORING_STATE_FILE
+        self.results_path = self.run_dir / "results.jsonl"
+        self.systems = sorted(systems) if systems is not None else _manifest_systems(self.run_dir)
+        self._reset()
+
+    def _reset(self) -> None:
+        self.offset = 0
+        self.scores = ScoreAccumulator()
+        self.pairs = PairwiseAccumulator(self.systems)
+        self._unsynced = 0
+        self._dirty = False
+
+    @classmethod
+    def open(cls, run_dir: str | Path, systems: Iterable[str] | None = None) -> ScoringState:
+        state = cls(run_dir, systems)
+        state._load()
+        state.catch_up()
+        return state
+
+    def _load(self) -> None:
+        self._reset()
+        if not self.path.exists():
+            return
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") != SCORING_STATE_VERSION:
+                return
+            if data["pairs"]["expected"] != self.systems:
+                return  # saved for another system list; rebuild
+            self.scores = ScoreAccumulator.from_dict(data["scores"])
+            self.pairs = PairwiseAccumulator.from_dict(data["pairs"])
+            self.offset = int(data["offset"])
+        except (ValueError, KeyError, TypeError):
+            self._reset()
+
+    def _fold(self, rows: list[dict[str, Any]]) -> None:
+        if vectorized.should_vectorize(rows):
+            self.scores.merge(ScoreAccumulator.from_dict(vectorized.score_state(rows)))
+        else:
+            for row in rows:
+                self.scores.add(row)
+        self.pairs.add_batch(rows)
+
+    def add(self, row: dict[str, Any]) -> None:
+        """Fold in a row that has just been appended to results.jsonl."""
+        self.scores.add(row)
+        self.pairs.add(row)
+        self._unsynced += 1
+        self._dirty = True
+
+    def catch_up(self) -> int:
+        """Fold in complete rows past ``offset``; returns how many were read."""
+        size = self.results_path.stat().st_size if self.results_path.exists() else 0
+        if size < self.offset:
+            self._reset()
+            self._dirty = True
+        folded = 0
+        if size == self.offset:
+            return folded
+        batch: list[dict[str, Any]] = []
+        with self.results_path.open("rb") as file:
+            file.seek(self.offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break  # torn tail; the next append cuts it
+                self.offset += len(line)
+                try:
+                    row = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(row, dict):
+                    batch.append({name: row[name] for name in _STATE_COLUMNS if name in row})
+                    folded += 1
+                    if len(batch) >= CATCH_UP_BATCH_ROWS:
+                        self._fold(batch)
+                        batch = []
+        self._fold(batch)
+        self._dirty = self._dirty or folded > 0
+        return folded
+
+    def _complete_lines_after(self, offset: int) -> tuple[int, int]:
+        if not self.results_path.exists():
+            return 0, offset
+        lines = 0
+        end = offset
+        with self.results_path.open("rb") as file:
+            file.seek(offset)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    break
+                lines += 1
+                end += len(line)
+        return lines, end
+
+    def checkpoint(self) -> None:
+        """Persist the state once the results file holds every ``add``ed row."""
+        if self._unsynced:
+            lines, end = self._complete_lines_after(self.offset)
+            if lines == self._unsynced:
+                self.offset = end
+                self._unsynced = 0
+            else:
+                self._load()
+                self._dirty = True
+        self.catch_up()
+        if not self._dirty:
+            return
+        atomic_write_text(
+            self.path,
+            json.dumps(
+                {
+                    "version": SCORING_STATE_VERSION,
+                    "offset": self.offset,
+                    "scores": self.scores.to_dict(),
+                    "pairs": self.pairs.to_dict(),
+                },
+                separators=(",", ":"),
+            ),
+        )
+        self._dirty = False
+
+    def report(self, summary: dict[str, Any]) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+        return add_confidence_intervals(self.scores.result(summary)), self.pairs.comparisons()
+
+
+def merge_run_scores(run_dirs: Iterable[str | Path]) -> ScoreAccumulator:
+    """One accumulator over several runs or shards, e.g. latency percentiles for a sweep."""
+    merged = ScoreAccumulator()
+    for run_dir in run_dirs:
+        merged.merge(ScoringState.open(run_dir).scores)
+    return merged
+
+
+def score_run(run_dir: str | Path) -> tuple[dict[str, Any], list[dict[str, Any]]]:
+    """Scores with Wilson intervals and pairwise tests for a run.
+
+    Starts from the run's ``ScoringState`` and reads only rows appended since it was
+    last saved, then saves it again; a read-only run directory is scored without saving.
+    """
+    state = ScoringState.open(run_dir)
+    try:
+        state.checkpoint()
+    except OSError:
+        pass
+    return state.report(load_summary(run_dir))
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import math
+from typing import Any
+
+# Log-linear buckets in the style of an HDR histogram: every power of two is split into
+# SUB_BUCKETS equal-width buckets, so a bucket's midpoint is within 1 / (2 * SUB_BUCKETS)
+# (under 0.8%) of any value in it. Values are clamped to [MIN_VALUE_MS, MAX_VALUE_MS], 34
+# powers of two, which caps a sketch at 34 * SUB_BUCKETS + 1 buckets however many values
+# it holds.
+SUB_BUCKETS = 64
+MIN_VALUE_MS = 2.0**-10
+MAX_VALUE_MS = 2.0**24
+
+# Quantiles shown in reports.
+REPORT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+def bucket_index(value: float) -> int:
+    """Bucket of a positive value: ``exponent * SUB_BUCKETS + linear step in the octave``."""
+    mantissa, exponent = math.frexp(min(max(value, MIN_VALUE_MS), MAX_VALUE_MS))
+    return exponent * SUB_BUCKETS + int((mantissa - 0.5) * 2 * SUB_BUCKETS)
+
+
+def bucket_midpoint(index: int) -> float:
+    exponent, step = divmod(index, SUB_BUCKETS)
+    return math.ldexp(0.5 + (step + 0.5) / (2 * SUB_BUCKETS), exponent)
+
+
+class LatencySketch:
+    """Mergeable fixed-size histogram of latencies in milliseconds.
+
+    ``quantile`` answers within the bucket precision, clamped to the exact minimum and
+    maximum seen. Two sketches merge by adding bucket counts, so per-shard or per-run
+    sketches combine into the same sketch as one pass over all their values.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.zeros = 0
+        self.min: float | None = None
+        self.max: float | None = None
+        self.buckets: dict[int, int] = {}
+
+    def add(self, value: float) -> None:
+        value = float(value)
+        self.count += 1
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if value <= 0:
+            self.zeros += 1
+            return
+        index = bucket_index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def merge(self, other: LatencySketch) -> None:
+        if not other.count:
+            return
+        self.count += other.count
+        self.zeros += other.zeros
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+        if other.max is not None:
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def quantile(self, q: float) -> float | None:
+        """Nearest-rank ``q`` quantile, or None for an empty sketch."""
+        if not self.count:
+            return None
+        rank = min(self.count, max(1, math.ceil(round(q * self.count, 9))))
+        if rank <= self.zeros:
+            return 0.0
+        seen = self.zeros
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(max(bucket_midpoint(index), self.min or 0.0), self.max or 0.0)
+        return self.max
+
+    def quantiles(self, prefix: str) -> dict[str, float | None]:
+        """``{"<prefix>_p50_ms": ..., ...}`` for ``REPORT_QUANTILES``."""
+        return {
+            f"{prefix}_p{round(q * 100)}_ms": self.quantile(q) for q in REPORT_QUANTILES
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        indexes = sorted(self.buckets)
+        return {
+            "count": self.count,
+            "zeros": self.zeros,
+            "min": self.min,
+            "max": self.max,
+            "indexes": indexes,
+            "counts": [self.buckets[index] for index in indexes],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LatencySketch:
+        sketch = cls()
+        sketch.count = int(data["count"])
+        sketch.zeros = int(data["zeros"])
+        sketch.min = None if data["min"] is None else float(data["min"])
+        sketch.max = None if data["max"] is None else float(data["max"])
+        sketch.buckets = {
+            int(index): int(count) for index, count in zip(data["indexes"], data["counts"])
+        }
+        return sketch
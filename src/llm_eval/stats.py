@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from collections import defaultdict
-from math import comb, sqrt
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
+from math import exp, lgamma, log, log1p, sqrt
 from typing import Any
 
+from llm_eval import vectorized
+
 
 def wilson_confidence_interval(successes: int, total: int, z: float = 1.96) -> tuple[float, float]:
     if total <= 0:
@@ -25,57 +28,210 @@ def add_confidence_intervals(scored: dict[str, Any]) -> dict[str, Any]:
     return scored
 
 
+@lru_cache(maxsize=64)
+def _binomial_pmf(n: int, p: float) -> tuple[float, ...]:
+    """P(X = i) for i in 0..n, evaluated in log space so large n cannot overflow."""
+    if not 0.0 < p < 1.0:
+        return tuple(float(i == round(n * p)) for i in range(n + 1))
+    log_p, log_q, log_n = log(p), log1p(-p), lgamma(n + 1)
+    return tuple(
+        exp(log_n - lgamma(i + 1) - lgamma(n - i + 1) + i * log_p + (n - i) * log_q)
+        for i in range(n + 1)
+    )
+
+
+def _fair_coin_tail(k: int, n: int) -> list[float]:
+    """Terms P(X = i) <= P(X = k) + 1e-15 for p = 0.5, in order of i.
+
+    The distribution is symmetric and increases up to n // 2, so the included terms
+    are a lower tail and its mirror; only that tail is computed. Each term is
+    ``comb(n, i) / 2**n`` in exact integer arithmetic, which rounds once and therefore
+    equals the float product ``comb(n, i) * 0.5**i * 0.5**(n - i)`` wherever that
+    product does not overflow.
+    """
+    observed_index = min(k, n - k)
+    denominator = 2**n
+    half = n // 2
+    tail: list[float] = []
+    threshold = float("inf")
+    coefficient = 1
+    for i in range(half + 1):
+        term = coefficient / denominator
+        if i == observed_index:
+            threshold = term + 1e-15
+        if term > threshold:
+            return tail + tail[::-1]
+        tail.append(term)
+        coefficient = coefficient * (n - i) // (i + 1)
+    return tail + tail[: n - half][::-1]
+
+
+@lru_cache(maxsize=4096)
 def _binomial_two_sided_p_value(k: int, n: int, p: float = 0.5) -> float:
     if n <= 0:
         return 1.0
-    observed_prob = comb(n, k) * (p**k) * ((1 - p) ** (n - k))
+    if p == 0.5:
+        included = _fair_coin_tail(k, n)
+    else:
+        pmf = _binomial_pmf(n, p)
+        included = [prob for prob in pmf if prob <= pmf[k] + 1e-15]
     cumulative = 0.0
-    for i in range(n + 1):
-        prob = comb(n, i) * (p**i) * ((1 - p) ** (n - i))
-        if prob <= observed_prob + 1e-15:
-            cumulative += prob
+    for prob in included:
+        cumulative += prob
     return min(1.0, cumulative)
 
 
-def pairwise_significance(results: list[dict[str, Any]]) -> list[dict[str, Any]]:
-    by_provider_sample: dict[str, dict[str, bool]] = defaultdict(dict)
-    for row in results:
-        provider = str(row.get("system_id") or f"{row.get('provider')}:{row.get('model')}")
+class PairwiseAccumulator:
+    """Paired win/tie counts for every system pair, updated one result row at a time.
+
+    A row is compared with the other systems' answers to the same sample as it
+    arrives, so nothing per row is kept beyond those answers. When ``systems`` names
+    every system in the stream, a sample that exactly those systems have answered is
+    packed into one integer of correctness bits; otherwise answers are kept as they
+    are. A repeated (system, sample) row replaces the earlier answer, as it did when
+    rows were collected into a dict, including after the sample was packed.
+    """
+
+    def __init__(self, systems: Iterable[str] | None = None):
+        self._expected = frozenset(systems) if systems is not None else None
+        self._order = sorted(self._expected or ())
+        self._systems: set[str] = set()
+        self._pending: dict[str, dict[str, bool]] = {}
+        # sample -> bit i set when system ``_order[i]`` answered it correctly
+        self._finished: dict[str, int] = {}
+        # (system_a, system_b) with a < b -> [wins_a, wins_b, ties]
+        self._counts: dict[tuple[str, str], list[int]] = {}
+
+    def add(self, row: dict[str, Any]) -> None:
+        system = str(row.get("system_id") or f"{row.get('provider')}:{row.get('model')}")
         sample_id = str(row.get("sample_id"))
-        by_provider_sample[provider][sample_id] = bool(row.get("is_correct", False))
-
-    providers = sorted(by_provider_sample.keys())
-    comparisons: list[dict[str, Any]] = []
-    for i in range(len(providers)):
-        for j in range(i + 1, len(providers)):
-            left = providers[i]
-            right = providers[j]
-            left_samples = by_provider_sample[left]
-            right_samples = by_provider_sample[right]
-            shared_ids = sorted(set(left_samples.keys()) & set(right_samples.keys()))
-            wins_left = 0
-            wins_right = 0
-            ties = 0
-            for sample_id in shared_ids:
-                left_correct = left_samples[sample_id]
-                right_correct = right_samples[sample_id]
-                if left_correct == right_correct:
-                    ties += 1
-                elif left_correct and not right_correct:
-                    wins_left += 1
-                elif right_correct and not left_correct:
-                    wins_right += 1
-            non_ties = wins_left + wins_right
-            p_value = _binomial_two_sided_p_value(max(wins_left, wins_right), non_ties)
-            comparisons.append(
-                {
-                    "provider_a": left,
-                    "provider_b": right,
-                    "wins_a": wins_left,
-                    "wins_b": wins_right,
-                    "ties": ties,
-                    "non_ties": non_ties,
-                    "p_value_two_sided": p_value,
-                }
+        correct = bool(row.get("is_correct", False))
+        self._systems.add(system)
+        answers = self._pending.get(sample_id)
+        if answers is None:
+            # A late row for a packed sample reopens it with the answers it had.
+            answers = self._unpack(self._finished.pop(sample_id, None))
+            self._pending[sample_id] = answers
+        previous = answers.get(system)
+        for other, other_correct in answers.items():
+            if other == system:
+                continue
+            if previous is not None:
+                self._tally(system, previous, other, other_correct, -1)
+            self._tally(system, correct, other, other_correct, 1)
+        answers[system] = correct
+        if answers.keys() == self._expected:
+            self._finished[sample_id] = sum(
+                1 << bit for bit, name in enumerate(self._order) if answers[name]
             )
-    return comparisons
+            del self._pending[sample_id]
+
+    def _unpack(self, mask: int | None) -> dict[str, bool]:
+        if mask is None:
+            return {}
+        return {name: bool(mask >> bit & 1) for bit, name in enumerate(self._order)}
+
+    def add_batch(self, rows: Sequence[dict[str, Any]]) -> None:
+        """``add`` every row, through the array engine when the batch is large enough.
+
+        Rows for samples already seen go through ``add``; the rest are counted from
+        the batch's correctness matrix, where the last row for a (system, sample) wins.
+        """
+        if not vectorized.should_vectorize(rows):
+            for row in rows:
+                self.add(row)
+            return
+        fresh = []
+        for row in rows:
+            sample_id = str(row.get("sample_id"))
+            if sample_id in self._pending or sample_id in self._finished:
+                self.add(row)
+            else:
+                fresh.append(row)
+        if not fresh:
+            return
+        names, counts, pending, finished = vectorized.pairwise_state(fresh, self._expected)
+        self._systems.update(names)
+        for pair, (wins_a, wins_b, ties) in counts.items():
+            total = self._counts.setdefault(pair, [0, 0, 0])
+            total[0] += wins_a
+            total[1] += wins_b
+            total[2] += ties
+        self._pending.update(pending)
+        self._finished.update(finished)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "expected": None if self._expected is None else sorted(self._expected),
+            "systems": sorted(self._systems),
+            "answers": self._pending,
+            "finished": self._finished,
+            "counts": [[*pair, *counts] for pair, counts in self._counts.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PairwiseAccumulator:
+        accumulator = cls(data["expected"])
+        accumulator._systems = set(data["systems"])
+        accumulator._pending = {
+            str(sample): {str(system): bool(correct) for system, correct in answers.items()}
+            for sample, answers in data["answers"].items()
+        }
+        accumulator._finished = {
+            str(sample): int(mask) for sample, mask in data["finished"].items()
+        }
+        accumulator._counts = {(a, b): [wa, wb, ties] for a, b, wa, wb, ties in data["counts"]}
+        return accumulator
+
+    def _tally(
+        self, system: str, correct: bool, other: str, other_correct: bool, step: int
+    ) -> None:
+        if system > other:
+            system, other, correct, other_correct = other, system, other_correct, correct
+        counts = self._counts.setdefault((system, other), [0, 0, 0])
+        if correct == other_correct:
+            counts[2] += step
+        elif correct:
+            counts[0] += step
+        else:
+            counts[1] += step
+
+    def comparisons(self) -> list[dict[str, Any]]:
+        """The ``pairwise_significance`` payload for everything added so far."""
+        systems = sorted(self._systems)
+        comparisons: list[dict[str, Any]] = []
+        for i, left in enumerate(systems):
+            for right in systems[i + 1 :]:
+                wins_left, wins_right, ties = self._counts.get((left, right), (0, 0, 0))
+                non_ties = wins_left + wins_right
+                p_value = _binomial_two_sided_p_value(max(wins_left, wins_right), non_ties)
+                comparisons.append(
+                    {
+                        "provider_a": left,
+                        "provider_b": right,
+                        "wins_a": wins_left,
+                        "wins_b": wins_right,
+                        "ties": ties,
+                        "non_ties": non_ties,
+                        "p_value_two_sided": p_value,
+                    }
+                )
+        return comparisons
+
+
+def pairwise_significance(results: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    if vectorized.should_vectorize(results):
+        systems, counts = vectorized.pairwise_counts(results)
+        return PairwiseAccumulator.from_dict(
+            {
+                "expected": None,
+                "systems": systems,
+                "answers": {},
+                "finished": {},
+                "counts": [[*pair, *pair_counts] for pair, pair_counts in counts.items()],
+            }
+        ).comparisons()
+    accumulator = PairwiseAccumulator()
+    for row in results:
+        accumulator.add(row)
+    return accumulator.comparisons()
@@ -1,45 +1,296 @@
 from __future__ import annotations
 
+import atexit
 import json
+import os
+import sqlite3
+import tempfile
+import threading
+import weakref
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import IO, TYPE_CHECKING, Any
+
+from llm_eval.config import ArtifactPolicy
+from llm_eval.registry import RunRegistry, default_registry_path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows has no fcntl; threads are still serialised
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+_APPEND_LOCK = threading.Lock()
+
+
+def atomic_write_text(path: str | Path, text: str) -> None:
+    """Write via a same-directory temp file and rename; readers never see a partial file."""
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+@contextmanager
+def _exclusive(file: IO[Any]) -> Iterator[None]:
+    """Advisory lock held across processes (POSIX) and threads of this process."""
+    with _APPEND_LOCK:
+        if fcntl is None:
+            yield
+            return
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+
+def _repair_tail(file: IO[bytes]) -> int:
+    """Truncate a torn (newline-less) last line left by a killed writer; returns bytes cut."""
+    file.seek(0, os.SEEK_END)
+    size = file.tell()
+    if size == 0:
+        return 0
+    file.seek(size - 1)
+    if file.read(1) == b"\n":
+        return 0
+    chunk = 4096
+    position = size
+    while position > 0:
+        start = max(0, position - chunk)
+        file.seek(start)
+        data = file.read(position - start)
+        newline = data.rfind(b"\n")
+        if newline != -1:
+            keep = start + newline + 1
+            file.truncate(keep)
+            return size - keep
+        position = start
+    file.truncate(0)
+    return size
+
+
+def _append_lines(path: Path, data: bytes, fsync: bool) -> None:
+    with path.open("a+b") as file, _exclusive(file):
+        _repair_tail(file)
+        file.seek(0, os.SEEK_END)
+        file.write(data)
+        file.flush()
+        if fsync:
+            os.fsync(file.fileno())
+
+
+def _encode(record: dict[str, Any]) -> bytes:
+    return (json.dumps(record, ensure_ascii=True) + "\n").encode("utf-8")
+
+
+def append_jsonl(path: str | Path, record: dict[str, Any], fsync: bool = False) -> None:
+    """Append one record as a single write under an exclusive lock.
+
+    Any torn trailing line is cut first, so a crash never glues two records together
+    and concurrent writers (threads or processes) never interleave.
+    """
+    _append_lines(Path(path), _encode(record), fsync)
+
+
+_OPEN_WRITERS: weakref.WeakSet[BufferedJsonlWriter] = weakref.WeakSet()
+
+
+def _close_open_writers() -> None:
+    for writer in list(_OPEN_WRITERS):
+        writer.close()
+
+
+atexit.register(_close_open_writers)
+
+
+class BufferedJsonlWriter:
+    """Batches JSONL records in memory and appends them from a background thread.
+
+    A batch is written (as one locked ``append_jsonl``-style write) once
+    ``flush_max_records`` records are pending or ``flush_interval_seconds`` after the
+    first of them, and always on ``flush``/``close``. ``durability`` decides when data
+    is fsynced: ``per_record`` bypasses the buffer and syncs every record, ``batched``
+    syncs each batch, ``on_close`` only on ``close``. Writers still open at interpreter
+    exit are closed by an ``atexit`` hook.
+    """
+
+    def __init__(self, path: str | Path, policy: ArtifactPolicy):
+        self.path = Path(path)
+        self.policy = policy
+        self._pending: list[bytes] = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        if policy.durability != "per_record":
+            self._thread = threading.Thread(
+                target=self._run, name=f"jsonl-writer:{self.path.name}", daemon=True
+            )
+            self._thread.start()
+        _OPEN_WRITERS.add(self)
+
+    def write(self, record: dict[str, Any]) -> None:
+        line = _encode(record)
+        if self.policy.durability == "per_record":
+            with self._write_lock:
+                _append_lines(self.path, line, fsync=True)
+            return
+        with self._lock:
+            if self._closed:
+                raise ValueError(f"{self.path} writer is closed")
+            self._pending.append(line)
+            if len(self._pending) >= self.policy.flush_max_records:
+                self._wake.notify()
+
+    def _run(self) -> None:
+        interval = max(0.0, self.policy.flush_interval_seconds)
+        while True:
+            with self._lock:
+                if not self._closed and len(self._pending) < self.policy.flush_max_records:
+                    self._wake.wait(interval)
+                if self._closed:
+                    return
+            self.flush(fsync=self.policy.durability == "batched")
+
+    def flush(self, fsync: bool = False) -> None:
+        """Write every pending record now."""
+        with self._write_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+            if batch:
+                _append_lines(self.path, b"".join(batch), fsync)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._wake.notify()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush(fsync=self.policy.durability != "per_record")
+        _OPEN_WRITERS.discard(self)
+
+
+def iter_jsonl(path: str | Path) -> Iterator[dict[str, Any]]:
+    """Rows of a JSON-lines file; blank and unparseable (torn) lines are skipped."""
+    path = Path(path)
+    if not path.exists():
+        return
+    with path.open("r", encoding="utf-8", errors="replace") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(row, dict):
+                yield row
 
 
 class ArtifactStore:
-    """Persistent run artifacts for replay, auditing, and reporting."""
+    """Persistent run artifacts for replay, auditing, and reporting.
+
+    JSON documents are replaced atomically and JSONL appends are locked, so several
+    workers or processes can share one run directory and a killed run never leaves a
+    truncated file behind for the next resume.
+
+    With a ``policy``, results and errors go through ``BufferedJsonlWriter``s; call
+    ``close`` (or use the store as a context manager) to flush them. Without one every
+    record is appended immediately.
 
-    def __init__(self, artifacts_root: str | Path, run_id: str):
-        self.run_dir = Path(artifacts_root) / "runs" / run_id
+    Manifests and summaries are also indexed in the artifacts root's ``RunRegistry``.
+    """
+
+    def __init__(
+        self, artifacts_root: str | Path, run_id: str, policy: ArtifactPolicy | None = None
+    ):
+        self.artifacts_root = Path(artifacts_root)
+        self.run_dir = self.artifacts_root / "runs" / run_id
         self.run_dir.mkdir(parents=True, exist_ok=True)
         self.manifest_path = self.run_dir / "manifest.json"
         self.results_path = self.run_dir / "results.jsonl"
         self.errors_path = self.run_dir / "errors.jsonl"
         self.summary_path = self.run_dir / "summary.json"
+        self._results_writer: BufferedJsonlWriter | None = None
+        self._errors_writer: BufferedJsonlWriter | None = None
+        if policy is not None:
+            self._results_writer = BufferedJsonlWriter(self.results_path, policy)
+            self._errors_writer = BufferedJsonlWriter(self.errors_path, policy)
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def flush(self) -> None:
+        for writer in (self._results_writer, self._errors_writer):
+            if writer is not None:
+                writer.flush()
+
+    def close(self) -> None:
+        for writer in (self._results_writer, self._errors_writer):
+            if writer is not None:
+                writer.close()
 
     def write_manifest(self, manifest: dict[str, Any]) -> None:
-        self.manifest_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        atomic_write_text(self.manifest_path, json.dumps(manifest, indent=2))
+        entry = {"run_id": self.run_dir.name, **manifest}
+        self._register(lambda registry: registry.record_manifest(entry))
 
     def append_result(self, record: dict[str, Any]) -> None:
-        with self.results_path.open("a", encoding="utf-8") as file:
-            file.write(json.dumps(record, ensure_ascii=True) + "\n")
+        if self._results_writer is not None:
+            self._results_writer.write(record)
+        else:
+            append_jsonl(self.results_path, record)
 
     def append_error(self, record: dict[str, Any]) -> None:
-        with self.errors_path.open("a", encoding="utf-8") as file:
-            file.write(json.dumps(record, ensure_ascii=True) + "\n")
+        if self._errors_writer is not None:
+            self._errors_writer.write(record)
+        else:
+            append_jsonl(self.errors_path, record)
 
     def write_summary(self, summary: dict[str, Any]) -> None:
-        self.summary_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+        atomic_write_text(self.summary_path, json.dumps(summary, indent=2))
+        entry = {"run_id": self.run_dir.name, **summary}
+        self._register(lambda registry: registry.record_summary(entry))
+
+    def _register(self, update: Callable[[RunRegistry], None]) -> None:
+        # The JSON files are authoritative; a locked or read-only registry must not fail
+        # the run, and `llm-eval runs reindex` rebuilds it from them.
+        try:
+            update(RunRegistry(default_registry_path(self.artifacts_root)))
+        except sqlite3.Error:
+            pass
 
     def load_completed_keys(self) -> set[str]:
+        self.flush()
         keys: set[str] = set()
-        if not self.results_path.exists():
-            return keys
-        with self.results_path.open("r", encoding="utf-8") as file:
-            for line in file:
-                if not line.strip():
-                    continue
-                row = json.loads(line)
-                key = row.get("request_key")
-                if key:
-                    keys.add(str(key))
+        for row in iter_jsonl(self.results_path):
+            key = row.get("request_key")
+            if key:
+                keys.add(str(key))
         return keys
+
+    def load_spent_usd(self) -> float:
+        """Sum of ``cost_usd`` over results that were billed (not served from cache)."""
+        self.flush()
+        spent = 0.0
+        for row in iter_jsonl(self.results_path):
+            if not row.get("from_cache"):
+                spent += float(row.get("cost_usd") or 0.0)
+        return spent
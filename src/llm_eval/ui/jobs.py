@@ -6,8 +6,7 @@ from pathlib import Path
 from llm_eval.config import build_run_manifest, load_run_config
 from llm_eval.reporting import write_reports
 from llm_eval.runner import run_evaluation
-from llm_eval.scoring import load_results, load_summary, score_results
-from llm_eval.stats import add_confidence_intervals, pairwise_significance
+from llm_eval.scoring import score_run
 
 
 def execute_eval_job(
@@ -33,8 +32,7 @@ def execute_eval_job(
     )
 
     run_dir = Path(artifacts_root) / "runs" / summary.run_id
-    scored = add_confidence_intervals(score_results(load_results(run_dir), load_summary(run_dir)))
-    pairwise = pairwise_significance(load_results(run_dir))
+    scored, pairwise = score_run(run_dir)
     outputs = write_reports(
         run_id=summary.run_id,
         scored=scored,
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, TypeGuard
+
+from llm_eval.sketch import MAX_VALUE_MS, MIN_VALUE_MS, SUB_BUCKETS
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy comes with the optional "fast" extra
+    np = None  # type: ignore[assignment]
+
+# Below this many rows the dict loops are as fast as building the arrays.
+VECTORIZE_MIN_ROWS = 2_000
+
+
+def should_vectorize(results: object) -> TypeGuard[Sequence[dict[str, Any]]]:
+    """True for row lists large enough to be worth the array engine, if numpy is present."""
+    return (
+        np is not None
+        and isinstance(results, Sequence)
+        and len(results) >= VECTORIZE_MIN_ROWS
+    )
+
+
+def _system_id(row: dict[str, Any]) -> str:
+    if row.get("system_id"):
+        return str(row["system_id"])
+    return f"{row.get('provider', 'unknown')}:{row.get('model', 'unknown')}"
+
+
+def _sums(codes: Any, weights: Any, size: int) -> Any:
+    # bincount adds weights in row order, so float sums match a sequential Python loop.
+    return np.bincount(codes, weights=weights, minlength=size)
+
+
+def _sketches(codes: Any, values: Any, size: int) -> list[dict[str, Any]]:
+    """``LatencySketch.to_dict()`` of ``values`` grouped by ``codes``, for each of ``size``
+    groups. ``np.frexp`` splits values exactly like ``math.frexp``, so buckets match.
+    """
+    counts = np.bincount(codes, minlength=size)
+    positive = values > 0
+    zeros = np.bincount(codes[~positive], minlength=size)
+    low = np.full(size, np.inf)
+    high = np.full(size, -np.inf)
+    np.minimum.at(low, codes, values)
+    np.maximum.at(high, codes, values)
+    mantissa, exponent = np.frexp(np.clip(values[positive], MIN_VALUE_MS, MAX_VALUE_MS))
+    index = exponent.astype(np.int64) * SUB_BUCKETS + (
+        (mantissa - 0.5) * 2 * SUB_BUCKETS
+    ).astype(np.int64)
+    # Sort by (group, bucket) so each group's buckets come out ascending, as in to_dict.
+    order = np.lexsort((index, codes[positive]))
+    keys = np.stack((codes[positive][order], index[order]))
+    cells, tallies = (
+        np.unique(keys, axis=1, return_counts=True) if keys.size else (keys, np.zeros(0))
+    )
+    sketches: list[dict[str, Any]] = [
+        {
+            "count": int(counts[group]),
+            "zeros": int(zeros[group]),
+            "min": float(low[group]) if counts[group] else None,
+            "max": float(high[group]) if counts[group] else None,
+            "indexes": [],
+            "counts": [],
+        }
+        for group in range(size)
+    ]
+    for group, bucket, tally in zip(cells[0].tolist(), cells[1].tolist(), tallies.tolist()):
+        sketches[group]["indexes"].append(bucket)
+        sketches[group]["counts"].append(tally)
+    return sketches
+
+
+def score_state(results: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    """``ScoreAccumulator.to_dict()`` for ``results``, aggregated with ``np.bincount``.
+
+    Rows are read once into system/category codes and numeric columns; every
+    per-system and per-(system, category) total is then one ``bincount``.
+    """
+    systems: dict[str, int] = {}
+    categories: dict[str, int] = {}
+    labels: dict[str, tuple[str, str]] = {}
+    rows = len(results)
+    system_list: list[int] = []
+    category_list: list[int] = []
+    correct_list: list[bool] = []
+    numeric_lists: tuple[list[float], ...] = ([], [], [], [])
+    ttft_systems: list[int] = []
+    ttft_values: list[float] = []
+    for row in results:
+        sid = _system_id(row)
+        system_list.append(systems.setdefault(sid, len(systems)))
+        if row.get("ttft_ms") is not None:
+            ttft_systems.append(systems[sid])
+            ttft_values.append(float(row["ttft_ms"]))
+        category = str(row.get("category", "unknown"))
+        category_list.append(categories.setdefault(category, len(categories)))
+        correct_list.append(bool(row.get("is_correct", False)))
+        labels[sid] = (str(row.get("provider", "unknown")), str(row.get("model", "unknown")))
+        numeric_lists[0].append(float(row.get("latency_ms") or 0))
+        numeric_lists[1].append(int(row.get("input_tokens") or 0))
+        numeric_lists[2].append(int(row.get("output_tokens") or 0))
+        numeric_lists[3].append(float(row.get("cost_usd") or 0.0))
+    system_codes = np.asarray(system_list, dtype=np.intp)
+    category_codes = np.asarray(category_list, dtype=np.intp)
+    correct = np.asarray(correct_list, dtype=bool)
+    numeric = np.asarray(numeric_lists, dtype=np.float64)
+
+    n_systems = len(systems)
+    attempted = np.bincount(system_codes, minlength=n_systems)
+    n_correct = np.bincount(system_codes[correct], minlength=n_systems)
+    latency, input_tokens, output_tokens, cost = (
+        _sums(system_codes, column, n_systems) for column in numeric
+    )
+
+    # Categories per system, in order of first appearance like the dict loop.
+    pair = system_codes * max(len(categories), 1) + category_codes
+    keys, first = np.unique(pair, return_index=True)
+    keys = keys[np.argsort(first, kind="stable")]
+    pair_attempted = np.bincount(pair, minlength=n_systems * max(len(categories), 1))
+    pair_correct = np.bincount(pair[correct], minlength=pair_attempted.size)
+    category_names = list(categories)
+    latency_sketches = _sketches(system_codes, numeric[0], n_systems)
+    ttft_sketches = _sketches(
+        np.asarray(ttft_systems, dtype=np.intp),
+        np.asarray(ttft_values, dtype=np.float64),
+        n_systems,
+    )
+    pair_sketches = _sketches(pair, numeric[0], pair_attempted.size)
+    by_system: list[dict[str, list[int]]] = [{} for _ in range(n_systems)]
+    latency_by_system: list[dict[str, dict[str, Any]]] = [{} for _ in range(n_systems)]
+    for key in keys.tolist():
+        system, category = divmod(key, max(len(categories), 1))
+        by_system[system][category_names[category]] = [
+            int(pair_attempted[key]),
+            int(pair_correct[key]),
+        ]
+        latency_by_system[system][category_names[category]] = pair_sketches[key]
+
+    state: dict[str, Any] = {}
+    for sid, code in systems.items():
+        provider, model = labels[sid]
+        state[sid] = {
+            "attempted": int(attempted[code]),
+            "correct": int(n_correct[code]),
+            "latency_ms": float(latency[code]),
+            "input_tokens": int(input_tokens[code]),
+            "output_tokens": int(output_tokens[code]),
+            "cost_usd": float(cost[code]),
+            "categories": by_system[code],
+            "latency": latency_sketches[code],
+            "ttft": ttft_sketches[code],
+            "category_latency": latency_by_system[code],
+            "provider": provider,
+            "model": model,
+        }
+    return {"rows": rows, "systems": state}
+
+
+def correctness_matrix(results: Sequence[dict[str, Any]]) -> tuple[list[str], list[str], Any, Any]:
+    """Sorted systems, samples in order of first appearance, and two systems x samples
+    float matrices: ``present`` (1 where the system answered) and ``right`` (1 where it
+    answered correctly). The last row for a repeated (system, sample) wins.
+    """
+    systems: dict[str, int] = {}
+    samples: dict[str, int] = {}
+    system_list: list[int] = []
+    sample_list: list[int] = []
+    correct_list: list[bool] = []
+    for row in results:
+        sid = str(row.get("system_id") or f"{row.get('provider')}:{row.get('model')}")
+        system_list.append(systems.setdefault(sid, len(systems)))
+        sample_list.append(samples.setdefault(str(row.get("sample_id")), len(samples)))
+        correct_list.append(bool(row.get("is_correct", False)))
+    system_codes = np.asarray(system_list, dtype=np.int64)
+    sample_codes = np.asarray(sample_list, dtype=np.int64)
+    correct = np.asarray(correct_list, dtype=bool)
+
+    names = sorted(systems)
+    rank = np.empty(len(names), dtype=np.int64)
+    rank[[systems[name] for name in names]] = np.arange(len(names))
+    n_systems, n_samples = len(names), len(samples)
+    cells = rank[system_codes] * n_samples + sample_codes
+    # np.unique keeps the first occurrence; scanning reversed makes that the last row.
+    unique_cells, first = np.unique(cells[::-1], return_index=True)
+    present_cells = np.zeros(n_systems * n_samples, dtype=np.float64)
+    right_cells = np.zeros_like(present_cells)
+    present_cells[unique_cells] = 1.0
+    right_cells[unique_cells] = correct[::-1][first]
+    present = present_cells.reshape(n_systems, n_samples)
+    right = right_cells.reshape(n_systems, n_samples)
+    return names, list(samples), present, right
+
+
+def _pair_counts(
+    names: list[str], present: Any, right: Any
+) -> dict[tuple[str, str], list[int]]:
+    wrong = present - right
+    # Counts stay far below 2**53, so the float products are exact.
+    wins = (right @ wrong.T).astype(np.int64)
+    both = (present @ present.T).astype(np.int64)
+    ties = both - wins - wins.T
+    counts: dict[tuple[str, str], list[int]] = {}
+    for i in range(len(names)):
+        for j in range(i + 1, len(names)):
+            counts[(names[i], names[j])] = [
+                int(wins[i, j]),
+                int(wins[j, i]),
+                int(ties[i, j]),
+            ]
+    return counts
+
+
+def pairwise_counts(
+    results: Sequence[dict[str, Any]],
+) -> tuple[list[str], dict[tuple[str, str], list[int]]]:
+    """Sorted systems and ``(a, b) -> [wins_a, wins_b, ties]`` for every pair a < b,
+    from two products of the ``correctness_matrix``.
+    """
+    names, _, present, right = correctness_matrix(results)
+    return names, _pair_counts(names, present, right)
+
+
+def pairwise_state(
+    results: Sequence[dict[str, Any]], expected: frozenset[str] | None
+) -> tuple[
+    list[str],
+    dict[tuple[str, str], list[int]],
+    dict[str, dict[str, bool]],
+    dict[str, int],
+]:
+    """``pairwise_counts`` plus, in the ``PairwiseAccumulator`` layout, the answers to
+    samples not answered by exactly the ``expected`` systems (all samples when
+    ``expected`` is None) and the correctness bits of the samples that were.
+    """
+    names, samples, present, right = correctness_matrix(results)
+    counts = _pair_counts(names, present, right)
+    finished: dict[str, int] = {}
+    if expected is None or not expected <= set(names):
+        open_samples = np.arange(len(samples))
+    else:
+        rows = [names.index(name) for name in sorted(expected)]
+        done = present[rows].astype(bool).all(axis=0)
+        others = [index for index, name in enumerate(names) if name not in expected]
+        if others:
+            done &= ~present[others].astype(bool).any(axis=0)
+        open_samples = np.flatnonzero(~done)
+        closed = np.flatnonzero(done)
+        for column, answers in zip(closed.tolist(), right[rows][:, closed].T.tolist()):
+            finished[samples[column]] = sum(
+                1 << bit for bit, correct in enumerate(answers) if correct
+            )
+    pending: dict[str, dict[str, bool]] = {}
+    for column in open_samples.tolist():
+        answered = np.flatnonzero(present[:, column]).tolist()
+        pending[samples[column]] = {
+            names[system]: bool(right[system, column]) for system in answered
+        }
+    return names, counts, pending, finished
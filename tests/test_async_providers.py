@@ -0,0 +1,207 @@
+import asyncio
+from types import SimpleNamespace
+
+import groq
+import httpx
+import pytest
+
+from llm_eval.providers.anthropic_provider import AnthropicProvider
+from llm_eval.providers.base import InferenceRequest, InferenceResponse, ProviderClient
+from llm_eval.providers.gemini_provider import GeminiProvider
+from llm_eval.providers.groq_provider import GroqProvider
+from llm_eval.providers.http import ProviderHTTPError
+from llm_eval.providers.openai_provider import OpenAIProvider
+
+
+def test_anthropic_agenerate_uses_async_transport(monkeypatch) -> None:
+    captured = {}
+
+    async def _fake_apost_json(**kwargs):
+        captured.update(kwargs)
+        return {
+            "model": "claude-test",
+            "content": [{"type": "text", "text": " B "}],
+            "usage": {"input_tokens": 5, "output_tokens": 1},
+        }
+
+    monkeypatch.setenv("TEST_ANTHROPIC_KEY", "key-123")
+    monkeypatch.setattr("llm_eval.providers.anthropic_provider.apost_json", _fake_apost_json)
+    client = AnthropicProvider(model="claude-test", api_key_env="TEST_ANTHROPIC_KEY")
+    response = asyncio.run(client.agenerate(InferenceRequest(prompt="Q?", max_tokens=8)))
+
+    assert response.text == "B"
+    assert response.usage == {"input_tokens": 5, "output_tokens": 1}
+    assert captured["url"] == "https://api.anthropic.com/v1/messages"
+    assert captured["payload"]["max_tokens"] == 8
+    assert captured["headers"]["x-api-key"] == "key-123"
+
+
+def _fake_apost_json(captured: dict, data: dict):
+    async def _post(**kwargs):
+        captured.update(kwargs)
+        await asyncio.sleep(0.02)
+        return data
+
+    return _post
+
+
+def test_openai_agenerate_builds_chat_payload_and_parses_usage(monkeypatch) -> None:
+    captured: dict = {}
+    data = {
+        "model": "gpt-test-0613",
+        "choices": [{"message": {"role": "assistant", "content": "C"}}],
+        "usage": {"prompt_tokens": 7, "completion_tokens": 1, "total_tokens": 8},
+    }
+    monkeypatch.setenv("TEST_OPENAI_KEY", "sk-123")
+    monkeypatch.setenv("TEST_OPENAI_PROJECT", "proj-1")
+    monkeypatch.setattr(
+        "llm_eval.providers.openai_provider.apost_json", _fake_apost_json(captured, data)
+    )
+    client = OpenAIProvider(
+        model="gpt-test",
+        api_key_env="TEST_OPENAI_KEY",
+        project_id_env="TEST_OPENAI_PROJECT",
+        organization_id_env="TEST_OPENAI_ORG_UNSET",
+    )
+    request = InferenceRequest(prompt="Q?", temperature=0.2, max_tokens=8)
+    response = asyncio.run(client.agenerate(request))
+
+    assert captured["url"] == "https://api.openai.com/v1/chat/completions"
+    assert captured["payload"] == {
+        "model": "gpt-test",
+        "messages": [{"role": "user", "content": "Q?"}],
+        "temperature": 0.2,
+        "max_tokens": 8,
+    }
+    assert captured["headers"] == {"Authorization": "Bearer sk-123", "OpenAI-Project": "proj-1"}
+    assert (response.text, response.model, response.provider) == ("C", "gpt-test-0613", "openai")
+    assert response.usage == data["usage"]
+    assert response.latency_ms >= 20
+
+
+def test_gemini_agenerate_builds_content_payload_and_parses_usage(monkeypatch) -> None:
+    captured: dict = {}
+    data = {
+        "candidates": [{"content": {"parts": [{"text": "D"}, {"text": "\n"}]}}],
+        "usageMetadata": {"promptTokenCount": 6, "candidatesTokenCount": 1},
+    }
+    monkeypatch.setenv("TEST_GEMINI_KEY", "g-123")
+    monkeypatch.setattr(
+        "llm_eval.providers.gemini_provider.apost_json", _fake_apost_json(captured, data)
+    )
+    client = GeminiProvider(model="gemini-test", api_key_env="TEST_GEMINI_KEY")
+    request = InferenceRequest(prompt="Q?", temperature=0.0, max_tokens=16)
+    response = asyncio.run(client.agenerate(request))
+
+    assert captured["url"] == (
+        "https://generativelanguage.googleapis.com/v1beta/models/"
+        "gemini-test:generateContent?key=g-123"
+    )
+    assert captured["payload"] == {
+        "contents": [{"parts": [{"text": "Q?"}]}],
+        "generationConfig": {"temperature": 0.0, "maxOutputTokens": 16},
+    }
+    assert (response.text, response.model, response.provider) == ("D", "gemini-test", "gemini")
+    assert response.usage == data["usageMetadata"]
+    assert response.latency_ms >= 20
+
+
+@pytest.mark.parametrize(
+    ("provider", "env"),
+    [(OpenAIProvider, "TEST_OPENAI_KEY"), (GeminiProvider, "TEST_GEMINI_KEY")],
+)
+def test_http_agenerate_maps_error_status_to_provider_http_error(
+    monkeypatch, provider, env
+) -> None:
+    class ThrottlingClient:
+        async def post(self, url, **kwargs):
+            _ = kwargs
+            return httpx.Response(
+                429,
+                text="slow down",
+                headers={"Retry-After": "3"},
+                request=httpx.Request("POST", url),
+            )
+
+    monkeypatch.setenv(env, "key-123")
+    monkeypatch.setattr("llm_eval.providers.http._async_client", ThrottlingClient)
+    client = provider(model="m", api_key_env=env)
+    with pytest.raises(ProviderHTTPError) as raised:
+        asyncio.run(client.agenerate(InferenceRequest(prompt="Q?")))
+    assert (raised.value.status_code, raised.value.message) == (429, "slow down")
+    assert raised.value.retry_after_seconds == 3.0
+
+
+def _fake_async_groq(captured: dict, outcome):
+    class FakeAsyncGroq:
+        def __init__(self, api_key: str, timeout: int):
+            captured["client"] = {"api_key": api_key, "timeout": timeout}
+
+            async def _create(**kwargs):
+                captured["create"] = kwargs
+                await asyncio.sleep(0.02)
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+
+            self.chat = SimpleNamespace(completions=SimpleNamespace(create=_create))
+
+        async def close(self) -> None:
+            pass
+
+    return FakeAsyncGroq
+
+
+def test_groq_agenerate_builds_completion_kwargs_and_parses_usage(monkeypatch) -> None:
+    captured: dict = {}
+    usage = {"prompt_tokens": 9, "completion_tokens": 1, "total_tokens": 10}
+    completion = SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="A"))],
+        model="qwen-test",
+        usage=SimpleNamespace(model_dump=lambda: usage),
+    )
+    monkeypatch.setenv("TEST_GROQ_KEY", "gsk-123")
+    monkeypatch.setattr("groq.AsyncGroq", _fake_async_groq(captured, completion))
+    client = GroqProvider(model="qwen", api_key_env="TEST_GROQ_KEY", timeout_seconds=12)
+    request = InferenceRequest(prompt="Q?", temperature=0.3, max_tokens=4)
+    response = asyncio.run(client.agenerate(request))
+
+    assert captured["client"] == {"api_key": "gsk-123", "timeout": 12}
+    assert captured["create"] == {
+        "model": "qwen",
+        "messages": [{"role": "user", "content": "Q?"}],
+        "temperature": 0.3,
+        "max_completion_tokens": 4,
+        "top_p": 1,
+        "stream": False,
+    }
+    assert (response.text, response.model, response.provider) == ("A", "qwen-test", "groq")
+    assert response.usage == usage
+    assert response.latency_ms >= 20
+
+
+def test_groq_agenerate_maps_api_status_error_to_provider_http_error(monkeypatch) -> None:
+    request = httpx.Request("POST", "https://api.groq.com/openai/v1/chat/completions")
+    error = groq.APIStatusError(
+        "rate limited",
+        response=httpx.Response(429, headers={"retry-after": "5"}, request=request),
+        body=None,
+    )
+    monkeypatch.setenv("TEST_GROQ_KEY", "gsk-123")
+    monkeypatch.setattr("groq.AsyncGroq", _fake_async_groq({}, error))
+    client = GroqProvider(model="qwen", api_key_env="TEST_GROQ_KEY")
+    with pytest.raises(ProviderHTTPError) as raised:
+        asyncio.run(client.agenerate(InferenceRequest(prompt="Q?")))
+    assert (raised.value.status_code, raised.value.message) == (429, "rate limited")
+    assert raised.value.retry_after_seconds == 5.0
+
+
+def test_default_agenerate_wraps_sync_generate() -> None:
+    class SyncOnlyProvider(ProviderClient):
+        provider_name = "sync"
+
+        def generate(self, request: InferenceRequest) -> InferenceResponse:
+            return InferenceResponse(text=request.prompt.upper(), model="m", provider="sync")
+
+    response = asyncio.run(SyncOnlyProvider().agenerate(InferenceRequest(prompt="a")))
+    assert response.text == "A"
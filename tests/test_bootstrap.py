@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from llm_eval.bootstrap import apply_bootstrap, paired_bootstrap
+from llm_eval.reporting import build_html_report, build_markdown_report
+from llm_eval.scoring import score_results
+from llm_eval.stats import pairwise_significance
+
+pytest.importorskip("numpy")
+
+
+def _rows(seed: int, samples: int) -> list[dict]:
+    rng = random.Random(seed)
+    rows = []
+    for index in range(samples):
+        category = ["math", "law"][index % 2]
+        for system, skill in (("groq:a", 0.8), ("openai:b", 0.5)):
+            provider, model = system.split(":")
+            rows.append(
+                {
+                    "system_id": system,
+                    "provider": provider,
+                    "model": model,
+                    "sample_id": f"s{index}",
+                    "category": category,
+                    "is_correct": rng.random() < skill,
+                }
+            )
+    return rows
+
+
+def test_bootstrap_is_deterministic_across_workers() -> None:
+    rows = _rows(seed=1, samples=120)
+    serial = paired_bootstrap(rows, resamples=600, seed=7)
+    parallel = paired_bootstrap(rows, resamples=600, seed=7, workers=2)
+    assert serial == parallel
+    assert paired_bootstrap(rows, resamples=600, seed=8) != serial
+
+
+def test_intervals_contain_point_estimates() -> None:
+    rows = _rows(seed=2, samples=200)
+    scored = score_results(rows, {"status": "completed", "provider_metrics": {}})
+    result = paired_bootstrap(rows, resamples=1000, seed=42)
+
+    for system_id, metrics in scored["providers"].items():
+        bounds = result.systems[system_id]
+        assert bounds["low"] <= metrics["accuracy"] <= bounds["high"]
+        for category, values in metrics["categories"].items():
+            cat = bounds["categories"][category]
+            assert cat["low"] <= values["accuracy"] <= cat["high"]
+
+    pair = result.pairs[("groq:a", "openai:b")]
+    assert pair["low"] <= pair["accuracy_diff"] <= pair["high"]
+    assert pair["low"] > 0  # a 0.8 vs 0.5 system over 200 samples is clearly apart
+    assert pair["p_value"] < 0.01
+
+
+def test_report_renders_bootstrap_columns() -> None:
+    rows = _rows(seed=3, samples=60)
+    scored = score_results(rows, {"status": "completed", "provider_metrics": {}})
+    pairwise = pairwise_significance(rows)
+    scored, pairwise = apply_bootstrap(
+        scored, pairwise, paired_bootstrap(rows, resamples=300, seed=42)
+    )
+
+    assert pairwise[0]["accuracy_diff_ci_bootstrap"]["low"] is not None
+    assert "accuracy_ci_bootstrap" in scored["providers"]["groq:a"]["categories"]["math"]
+    markdown = build_markdown_report("run-x", scored, pairwise)
+    assert "Bootstrap CI95" in markdown
+    assert "Bootstrap p" in markdown
+    assert "Bootstrap p" in build_html_report("run-x", scored, pairwise)
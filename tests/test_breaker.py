@@ -0,0 +1,85 @@
+from llm_eval.breaker import CircuitBreaker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _breaker(clock: FakeClock, max_open_cycles: int = 2) -> CircuitBreaker:
+    return CircuitBreaker(
+        window_size=4,
+        threshold_percent=25,
+        cooldown_seconds=10,
+        probe_requests=2,
+        max_open_cycles=max_open_cycles,
+        clock=clock,
+    )
+
+
+def test_breaker_uses_sliding_window_not_cumulative_rate() -> None:
+    breaker = _breaker(FakeClock())
+    for success in [True, True, True, False, True, True, True, True]:
+        breaker.record(success)
+    # The early failure slid out of the 4-request window.
+    assert breaker.state == "closed"
+    assert breaker.window_error_rate_percent() == 0
+    breaker.record(False)
+    breaker.record(False)
+    assert breaker.state == "open"
+    assert breaker.allow_request() is False
+
+
+def test_breaker_half_open_probes_close_or_reopen() -> None:
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record(False)
+    assert breaker.seconds_until_probe() == 10
+    clock.now = 10
+    assert breaker.state == "half_open"
+    assert breaker.allow_request() and breaker.allow_request()
+    assert breaker.allow_request() is False
+    breaker.record(True)
+    breaker.record(True)
+    assert breaker.state == "closed"
+
+    for _ in range(4):
+        breaker.record(False)
+    clock.now = 20
+    assert breaker.allow_request()
+    breaker.record(False)
+    assert breaker.state == "dropped"
+    assert breaker.snapshot()["open_cycles"] == 3
+
+
+def test_disabled_breaker_never_opens() -> None:
+    breaker = CircuitBreaker(
+        window_size=1,
+        threshold_percent=0,
+        cooldown_seconds=1,
+        probe_requests=1,
+        max_open_cycles=0,
+        enabled=False,
+    )
+    breaker.record(False)
+    assert breaker.state == "closed"
+
+
+def test_breaker_probe_slots_are_settled_by_retries_and_cache_hits() -> None:
+    clock = FakeClock()
+    breaker = _breaker(clock)
+    for _ in range(4):
+        breaker.record(False)
+    clock.now = 10
+    assert breaker.allow_request() and breaker.allow_request()
+    assert breaker.allow_request() is False
+    breaker.release_probe()  # a cache hit says nothing about the provider
+    assert breaker.allow_request() is True
+
+    breaker.record_retry()  # a retried probe is a failed probe
+    assert breaker.state == "open"
+    assert breaker.open_cycles == 2
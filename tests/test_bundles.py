@@ -0,0 +1,64 @@
+import gzip
+from pathlib import Path
+
+import pytest
+
+from llm_eval.bundles import BundleError, export_bundle, import_bundle, verify_bundle
+from llm_eval.cache import CacheKey, SQLiteResponseCache
+
+
+def _key(prompt: str, provider: str = "groq") -> CacheKey:
+    return CacheKey.for_request(
+        provider=provider, model="m", prompt=prompt, temperature=0.0, max_tokens=16
+    )
+
+
+def _seeded_cache(path: Path) -> SQLiteResponseCache:
+    cache = SQLiteResponseCache(path)
+    cache.set(_key("a"), {"text": "A"})
+    cache.set(_key("b"), {"text": "B"})
+    cache.set(_key("c", provider="openai"), {"text": "C"})
+    return cache
+
+
+def test_export_is_content_addressed_and_filterable(tmp_path: Path) -> None:
+    cache = _seeded_cache(tmp_path / "source.sqlite3")
+    first = export_bundle(cache, tmp_path / "bundles", providers=["groq"])
+    again = export_bundle(cache, tmp_path / "bundles", providers=["groq"])
+    assert first.entries == 2
+    assert first.path == again.path
+    assert len(list((tmp_path / "bundles").iterdir())) == 1
+    assert export_bundle(cache, tmp_path / "bundles", since=4e9).entries == 0
+    cache.close()
+
+
+def test_import_merges_without_duplicates(tmp_path: Path) -> None:
+    source = _seeded_cache(tmp_path / "source.sqlite3")
+    bundle = export_bundle(source, tmp_path / "bundles").path
+    source.close()
+
+    target = SQLiteResponseCache(tmp_path / "target.sqlite3")
+    target.set(_key("a"), {"text": "newer"})
+    result = import_bundle(target, bundle)
+    assert (result.entries, result.added, result.updated, result.skipped) == (3, 2, 0, 1)
+    assert target.get(_key("a")) == {"text": "newer"}
+    assert target.get(_key("c", provider="openai")) == {"text": "C"}
+    assert import_bundle(target, bundle).added == 0
+    assert len(target) == 3
+    target.close()
+
+
+def test_tampered_bundle_is_rejected_before_import(tmp_path: Path) -> None:
+    source = _seeded_cache(tmp_path / "source.sqlite3")
+    bundle = export_bundle(source, tmp_path / "bundles").path
+    source.close()
+    lines = gzip.decompress(bundle.read_bytes()).replace(b'\\"A\\"', b'\\"Z\\"')
+    bundle.write_bytes(gzip.compress(lines))
+
+    with pytest.raises(BundleError, match="payload hash"):
+        verify_bundle(bundle)
+    target = SQLiteResponseCache(tmp_path / "target.sqlite3")
+    with pytest.raises(BundleError):
+        import_bundle(target, bundle)
+    assert len(target) == 0
+    target.close()
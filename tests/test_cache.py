@@ -0,0 +1,182 @@
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from llm_eval.cache import CacheKey, MemoryCacheTier, SQLiteResponseCache
+from llm_eval.config import CachePolicy
+
+
+def _key(prompt: str = "Q?", model: str = "m") -> CacheKey:
+    return CacheKey.for_request(
+        provider="anthropic", model=model, prompt=prompt, temperature=0.0, max_tokens=16
+    )
+
+
+def test_cache_key_depends_only_on_response_inputs() -> None:
+    assert _key().digest == _key().digest
+    assert _key(prompt="other").digest != _key().digest
+    assert _key(model="other").digest != _key().digest
+
+
+def test_sqlite_cache_is_shared_between_instances(tmp_path: Path) -> None:
+    path = tmp_path / "cache" / "responses.sqlite3"
+    writer = SQLiteResponseCache(path)
+    writer.set(_key(), {"text": "B", "latency_ms": 3})
+    reader = SQLiteResponseCache(path)
+    assert reader.has(_key())
+    assert reader.get(_key()) == {"text": "B", "latency_ms": 3}
+    assert reader.get(_key(prompt="missing")) is None
+    writer.close()
+    reader.close()
+
+
+def test_sqlite_cache_accepts_concurrent_writers(tmp_path: Path) -> None:
+    cache = SQLiteResponseCache(tmp_path / "responses.sqlite3")
+
+    def _write(worker: int) -> None:
+        for index in range(25):
+            cache.set(_key(prompt=f"{worker}-{index}"), {"text": str(index)})
+
+    threads = [threading.Thread(target=_write, args=(worker,)) for worker in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(cache) == 100
+    cache.close()
+
+
+def test_sqlite_cache_counts_hits_and_persists_lifetime_stats(tmp_path: Path) -> None:
+    path = tmp_path / "responses.sqlite3"
+    cache = SQLiteResponseCache(path)
+    cache.set(_key(), {"text": "B"})
+    assert cache.get(_key()) is not None
+    assert cache.get(_key(prompt="missing")) is None
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hit_rate == 0.5
+    assert cache.stats.bytes_saved == len('{"text": "B"}')
+    cache.close()
+
+    reopened = SQLiteResponseCache(path)
+    assert reopened.get(_key()) is not None
+    lifetime = reopened.lifetime_stats()
+    assert (lifetime.hits, lifetime.misses) == (2, 1)
+    assert reopened.describe()["systems"] == {"anthropic:m": {"entries": 1, "bytes": 13}}
+    reopened.close()
+
+
+def test_read_only_sqlite_cache_serves_entries_without_writing(tmp_path: Path) -> None:
+    path = tmp_path / "responses.sqlite3"
+    writer = SQLiteResponseCache(path)
+    writer.set(_key(), {"text": "B"})
+    writer.close()
+
+    reader = SQLiteResponseCache(path, read_only=True)
+    assert reader.has(_key())
+    assert reader.get(_key()) == {"text": "B"}
+    with pytest.raises(sqlite3.OperationalError):
+        reader.set(_key(prompt="new"), {"text": "C"})
+    reader.close()
+
+    reopened = SQLiteResponseCache(path)
+    assert reopened.lifetime_stats().hits == 0
+    assert len(reopened) == 1
+    reopened.close()
+    SQLiteResponseCache(tmp_path / "missing" / "r.sqlite3", read_only=True).close()
+    assert not (tmp_path / "missing").exists()
+
+
+def test_sqlite_cache_does_not_serve_or_keep_expired_entries(tmp_path: Path) -> None:
+    cache = SQLiteResponseCache(tmp_path / "responses.sqlite3", CachePolicy(max_age_days=1))
+    cache.set(_key(), {"text": "B"})
+    cache._conn().execute("UPDATE responses SET created_at = created_at - 2 * 86400")
+    assert not cache.has(_key())
+    assert cache.get(_key()) is None
+    result = cache.prune()
+    assert (result.expired, result.evicted) == (1, 0)
+    assert len(cache) == 0
+    cache.close()
+
+
+def test_sqlite_cache_prune_evicts_least_recently_used(tmp_path: Path) -> None:
+    cache = SQLiteResponseCache(tmp_path / "responses.sqlite3", CachePolicy(max_entries=2))
+    for index, prompt in enumerate(("a", "b", "c")):
+        cache.set(_key(prompt=prompt), {"text": prompt})
+        cache._conn().execute(
+            "UPDATE responses SET created_at = ?, accessed_at = ? WHERE key = ?",
+            (index, index, _key(prompt=prompt).digest),
+        )
+    cache.get(_key(prompt="a"))
+    result = cache.prune()
+    assert result.evicted == 1
+    assert cache.has(_key(prompt="a"))
+    assert not cache.has(_key(prompt="b"))
+    assert cache.stats.evictions == 1
+    cache.close()
+
+
+def test_sqlite_cache_ttl_eviction_drops_oldest_by_bytes(tmp_path: Path) -> None:
+    policy = CachePolicy(max_bytes=20, eviction="ttl")
+    cache = SQLiteResponseCache(tmp_path / "responses.sqlite3", policy)
+    for index, prompt in enumerate(("a", "b", "c")):
+        cache.set(_key(prompt=prompt), {"text": prompt})
+        cache._conn().execute(
+            "UPDATE responses SET created_at = ? WHERE key = ?",
+            (index, _key(prompt=prompt).digest),
+        )
+    cache.get(_key(prompt="a"))
+    result = cache.prune()
+    assert result.evicted == 2
+    assert result.freed_bytes == 26
+    assert cache.has(_key(prompt="c"))
+    cache.close()
+
+
+def test_memory_tier_serves_repeat_reads_without_the_store(tmp_path: Path) -> None:
+    memory = MemoryCacheTier(max_bytes=1_000)
+    cache = SQLiteResponseCache(tmp_path / "responses.sqlite3", memory=memory)
+    cache.set(_key(), {"text": "B"})
+    cache._conn().execute("DELETE FROM responses")
+    # Written through, so the hit never reaches the (now empty) store.
+    assert cache.get(_key()) == {"text": "B"}
+    assert (cache.stats.memory_hits, cache.stats.store_hits) == (1, 0)
+    cache.close()
+
+    other = SQLiteResponseCache(tmp_path / "other.sqlite3", memory=memory)
+    assert other.get(_key()) is None
+    other.close()
+
+
+def test_memory_tier_is_byte_bounded_lru() -> None:
+    memory = MemoryCacheTier(max_bytes=20)
+    memory.put("s", "a", {"text": "a"}, 10, 0.0)
+    memory.put("s", "b", {"text": "b"}, 10, 0.0)
+    assert memory.get("s", "a", None) is not None
+    memory.put("s", "c", {"text": "c"}, 10, 0.0)
+    assert memory.get("s", "b", None) is None
+    assert memory.get("s", "a", None) is not None
+    assert (len(memory), memory.size_bytes, memory.evictions) == (2, 20, 1)
+    assert memory.get("s", "a", cutoff=1.0) is None
+
+
+def test_prune_invalidates_memory_tier_and_keeps_lru_recency(tmp_path: Path) -> None:
+    memory = MemoryCacheTier(max_bytes=1_000)
+    cache = SQLiteResponseCache(
+        tmp_path / "responses.sqlite3", CachePolicy(max_entries=1), memory=memory
+    )
+    for index, prompt in enumerate(("a", "b")):
+        cache.set(_key(prompt=prompt), {"text": prompt})
+        cache._conn().execute(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?",
+            (index, _key(prompt=prompt).digest),
+        )
+    # A memory-tier hit on "a" still counts as recent use when the store evicts.
+    assert cache.get(_key(prompt="a")) is not None
+    assert cache.prune().evicted == 1
+    assert cache.has(_key(prompt="a"))
+    assert not cache.has(_key(prompt="b"))
+    assert len(memory) == 1
+    cache.close()
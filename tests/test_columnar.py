@@ -0,0 +1,83 @@
+import json
+from pathlib import Path
+
+from llm_eval.columnar import COLUMNS_DIR, columnar_is_fresh, read_columns, write_columnar
+from llm_eval.scoring import SCORING_COLUMNS, load_results, score_results
+from llm_eval.stats import pairwise_significance
+from llm_eval.storage import append_jsonl
+
+
+def _write_results(run_dir: Path) -> None:
+    rows = [
+        ("a:m", "s1", "math", True, 100, "B"),
+        ("a:m", "s2", "bio", False, 300, "Answer: é C"),
+        ("b:m", "s1", "math", False, 50, ""),
+        ("b:m", "s2", "bio", True, 70, None),
+    ]
+    for sid, sample_id, category, correct, latency, text in rows:
+        append_jsonl(
+            run_dir / "results.jsonl",
+            {
+                "system_id": sid,
+                "provider": sid.split(":")[0],
+                "model": "m",
+                "sample_id": sample_id,
+                "category": category,
+                "predicted": None if text is None else "B",
+                "is_correct": correct,
+                "latency_ms": latency,
+                "input_tokens": 10,
+                "output_tokens": 2,
+                "cost_usd": 0.25,
+                "response_text": text,
+            },
+        )
+
+
+def test_columnar_round_trip_with_projection(tmp_path: Path) -> None:
+    _write_results(tmp_path)
+    write_columnar(tmp_path)
+    assert columnar_is_fresh(tmp_path)
+    columns = read_columns(tmp_path, ["system_id", "is_correct", "latency_ms", "predicted"])
+    assert columns["system_id"] == ["a:m", "a:m", "b:m", "b:m"]
+    assert columns["is_correct"] == [True, False, False, True]
+    assert columns["latency_ms"] == [100, 300, 50, 70]
+    assert columns["predicted"] == ["B", "B", "B", None]
+    assert read_columns(tmp_path, ["response_text"])["response_text"][1] == "Answer: é C"
+
+
+def test_scoring_from_columns_matches_jsonl(tmp_path: Path) -> None:
+    _write_results(tmp_path)
+    full = load_results(tmp_path)
+    projected = load_results(tmp_path, columns=[*SCORING_COLUMNS, "sample_id"])
+    assert (tmp_path / COLUMNS_DIR / "meta.json").exists()
+    assert "response_text" not in projected[0]
+    assert score_results(projected, {}) == score_results(full, {})
+    assert pairwise_significance(projected) == pairwise_significance(full)
+
+
+def test_rows_missing_fields_score_the_same_from_columns(tmp_path: Path) -> None:
+    _write_results(tmp_path)
+    append_jsonl(
+        tmp_path / "results.jsonl",
+        {"system_id": "a:m", "sample_id": "s3", "is_correct": True, "latency_ms": 20},
+    )
+    append_jsonl(tmp_path / "results.jsonl", {"sample_id": "s3", "latency_ms": 40})
+    full = load_results(tmp_path)
+    projected = load_results(tmp_path, columns=[*SCORING_COLUMNS, "sample_id"])
+    assert "category" not in projected[-1]
+    scored = score_results(projected, {})
+    assert scored == score_results(full, {})
+    assert set(scored["providers"]["a:m"]["categories"]) == {"bio", "math", "unknown"}
+    assert scored["providers"]["unknown:unknown"]["provider"] == "unknown"
+
+
+def test_stale_columns_are_rebuilt_after_append(tmp_path: Path) -> None:
+    _write_results(tmp_path)
+    write_columnar(tmp_path)
+    append_jsonl(tmp_path / "results.jsonl", {"system_id": "c:m", "sample_id": "s1"})
+    assert not columnar_is_fresh(tmp_path)
+    rows = load_results(tmp_path, columns=["system_id"])
+    assert [row["system_id"] for row in rows][-1] == "c:m"
+    meta = json.loads((tmp_path / COLUMNS_DIR / "meta.json").read_text(encoding="utf-8"))
+    assert meta["rows"] == 5
@@ -0,0 +1,44 @@
+from llm_eval.concurrency import AdaptiveConcurrencyLimit
+from llm_eval.config import AdaptiveConcurrencyPolicy
+
+
+def test_limit_grows_additively_up_to_ceiling() -> None:
+    limit = AdaptiveConcurrencyLimit(4, AdaptiveConcurrencyPolicy(initial_limit=1))
+    assert limit.current == 1
+    limit.record(100, "ok")
+    assert limit.current == 2
+    for _ in range(50):
+        limit.record(100, "ok")
+    assert limit.current == 4
+    assert limit.snapshot()["max_limit"] == 4
+
+
+def test_throttling_backs_off_multiplicatively_once_per_wave() -> None:
+    limit = AdaptiveConcurrencyLimit(16, AdaptiveConcurrencyPolicy(initial_limit=16))
+    limit.record(100, "throttled")
+    assert limit.current == 8
+    # The rest of the same in-flight wave does not collapse the limit further.
+    for _ in range(7):
+        limit.record(100, "overloaded")
+    assert limit.current == 8
+    limit.record(100, "overloaded")
+    assert limit.current == 4
+    assert limit.snapshot()["decreases"] == 2
+
+
+def test_latency_spike_triggers_decrease() -> None:
+    policy = AdaptiveConcurrencyPolicy(initial_limit=8, latency_window_requests=10)
+    limit = AdaptiveConcurrencyLimit(8, policy)
+    for _ in range(10):
+        limit.record(50, "ok")
+    for _ in range(2):
+        limit.record(1000, "ok")
+    assert limit.current == 4
+
+
+def test_disabled_controller_pins_limit_to_ceiling() -> None:
+    limit = AdaptiveConcurrencyLimit(3, AdaptiveConcurrencyPolicy(enabled=False))
+    limit.record(100, "throttled")
+    assert limit.current == 3
+    assert all(limit.try_acquire() for _ in range(3))
+    assert limit.try_acquire() is False
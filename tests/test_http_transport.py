@@ -0,0 +1,71 @@
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+
+import pytest
+
+from llm_eval.config import HttpTransportPolicy
+from llm_eval.providers import http as transport
+from llm_eval.providers.http import ProviderHTTPError, post_json
+
+
+class _EchoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    peers: ClassVar[set[tuple[str, int]]] = set()
+
+    def do_POST(self) -> None:
+        self.peers.add(self.client_address)
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        status = 429 if json.loads(body).get("fail") else 200
+        payload = json.dumps({"echo": json.loads(body)}).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        if status == 429:
+            self.send_header("Retry-After", "2")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: object) -> None:
+        _ = (format, args)
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    _EchoHandler.peers = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EchoHandler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    finally:
+        transport.close_transport()
+        server.shutdown()
+        server.server_close()
+
+
+def test_post_json_reuses_one_keep_alive_connection(server_url: str) -> None:
+    for index in range(5):
+        data = post_json(url=server_url, payload={"n": index}, headers={}, timeout_seconds=5)
+        assert data == {"echo": {"n": index}}
+    assert len(_EchoHandler.peers) == 1
+
+
+def test_post_json_raises_provider_error_with_headers(server_url: str) -> None:
+    with pytest.raises(ProviderHTTPError) as exc_info:
+        post_json(url=server_url, payload={"fail": True}, headers={}, timeout_seconds=5)
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.retry_after_seconds == 2.0
+
+
+def test_configure_transport_rebuilds_pool_only_on_change(server_url: str) -> None:
+    post_json(url=server_url, payload={}, headers={}, timeout_seconds=5)
+    client = transport._SYNC_CLIENT
+    transport.configure_transport(HttpTransportPolicy())
+    assert transport._SYNC_CLIENT is client
+    transport.configure_transport(HttpTransportPolicy(max_connections=4))
+    assert transport._SYNC_CLIENT is None
+    transport.configure_transport(HttpTransportPolicy())
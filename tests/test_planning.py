@@ -0,0 +1,132 @@
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from llm_eval.config import load_run_config
+from llm_eval.planning import load_latency_history, plan_run
+from llm_eval.providers.base import InferenceRequest, InferenceResponse
+from llm_eval.runner import request_key, request_key_for, run_evaluation
+
+
+class TimedProvider:
+    def __init__(self, provider_name: str):
+        self.provider_name = provider_name
+
+    def generate(self, request: InferenceRequest) -> InferenceResponse:
+        _ = request
+        return InferenceResponse(
+            text="B",
+            model="fake-model",
+            provider=self.provider_name,
+            latency_ms=500,
+            usage={"input_tokens": 40, "output_tokens": 4},
+        )
+
+
+def _policy(tmp_path: Path) -> str:
+    policy_path = tmp_path / "policy.yaml"
+    policy_path.write_text(
+        "reliability:\n"
+        "  max_parallel_requests: 2\n"
+        "rate_limits:\n"
+        "  limits:\n"
+        "    gemini: {requests_per_minute: 30}\n",
+        encoding="utf-8",
+    )
+    return str(policy_path)
+
+
+def test_plan_without_history_counts_all_work_at_max_tokens(tmp_path: Path) -> None:
+    config = load_run_config("configs/run.example.yaml")
+    plan = plan_run(config, policy_path=_policy(tmp_path), artifacts_root=str(tmp_path / "none"))
+    anthropic, gemini = plan.systems
+    assert anthropic.to_send == 5
+    assert anthropic.output_tokens == anthropic.max_output_tokens == 5 * 256
+    assert anthropic.cost_usd == anthropic.max_cost_usd > 0
+    # No latency history and no rate limit: duration is unknown.
+    assert anthropic.duration_seconds is None
+    assert gemini.requests_per_second == 0.5
+    assert gemini.duration_seconds == 10.0
+    assert plan.duration_seconds is None
+    assert not (tmp_path / "none").exists()
+
+
+def test_plan_uses_history_and_skips_completed_work(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(
+        "llm_eval.runner.build_provider_client",
+        lambda provider_config, timeout_seconds: TimedProvider(provider_config.provider),
+    )
+    artifacts = str(tmp_path / "artifacts")
+    small = load_run_config("configs/run.example.yaml")
+    small.benchmark.max_samples = 2
+    run_evaluation(config=small, policy_path=_policy(tmp_path), artifacts_root=artifacts)
+
+    config = load_run_config("configs/run.example.yaml")
+    plan = plan_run(config, policy_path=_policy(tmp_path), artifacts_root=artifacts)
+    anthropic = plan.systems[0]
+    assert anthropic.mean_latency_ms == 500
+    assert anthropic.output_tokens == 4 * anthropic.to_send
+    # A different max_samples is a different run_id, but the shared cache still covers
+    # the two prompts the smaller run already paid for.
+    assert (anthropic.completed, anthropic.cached, anthropic.to_send) == (0, 2, 3)
+    # Two adaptive slots at 500 ms each: 4 requests per second.
+    assert anthropic.requests_per_second == 4.0
+
+    rerun = plan_run(small, policy_path=_policy(tmp_path), artifacts_root=artifacts)
+    assert [system.completed for system in rerun.systems] == [2, 2]
+    assert rerun.duration_seconds == 0.0
+    assert rerun.cost_usd == 0.0
+
+
+def test_latency_history_reads_only_the_newest_runs(tmp_path: Path) -> None:
+    for index, latency in enumerate((100, 200, 300)):
+        run_dir = tmp_path / "runs" / f"run-{index}"
+        run_dir.mkdir(parents=True)
+        row = {"system_id": "groq:a", "latency_ms": latency, "output_tokens": 10}
+        results = run_dir / "results.jsonl"
+        results.write_text(json.dumps(row) + "\n", encoding="utf-8")
+        os.utime(results, (1_000 + index, 1_000 + index))
+    assert load_latency_history(tmp_path)["groq:a"].requests == 3
+    newest = load_latency_history(tmp_path, max_runs=2)["groq:a"]
+    assert (newest.requests, newest.mean_latency_ms) == (2, 250)
+
+
+def test_plan_is_fast_for_large_datasets(tmp_path: Path) -> None:
+    dataset = tmp_path / "big.jsonl"
+    with dataset.open("w", encoding="utf-8") as file:
+        for index in range(10_000):
+            row = {
+                "sample_id": f"s{index}",
+                "question": f"What is {index} + 1?",
+                "choices": ["1", "2", "3", "4"],
+                "answer_index": 1,
+            }
+            file.write(json.dumps(row) + "\n")
+    config = load_run_config("configs/run.example.yaml")
+    config.benchmark.dataset_path = str(dataset)
+    config.benchmark.max_samples = None
+    started = time.perf_counter()
+    plan = plan_run(config, policy_path=_policy(tmp_path), artifacts_root=str(tmp_path / "a"))
+    assert time.perf_counter() - started < 1.0
+    assert sum(system.to_send for system in plan.systems) == 20_000
+
+
+def test_request_keys_match_hashing_the_sorted_json_payload() -> None:
+    for temperature, prompt in ((0.0, "What is 1 + 1?"), (1, 'Quote "é"\nnext')):
+        payload = {
+            "provider": "groq",
+            "model": "qwen/qwen3-32b",
+            "sample_id": "s-1",
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_tokens": 256,
+        }
+        expected = hashlib.sha256(
+            json.dumps(payload, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:24]
+        fields = {name: payload[name] for name in ("provider", "model", "temperature")}
+        key_for = request_key_for(**fields, max_tokens=256)
+        assert key_for(json.dumps("s-1"), json.dumps(prompt)) == expected
+        assert request_key(**fields, sample_id="s-1", prompt=prompt, max_tokens=256) == expected
@@ -0,0 +1,44 @@
+import logging
+
+from llm_eval.config import BudgetPolicy, TokenPrice
+from llm_eval.pricing import CostMeter, TokenUsage, cost_usd, normalize_usage, resolve_price
+
+
+def test_normalize_usage_maps_each_provider_shape() -> None:
+    assert normalize_usage(
+        "anthropic", {"input_tokens": 10, "cache_read_input_tokens": 5, "output_tokens": 3}
+    ) == TokenUsage(15, 3)
+    assert normalize_usage(
+        "gemini", {"promptTokenCount": 7, "candidatesTokenCount": 2, "thoughtsTokenCount": 4}
+    ) == TokenUsage(7, 6)
+    assert normalize_usage("openai", {"prompt_tokens": 9, "completion_tokens": 1}) == TokenUsage(9, 1)
+    assert normalize_usage("groq", {"prompt_tokens": 4, "completion_tokens": 2}) == TokenUsage(4, 2)
+    assert normalize_usage("anthropic", None) == TokenUsage()
+
+
+def test_resolve_price_prefers_overrides_then_longest_prefix() -> None:
+    mini = resolve_price("openai", "gpt-4o-mini-2024-07-18")
+    assert mini is not None and mini.input_per_million == 0.15
+    override = TokenPrice(input_per_million=1.0, output_per_million=2.0)
+    assert resolve_price("openai", "gpt-4o", {"openai:gpt-4o": override}) == override
+    assert resolve_price("openai", "unknown-model") is None
+    assert cost_usd(None, TokenUsage(100, 100)) == 0.0
+    assert cost_usd(override, TokenUsage(1_000_000, 500_000)) == 2.0
+
+
+def test_cost_meter_refuses_reservations_past_budget(caplog) -> None:
+    meter = CostMeter(BudgetPolicy(max_usd_per_run=1.0, warn_at_percent=50))
+    assert meter.try_reserve(0.6)
+    assert not meter.try_reserve(0.6)
+    assert meter.stopped
+    with caplog.at_level(logging.WARNING, logger="llm_eval.pricing"):
+        meter.settle(0.6, 0.55)
+    assert meter.warned
+    assert "50%" in caplog.text
+    assert meter.snapshot()["spent_usd"] == 0.55
+
+
+def test_cost_meter_without_hard_stop_never_refuses() -> None:
+    meter = CostMeter(BudgetPolicy(max_usd_per_run=1.0, enforce_hard_stop=False))
+    assert meter.try_reserve(5.0)
+    assert not meter.stopped
@@ -0,0 +1,168 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+from llm_eval.config import ProviderConfig
+from llm_eval.providers.base import InferenceRequest, InferenceResponse, ProviderClient
+from llm_eval.providers.groq_provider import GroqProvider
+from llm_eval.providers.pool import ProviderClientPool, default_client_pool
+from llm_eval.ui.jobs import execute_eval_job
+
+
+class LifecycleClient(ProviderClient):
+    provider_name = "fake"
+
+    def __init__(self) -> None:
+        self.opened = 0
+        self.warmed = 0
+        self.closed = 0
+
+    def open(self) -> None:
+        self.opened += 1
+
+    def warm_up(self) -> None:
+        self.warmed += 1
+
+    def close(self) -> None:
+        self.closed += 1
+
+    def generate(self, request: InferenceRequest) -> InferenceResponse:
+        return InferenceResponse(text="A", model="m", provider=self.provider_name)
+
+
+def _factory(provider_config, timeout_seconds):
+    _ = (provider_config, timeout_seconds)
+    return LifecycleClient()
+
+
+def test_pool_reuses_clients_per_credential(monkeypatch) -> None:
+    cfg = ProviderConfig(provider="anthropic", model="m", api_key_env="POOL_TEST_KEY")
+    pool = ProviderClientPool()
+    monkeypatch.setenv("POOL_TEST_KEY", "key-one")
+    first = pool.acquire(cfg, 30, _factory)
+    assert pool.acquire(cfg, 30, _factory) is first
+    monkeypatch.setenv("POOL_TEST_KEY", "key-two")
+    second = pool.acquire(cfg, 30, _factory)
+    assert second is not first
+    assert len(pool) == 2
+
+    pool.warm_up([first, second, first])
+    pool.warm_up([first])
+    assert (first.warmed, second.warmed) == (1, 1)
+    pool.close()
+    assert (first.closed, second.closed) == (1, 1)
+    assert len(pool) == 0
+
+
+def test_pool_closes_least_recently_acquired_client_past_its_cap() -> None:
+    def _acquire(model: str) -> ProviderClient:
+        cfg = ProviderConfig(provider="anthropic", model=model, api_key_env="POOL_TEST_KEY")
+        return pool.acquire(cfg, 30, _factory)
+
+    pool = ProviderClientPool(max_clients=2)
+    clients = [_acquire("a"), _acquire("b")]
+    _acquire("a")
+    _acquire("c")
+    assert len(pool) == 2
+    assert [client.closed for client in clients] == [0, 1]
+
+
+def test_pool_closes_clients_idle_past_the_ttl() -> None:
+    now = [0.0]
+    pool = ProviderClientPool(idle_ttl_seconds=60, clock=lambda: now[0])
+    cfg = ProviderConfig(provider="anthropic", model="a", api_key_env="POOL_TEST_KEY")
+    idle = pool.acquire(cfg, 30, _factory)
+    now[0] = 59.0
+    assert pool.acquire(cfg, 30, _factory) is idle
+    now[0] = 118.0
+    assert pool.close_idle() == 0
+    now[0] = 119.0
+    assert pool.close_idle() == 1
+    assert (idle.closed, len(pool)) == (1, 0)
+
+
+def test_ui_jobs_with_the_same_key_share_byok_clients(monkeypatch, tmp_path: Path) -> None:
+    built: list[LifecycleClient] = []
+
+    def _tracking_factory(provider_config, timeout_seconds):
+        built.append(_factory(provider_config, timeout_seconds))
+        return built[-1]
+
+    byok_pool = ProviderClientPool(max_clients=4, idle_ttl_seconds=600)
+    monkeypatch.setattr("llm_eval.runner.build_provider_client", _tracking_factory)
+    monkeypatch.setattr("llm_eval.runner.byok_client_pool", lambda: byok_pool)
+    before = len(default_client_pool())
+
+    def _job(key: str) -> None:
+        execute_eval_job(
+            config_path="configs/run.example.yaml",
+            policy_path="configs/policy.yaml",
+            max_samples=1,
+            run_name_prefix="space",
+            env_overrides={"ANTHROPIC_API_KEY": key},
+            artifacts_root=str(tmp_path / "artifacts"),
+            reports_root=str(tmp_path / "reports"),
+        )
+
+    _job("sk-user-key")
+    _job("sk-user-key")
+    assert len(built) == 2  # one client per system, reused by the second job
+    _job("sk-other-key")
+    assert len(built) == 3  # only the anthropic client depends on the key
+    assert len(byok_pool) == 3
+    assert len(default_client_pool()) == before
+    byok_pool.close()
+    assert [client.closed for client in built] == [1, 1, 1]
+
+
+def test_groq_provider_builds_sdk_client_once(monkeypatch) -> None:
+    created = []
+
+    class FakeGroq:
+        def __init__(self, api_key: str, timeout: int):
+            created.append(api_key)
+            completion = SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content="B"))],
+                model="qwen",
+                usage=None,
+            )
+            self.chat = SimpleNamespace(
+                completions=SimpleNamespace(create=lambda **kwargs: completion)
+            )
+
+        def close(self) -> None:
+            created.append("closed")
+
+    monkeypatch.setattr("groq.Groq", FakeGroq)
+    monkeypatch.setenv("GROQ_POOL_KEY", "gsk-one")
+    client = GroqProvider(model="qwen", api_key_env="GROQ_POOL_KEY")
+    for _ in range(3):
+        assert client.generate(InferenceRequest(prompt="Q?")).text == "B"
+    assert created == ["gsk-one"]
+    monkeypatch.setenv("GROQ_POOL_KEY", "gsk-two")
+    client.generate(InferenceRequest(prompt="Q?"))
+    assert created == ["gsk-one", "closed", "gsk-two"]
+    assert "gsk-two" not in vars(client).values()  # only a fingerprint is kept
+
+
+def test_groq_provider_closes_replaced_async_client(monkeypatch) -> None:
+    closed = []
+
+    class FakeAsyncGroq:
+        def __init__(self, api_key: str, timeout: int):
+            self.api_key = api_key
+
+        async def close(self) -> None:
+            closed.append(self.api_key)
+
+    monkeypatch.setattr("groq.AsyncGroq", FakeAsyncGroq)
+    client = GroqProvider(model="qwen", api_key_env="GROQ_POOL_KEY")
+
+    async def _swap_keys() -> None:
+        monkeypatch.setenv("GROQ_POOL_KEY", "gsk-one")
+        await client._async_client()
+        monkeypatch.setenv("GROQ_POOL_KEY", "gsk-two")
+        await client._async_client()
+
+    asyncio.run(_swap_keys())
+    assert closed == ["gsk-one"]
@@ -0,0 +1,66 @@
+from llm_eval.config import ProviderConfig, RateLimit, RateLimitPolicy
+from llm_eval.ratelimit import (
+    ProviderRateLimiter,
+    RateLimiterRegistry,
+    estimate_request_tokens,
+    estimate_tokens,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_limiter_enforces_rpm_and_tpm_budgets() -> None:
+    clock = FakeClock()
+    limiter = ProviderRateLimiter(requests_per_minute=2, tokens_per_minute=600, clock=clock)
+    assert limiter.reserve(100) == 0.0
+    assert limiter.reserve(100) == 0.0
+    # Third request exceeds 2 RPM: one request refills every 30 seconds.
+    assert limiter.reserve(100) == 30.0
+    clock.now = 30.0
+    assert limiter.reserve(100) == 0.0
+
+    tokens_only = ProviderRateLimiter(requests_per_minute=None, tokens_per_minute=600, clock=clock)
+    assert tokens_only.reserve(450) == 0.0
+    # 150 tokens left and 10 tokens/second refill: a 250-token request waits 10 seconds.
+    assert tokens_only.reserve(250) == 10.0
+
+
+def test_throttle_shrinks_and_success_recovers_budget() -> None:
+    limiter = ProviderRateLimiter(
+        requests_per_minute=60, tokens_per_minute=None, recovery_per_success=0.25, clock=FakeClock()
+    )
+    limiter.on_throttled()
+    limiter.on_throttled()
+    assert limiter.fraction == 0.25
+    assert limiter.snapshot()["throttle_events"] == 2
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.fraction == 1.0
+
+
+def test_registry_prefers_provider_config_then_model_then_provider_policy() -> None:
+    policy = RateLimitPolicy(
+        limits={
+            "groq": RateLimit(requests_per_minute=30, tokens_per_minute=6000),
+            "groq:fast-model": RateLimit(tokens_per_minute=12000),
+        }
+    )
+    registry = RateLimiterRegistry(policy)
+    fast = registry.limiter_for(ProviderConfig(provider="groq", model="fast-model"))
+    assert (fast.configured_rpm, fast.configured_tpm) == (30, 12000)
+    pinned = registry.limiter_for(
+        ProviderConfig(provider="groq", model="other", requests_per_minute=5)
+    )
+    assert (pinned.configured_rpm, pinned.configured_tpm) == (5, 6000)
+    assert registry.limiter_for(ProviderConfig(provider="gemini", model="g")).unlimited
+
+
+def test_request_token_estimate_includes_completion_allowance() -> None:
+    assert estimate_tokens("abcd" * 10) == 10
+    assert estimate_request_tokens("abcd" * 10, max_tokens=256) == 266
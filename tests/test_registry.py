@@ -0,0 +1,88 @@
+import json
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from llm_eval.cli import app
+from llm_eval.registry import RunRegistry, default_registry_path
+from llm_eval.storage import ArtifactStore
+
+
+def _manifest(run_id: str, created_at: str, model: str) -> dict:
+    return {
+        "run_id": run_id,
+        "run_name": f"nightly-{run_id}",
+        "created_at": created_at,
+        "benchmark": {"name": "mmlu_subset"},
+        "providers": [{"provider": "groq", "model": model}],
+    }
+
+
+def _summary(run_id: str, model: str, correct: int) -> dict:
+    return {
+        "run_id": run_id,
+        "status": "completed",
+        "total_requests": 4,
+        "total_errors": 0,
+        "provider_metrics": {
+            f"groq:{model}": {
+                "provider": "groq",
+                "model": model,
+                "attempted": 4,
+                "correct": correct,
+                "errors": 0,
+                "accuracy": correct / 4,
+                "cost_usd": 0.01,
+            }
+        },
+    }
+
+
+def _write_run(root: Path, run_id: str, created_at: str, model: str, correct: int) -> None:
+    store = ArtifactStore(root, run_id)
+    store.write_manifest(_manifest(run_id, created_at, model))
+    store.write_summary(_summary(run_id, model, correct))
+
+
+def test_store_writes_keep_registry_current(tmp_path: Path) -> None:
+    store = ArtifactStore(tmp_path, "run-a")
+    store.write_manifest(_manifest("run-a", "2026-10-01T00:00:00+00:00", "m1"))
+    registry = RunRegistry(default_registry_path(tmp_path))
+    assert registry.get("run-a")["status"] == "running"
+
+    store.write_summary(_summary("run-a", "m1", 3))
+    run = registry.get("run-a")
+    assert run["status"] == "completed"
+    assert run["best_accuracy"] == 0.75
+    assert run["providers"] == ["groq:m1"]
+    assert run["systems"]["groq:m1"]["correct"] == 3
+
+
+def test_list_filters_and_orders_newest_first(tmp_path: Path) -> None:
+    _write_run(tmp_path, "run-a", "2026-10-01T00:00:00+00:00", "m1", 1)
+    _write_run(tmp_path, "run-b", "2026-10-03T00:00:00+00:00", "m2", 2)
+    _write_run(tmp_path, "run-c", "2026-10-02T00:00:00+00:00", "m1", 3)
+    registry = RunRegistry(default_registry_path(tmp_path))
+
+    assert [r["run_id"] for r in registry.list_runs()] == ["run-b", "run-c", "run-a"]
+    assert [r["run_id"] for r in registry.list_runs(model="m1")] == ["run-c", "run-a"]
+    assert [r["run_id"] for r in registry.list_runs(since="2026-10-02")] == ["run-b", "run-c"]
+    assert registry.list_runs(status="running") == []
+    assert registry.get("run-") is None  # ambiguous prefix
+
+
+def test_reindex_rebuilds_from_artifact_files(tmp_path: Path) -> None:
+    _write_run(tmp_path, "run-a", "2026-10-01T00:00:00+00:00", "m1", 1)
+    _write_run(tmp_path, "run-b", "2026-10-03T00:00:00+00:00", "m2", 2)
+    default_registry_path(tmp_path).unlink()
+
+    runner = CliRunner()
+    result = runner.invoke(app, ["runs", "latest", "--artifacts-root", str(tmp_path)])
+    assert result.exit_code == 0
+    assert result.output.strip() == "run-b"
+
+    result = runner.invoke(
+        app, ["runs", "list", "--artifacts-root", str(tmp_path), "--model", "m1", "--json"]
+    )
+    assert result.exit_code == 0
+    assert [run["run_id"] for run in json.loads(result.output)] == ["run-a"]
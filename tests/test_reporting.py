@@ -1,4 +1,7 @@
-from llm_eval.reporting import build_markdown_report
+import re
+
+from llm_eval.reporting import build_html_report, build_markdown_report
+from llm_eval.scoring import score_results
 
 
 def test_markdown_report_contains_sections() -> None:
@@ -22,3 +25,83 @@ def test_markdown_report_contains_sections() -> None:
     assert "# Evaluation Report: run123" in report
     assert "## Leaderboard" in report
     assert "## Category Breakdown" in report
+
+
+def _scored(ttft_ms: float | None = 20.0) -> dict:
+    rows = []
+    for index, (latency, correct) in enumerate(((100.0, True), (300.0, False))):
+        rows.append(
+            {
+                "system_id": "groq:a",
+                "provider": "groq",
+                "model": "a",
+                "sample_id": f"s{index}",
+                "category": "math",
+                "is_correct": correct,
+                "latency_ms": latency,
+                "cost_usd": 0.02,
+            }
+        )
+        rows.append(
+            {
+                "system_id": "openai:b",
+                "provider": "openai",
+                "model": "b",
+                "sample_id": f"s{index}",
+                "category": "math",
+                "is_correct": False,
+                "latency_ms": 50.0,
+                "ttft_ms": ttft_ms,
+                "cost_usd": 0.03,
+            }
+        )
+    return score_results(rows, {"status": "completed", "provider_metrics": {}})
+
+
+def _leaderboard_cells(report: str, system: str) -> list[str]:
+    line = next(line for line in report.splitlines() if line.startswith(f"| {system} |"))
+    return [cell.strip() for cell in line.strip("|").split("|")]
+
+
+def _html_cells(report: str, system: str) -> list[str]:
+    row = report.split(f"<tr><td>{system}</td>", 1)[1].split("</tr>", 1)[0]
+    return [system, *re.findall(r"<td>(.*?)</td>", row)]
+
+
+def test_reports_show_cost_and_cost_per_correct() -> None:
+    scored = _scored()
+    markdown = build_markdown_report("run-x", scored, [])
+    html = build_html_report("run-x", scored, [])
+    assert "Total cost (USD): `0.1000`" in markdown
+    assert "Total cost (USD): <code>0.1000</code>" in html
+    assert "| Cost (USD) | Cost/Correct (USD) |" in markdown
+    assert "<th>Cost (USD)</th><th>Cost/Correct (USD)</th>" in html
+    for cells in (_leaderboard_cells(markdown, "groq:a"), _html_cells(html, "groq:a")):
+        assert cells[-2:] == ["0.0400", "0.0400"]
+    # No correct answers: cost per correct is undefined, not zero or infinite.
+    for cells in (_leaderboard_cells(markdown, "openai:b"), _html_cells(html, "openai:b")):
+        assert cells[-2:] == ["0.0600", "n/a"]
+
+
+def test_reports_show_latency_and_ttft_percentiles() -> None:
+    scored = _scored()
+    markdown = build_markdown_report("run-x", scored, [])
+    html = build_html_report("run-x", scored, [])
+    assert "| p50 (ms) | p95 (ms) | p99 (ms) | TTFT p50 (ms) | TTFT p95 (ms) |" in markdown
+    assert "<th>p99 (ms)</th><th>TTFT p50 (ms)</th>" in html
+    for cells in (_leaderboard_cells(markdown, "groq:a"), _html_cells(html, "groq:a")):
+        # A system whose rows have no ttft_ms shows n/a, not zero.
+        assert cells[5:12] == ["200.0", "100.5", "300.0", "300.0", "n/a", "n/a", "n/a"]
+    for cells in (_leaderboard_cells(markdown, "openai:b"), _html_cells(html, "openai:b")):
+        assert cells[5:12] == ["50.0", "50.0", "50.0", "50.0", "20.0", "20.0", "20.0"]
+    assert "| math | 2 | 1 | 0.500 | 100.5 | 300.0 | 300.0 |" in markdown
+
+
+def test_reports_omit_ttft_columns_when_no_row_has_ttft() -> None:
+    scored = _scored(ttft_ms=None)
+    markdown = build_markdown_report("run-x", scored, [])
+    html = build_html_report("run-x", scored, [])
+    assert "TTFT" not in markdown
+    assert "TTFT" not in html
+    for cells in (_leaderboard_cells(markdown, "openai:b"), _html_cells(html, "openai:b")):
+        assert cells[5:] == ["50.0", "50.0", "50.0", "50.0", "0", "0.0600", "n/a"]
@@ -0,0 +1,45 @@
+from llm_eval.config import RetryPolicy
+from llm_eval.providers.http import ProviderHTTPError, parse_retry_after
+from llm_eval.retry import RetryScheduler
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_delay_is_jittered_and_honors_retry_after() -> None:
+    scheduler: RetryScheduler[str] = RetryScheduler(
+        RetryPolicy(backoff_seconds=[2, 4], jitter_ratio=0.5, max_delay_seconds=30)
+    )
+    for _ in range(20):
+        assert 1.0 <= scheduler.delay_for(1) <= 2.0
+        assert 2.0 <= scheduler.delay_for(5) <= 4.0
+    assert scheduler.delay_for(1, retry_after=12) == 12
+    assert scheduler.delay_for(1, retry_after=600) == 30
+
+
+def test_scheduler_releases_items_when_due() -> None:
+    clock = FakeClock()
+    scheduler: RetryScheduler[str] = RetryScheduler(
+        RetryPolicy(backoff_seconds=[1], jitter_ratio=0.0), clock=clock
+    )
+    scheduler.schedule("slow", attempt=1, retry_after=5)
+    scheduler.schedule("fast", attempt=1)
+    assert scheduler.pop_due() == []
+    assert scheduler.seconds_until_next() == 1.0
+    clock.now += 1
+    assert scheduler.pop_due() == ["fast"]
+    clock.now += 4
+    assert scheduler.pop_due() == ["slow"]
+    assert len(scheduler) == 0
+
+
+def test_provider_error_exposes_retry_after_header() -> None:
+    exc = ProviderHTTPError(429, "slow down", {"Retry-After": "7"})
+    assert exc.retry_after_seconds == 7.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
@@ -1,7 +1,11 @@
+import json
+import time
 from pathlib import Path
 
 from llm_eval.config import load_run_config
 from llm_eval.providers.base import InferenceRequest, InferenceResponse
+from llm_eval.providers.groq_provider import GroqProvider
+from llm_eval.providers.http import ProviderHTTPError
 from llm_eval.runner import run_evaluation
 
 
@@ -50,3 +54,361 @@ def test_runner_writes_artifacts_and_resumes(monkeypatch, tmp_path: Path) -> Non
     assert summary_first.run_id == summary_second.run_id
     results_lines_second = (run_dir / "results.jsonl").read_text(encoding="utf-8").strip().splitlines()
     assert len(results_lines_second) == 4
+
+
+class SlowFakeProvider(FakeProvider):
+    def generate(self, request: InferenceRequest) -> InferenceResponse:
+        # Later samples finish first so out-of-order completion is exercised.
+        time.sleep(0.01 * (len(request.prompt) % 3))
+        return InferenceResponse(
+            text=request.prompt[-1],
+            model="fake-model",
+            provider=self.provider_name,
+            latency_ms=1,
+            usage=None,
+        )
+
+
+def test_parallel_run_matches_serial_results(monkeypatch, tmp_path: Path) -> None:
+    def _fake_factory(provider_config, timeout_seconds):
+        _ = timeout_seconds
+        return SlowFakeProvider(provider_name=provider_config.provider)
+
+    monkeypatch.setattr("llm_eval.runner.build_provider_client", _fake_factory)
+
+    contents = {}
+    for mode in ("serial", "parallel"):
+        config = load_run_config("configs/run.example.yaml")
+        policy_path = tmp_path / f"{mode}.yaml"
+        policy_path.write_text(
+            f"reliability:\n  max_parallel_requests: 4\n  execution_mode: {mode}\n",
+            encoding="utf-8",
+        )
+        summary = run_evaluation(
+            config=config,
+            policy_path=str(policy_path),
+            artifacts_root=str(tmp_path / mode),
+        )
+        run_dir = tmp_path / mode / "runs" / summary.run_id
+        contents[mode] = (run_dir / "results.jsonl").read_text(encoding="utf-8")
+        assert summary.total_requests == 10
+
+    assert contents["serial"] == contents["parallel"]
+
+
+class AsyncFakeProvider(FakeProvider):
+    def generate(self, request: InferenceRequest) -> InferenceResponse:
+        raise AssertionError("async mode must not call the blocking generate")
+
+    async def agenerate(self, request: InferenceRequest) -> InferenceResponse:
+        return InferenceResponse(
+            text="B",
+            model="fake-model",
+            provider=self.provider_name,
+            latency_ms=1,
+            usage=None,
+        )
+
+
+def test_async_mode_awaits_agenerate(monkeypatch, tmp_path: Path) -> None:
+    def _fake_factory(provider_config, timeout_seconds):
+        _ = timeout_seconds
+        return AsyncFakeProvider(provider_name=provider_config.provider)
+
+    monkeypatch.setattr("llm_eval.runner.build_provider_client", _fake_factory)
+    policy_path = tmp_path / "policy.yaml"
+    policy_path.write_text(
+        "reliability:\n  max_parallel_requests: 50\n  execution_mode: async\n", encoding="utf-8"
+    )
+    config = load_run_config("configs/run.example.yaml")
+    summary = run_evaluation(
+        config=config,
+        policy_path=str(policy_path),
+        artifacts_root=str(tmp_path / "artifacts"),
+    )
+    assert summary.total_requests == 10
+    assert summary.total_errors == 0
+
+
+class FlakyProvider(FakeProvider):
+    def __init__(self, provider_name: str, failures_per_prompt: int):
+        super().__init__(provider_name)
+        self.failures_per_prompt = failures_per_prompt
+        self.calls: dict[str, int] = {}
+
+    def generate(self, request: InferenceRequest) -> InferenceResponse:
+        self.calls[request.prompt] = self.calls.get(request.prompt, 0) + 1
+        if self.calls[request.prompt] <= self.failures_per_prompt:
+            raise ProviderHTTPError(503, "overloaded", {"Retry-After": "0"})
+        return super().generate(request)
+
+
+def _retry_policy(tmp_path: Path) -> str:
+    policy_path = tmp_path / "policy.yaml"
+    policy_path.write_text(
+        "reliability:\n"
+        "  retry:\n"
+        "    max_attempts: 3\n"
+        "    backoff_seconds: [0]\n"
+        "  provider_error_rate:\n"
+        "    window_size_requests: 1000\n",
+        encoding="utf-8",
+    )
+    return str(policy_path)
+
+
+def test_retryable_failures_are_requeued_until_success(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(
+        "llm_eval.runner.build_provider_client",
+        lambda provider_config, timeout_seconds: FlakyProvider(provider_config.provider, 2),
+    )
+    config = load_run_config("configs/run.example.yaml")
+    summary = run_evaluation(
+        config=config,
+        policy_path=_retry_policy(tmp_path),
+        artifacts_root=str(tmp_path / "artifacts"),
+    )
+    assert summary.total_errors == 0
+    run_dir = tmp_path / "artifacts" / "runs" / summary.run_id
+    assert json.loads((run_dir / "summary.json").read_text())["retries_scheduled"] == 20
+
+
+def test_exhausted_retries_record_attempt_count(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(
+        "llm_eval.runner.build_provider_client",
+        lambda provider_config, timeout_seconds: FlakyProvider(provider_config.provider, 99),
+    )
+    config = load_run_config("configs/run.example.yaml")
+    summary = run_evaluation(
+        config=config,
+        policy_path=_retry_policy(tmp_path),
+        artifacts_root=str(tmp_path / "artifacts"),
+    )
+    assert summary.total_errors == 10
+    errors_path = tmp_path / "artifacts" / "runs" / summary.run_id / "errors.jsonl"
+    errors = [json.loads(line) for line in errors_path.read_text().splitlines()]
+    assert {row["attempt"] for row in errors} == {3}
+
+
+class BrokenProvider(FakeProvider):
+    def generate(self, request: InferenceRequest) -> InferenceResponse:
+        raise ProviderHTTPError(400, "bad request")
+
+
+def test_breaker_drops_failing_system_and_others_finish(monkeypatch, tmp_path: Path) -> None:
+    def _fake_factory(provider_config, timeout_seconds):
+        _ = timeout_seconds
+        if provider_config.provider == "anthropic":
+            return BrokenProvider(provider_config.provider)
+        return FakeProvider(provider_config.provider)
+
+    monkeypatch.setattr("llm_eval.runner.build_provider_client", _fake_factory)
+    policy_path = tmp_path / "policy.yaml"
+    policy_path.write_text(
+        "reliability:\n"
+        "  provider_error_rate:\n"
+        "    window_size_requests: 2\n"
+        "    hard_stop_percent: 10\n"
+        "    max_open_cycles: 0\n",
+        encoding="utf-8",
+    )
+    config = load_run_config("configs/run.example.yaml")
+    summary = run_evaluation(
+        config=config,
+        policy_path=str(policy_path),
+        artifacts_root=str(tmp_path / "artifacts"),
+    )
+    anthropic = summary.provider_metrics["anthropic:claude-3-5-haiku-latest"]
+    gemini = summary.provider_metrics["gemini:gemini-2.0-flash"]
+    assert anthropic["breaker"]["state"] == "dropped"
+    assert anthropic["attempted"] == 2
+    assert anthropic["skipped"] == 3
+    assert gemini["attempted"] == 5
+    run_dir = tmp_path / "artifacts" / "runs" / summary.run_id
+    status = json.loads((run_dir / "summary.json").read_text())["status"]
+    assert status == "completed_with_dropped_systems"
+
+
+def test_breaker_probes_that_get_retried_do_not_stall_the_run(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(
+        "llm_eval.runner.build_provider_client",
+        lambda provider_config, timeout_seconds: FlakyProvider(provider_config.provider, 99),
+    )
+    policy_path = tmp_path / "policy.yaml"
+    policy_path.write_text(
+        "reliability:\n"
+        "  retry:\n"
+        "    max_attempts: 3\n"
+        "    backoff_seconds: [0]\n"
+        "  provider_error_rate:\n"
+        "    window_size_requests: 2\n"
+        "    hard_stop_percent: 10\n"
+        "    cooldown_seconds: 0.05\n"
+        "    probe_requests: 1\n",
+        encoding="utf-8",
+    )
+    config = load_run_config("configs/run.example.yaml")
+    started = time.monotonic()
+    summary = run_evaluation(
+        config=config,
+        policy_path=str(policy_path),
+        artifacts_root=str(tmp_path / "artifacts"),
+    )
+    assert time.monotonic() - started < 10
+    for metrics in summary.provider_metrics.values():
+        assert metrics["breaker"]["state"] == "dropped"
+        assert metrics["attempted"] + metrics["skipped"] == 5
+
+
+class MeteredProvider(FakeProvider):
+    def generate(self, request: InferenceRequest) -> InferenceResponse:
+        return InferenceResponse(
+            text="B",
+            model="fake-model",
+            provider=self.provider_name,
+            latency_ms=1,
+            usage={"input_tokens": 0, "output_tokens": 10},
+        )
+
+
+def test_budget_stops_dispatch_before_overspending(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(
+        "llm_eval.runner.build_provider_client",
+        lambda provider_config, timeout_seconds: MeteredProvider(provider_config.provider),
+    )
+    # $0.001 per output token: each request reserves $0.256 and actually costs $0.01.
+    policy_path = tmp_path / "policy.yaml"
+    policy_path.write_text(
+        "budget:\n"
+        "  max_usd_per_run: 0.3\n"
+        "  pricing:\n"
+        "    anthropic:claude-3-5-haiku-latest: {input_per_million: 0, output_per_million: 1000}\n"
+        "    gemini:gemini-2.0-flash: {input_per_million: 0, output_per_million: 1000}\n"
+        "reliability:\n"
+        "  execution_mode: serial\n",
+        encoding="utf-8",
+    )
+    config = load_run_config("configs/run.example.yaml")
+    summary = run_evaluation(
+        config=config,
+        policy_path=str(policy_path),
+        artifacts_root=str(tmp_path / "artifacts"),
+    )
+    assert summary.total_requests == 5
+    anthropic = summary.provider_metrics["anthropic:claude-3-5-haiku-latest"]
+    assert anthropic["output_tokens"] == 50
+    assert round(anthropic["cost_per_correct_usd"], 6) == 0.01
+    run_dir = tmp_path / "artifacts" / "runs" / summary.run_id
+    written = json.loads((run_dir / "summary.json").read_text())
+    assert written["status"] == "stopped_due_to_budget"
+    assert round(written["budget"]["spent_usd"], 6) == 0.05
+
+    # A resumed run starts from the recorded spend and stays within budget.
+    resumed = run_evaluation(
+        config=config,
+        policy_path=str(policy_path),
+        artifacts_root=str(tmp_path / "artifacts"),
+    )
+    assert resumed.total_requests == 0
+
+
+def test_round_robin_scheduling_interleaves_providers(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setattr(
+        "llm_eval.runner.build_provider_client",
+        lambda provider_config, timeout_seconds: SlowFakeProvider(provider_config.provider),
+    )
+    rows = {}
+    for scheduling in ("provider_major", "round_robin"):
+        policy_path = tmp_path / f"{scheduling}.yaml"
+        policy_path.write_text(
+            f"reliability:\n  max_parallel_requests: 1\n  scheduling: {scheduling}\n",
+            encoding="utf-8",
+        )
+        summary = run_evaluation(
+            config=load_run_config("configs/run.example.yaml"),
+            policy_path=str(policy_path),
+            artifacts_root=str(tmp_path / scheduling),
+        )
+        results_path = tmp_path / scheduling / "runs" / summary.run_id / "results.jsonl"
+        rows[scheduling] = [json.loads(line) for line in results_path.read_text().splitlines()]
+
+    providers = [row["provider"] for row in rows["round_robin"]]
+    assert providers == ["anthropic", "gemini"] * 5
+    key = lambda row: row["request_key"]
+    assert sorted(rows["round_robin"], key=key) == sorted(rows["provider_major"], key=key)
+
+
+def test_shared_cache_serves_renamed_runs(monkeypatch, tmp_path: Path) -> None:
+    provider = MeteredProvider("anthropic")
+    calls = []
+
+    def _generate(request: InferenceRequest) -> InferenceResponse:
+        calls.append(request.prompt)
+        return MeteredProvider.generate(provider, request)
+
+    monkeypatch.setattr(provider, "generate", _generate)
+    monkeypatch.setattr(
+        "llm_eval.runner.build_provider_client", lambda provider_config, timeout_seconds: provider
+    )
+    for run_name in ("first", "second"):
+        config = load_run_config("configs/run.example.yaml")
+        config.run_name = run_name
+        summary = run_evaluation(
+            config=config,
+            policy_path="configs/policy.yaml",
+            artifacts_root=str(tmp_path / "artifacts"),
+        )
+        assert summary.total_requests == 10
+    # The renamed run has a new run_id but every response comes from the shared cache.
+    assert len(calls) == 10
+
+
+def test_resume_skips_torn_result_line(monkeypatch, tmp_path: Path) -> None:
+    config = load_run_config("configs/run.example.yaml")
+    config.benchmark.max_samples = 2
+    monkeypatch.setattr(
+        "llm_eval.runner.build_provider_client",
+        lambda provider_config, timeout_seconds: FakeProvider(provider_config.provider),
+    )
+    artifacts = str(tmp_path / "artifacts")
+    summary = run_evaluation(
+        config=config, policy_path="configs/policy.yaml", artifacts_root=artifacts
+    )
+    results_path = tmp_path / "artifacts" / "runs" / summary.run_id / "results.jsonl"
+    lines = results_path.read_text(encoding="utf-8").splitlines(keepends=True)
+    # Simulate a crash halfway through writing the last row.
+    results_path.write_text("".join(lines[:-1]) + lines[-1][:20], encoding="utf-8")
+
+    resumed = run_evaluation(
+        config=config, policy_path="configs/policy.yaml", artifacts_root=artifacts
+    )
+    rows = [json.loads(line) for line in results_path.read_text(encoding="utf-8").splitlines()]
+    assert len(rows) == 4
+    assert resumed.total_requests == 1
+    # Totals cover rows from both invocations, not just the one re-run request.
+    assert [m["attempted"] for m in resumed.provider_metrics.values()] == [2, 2]
+
+
+def test_missing_api_key_fails_requests_not_the_run(monkeypatch, tmp_path: Path) -> None:
+    def _fake_factory(provider_config, timeout_seconds):
+        if provider_config.provider == "anthropic":
+            return GroqProvider(provider_config.model, "LLM_EVAL_TEST_UNSET_KEY", timeout_seconds)
+        return FakeProvider(provider_config.provider)
+
+    monkeypatch.delenv("LLM_EVAL_TEST_UNSET_KEY", raising=False)
+    monkeypatch.setattr("llm_eval.runner.build_provider_client", _fake_factory)
+    config = load_run_config("configs/run.example.yaml")
+    summary = run_evaluation(
+        config=config,
+        policy_path="configs/policy.yaml",
+        artifacts_root=str(tmp_path / "artifacts"),
+    )
+    assert summary.provider_metrics["anthropic:claude-3-5-haiku-latest"]["errors"] == 5
+    assert summary.provider_metrics["gemini:gemini-2.0-flash"]["errors"] == 0
+    errors_path = tmp_path / "artifacts" / "runs" / summary.run_id / "errors.jsonl"
+    errors = [json.loads(line) for line in errors_path.read_text().splitlines()]
+    assert {row["error"] for row in errors} == {
+        "Missing API key in env var: LLM_EVAL_TEST_UNSET_KEY"
+    }
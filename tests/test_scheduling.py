@@ -0,0 +1,18 @@
+import pytest
+
+from llm_eval.scheduling import interleave
+
+
+def test_interleave_round_robin_drains_uneven_queues() -> None:
+    merged = interleave([["a1", "a2", "a3"], ["b1"], ["c1", "c2"]])
+    assert merged == ["a1", "b1", "c1", "a2", "c2", "a3"]
+
+
+def test_interleave_weighted_spreads_heavier_queue_evenly() -> None:
+    merged = interleave([list("AAAAAA"), list("bb")], [3, 1])
+    assert "".join(merged) == "AAbAAAbA"
+
+
+def test_interleave_rejects_mismatched_weights() -> None:
+    with pytest.raises(ValueError):
+        interleave([[1], [2]], [1.0])
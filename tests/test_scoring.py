@@ -1,5 +1,17 @@
-from llm_eval.scoring import score_results
-from llm_eval.stats import add_confidence_intervals, pairwise_significance, wilson_confidence_interval
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from llm_eval.scoring import ScoringState, merge_run_scores, score_results, score_run
+from llm_eval.sketch import LatencySketch
+from llm_eval.stats import (
+    PairwiseAccumulator,
+    add_confidence_intervals,
+    pairwise_significance,
+    wilson_confidence_interval,
+)
 
 
 def test_score_results_builds_provider_metrics() -> None:
@@ -63,3 +75,190 @@ def test_stats_functions_output_expected_shapes() -> None:
     )
     assert len(pairwise) == 1
     assert pairwise[0]["provider_a"] == "anthropic:claude-3-5-haiku-latest"
+
+
+def test_score_run_streams_to_the_same_report(tmp_path: Path) -> None:
+    rng = random.Random(7)
+    systems = ["a:m", "b:m", "c:m"]
+    rows = [
+        {
+            "system_id": system,
+            "provider": system.split(":")[0],
+            "model": "m",
+            "sample_id": f"s{sample}",
+            "category": f"cat{sample % 3}",
+            "is_correct": rng.random() < 0.6,
+            "latency_ms": rng.randint(50, 500),
+            "cost_usd": 0.001,
+            "response_text": "x" * 100,
+        }
+        for sample in range(40)
+        for system in systems
+    ]
+    rng.shuffle(rows)
+    summary = {"status": "completed", "provider_metrics": {sid: {"errors": 0} for sid in systems}}
+    (tmp_path / "results.jsonl").write_text("".join(json.dumps(r) + "\n" for r in rows))
+    (tmp_path / "summary.json").write_text(json.dumps(summary))
+
+    scored, pairwise = score_run(tmp_path)
+    assert scored == add_confidence_intervals(score_results(rows, summary))
+    assert pairwise == pairwise_significance(rows)
+
+
+def test_pairwise_accumulator_replaces_repeats_and_releases_samples() -> None:
+    rows = [
+        {"system_id": "a", "sample_id": "1", "is_correct": True},
+        {"system_id": "b", "sample_id": "2", "is_correct": True},
+        {"system_id": "b", "sample_id": "1", "is_correct": False},
+        {"system_id": "a", "sample_id": "1", "is_correct": False},
+    ]
+    assert pairwise_significance(rows)[0] | {"p_value_two_sided": 0} == {
+        "provider_a": "a",
+        "provider_b": "b",
+        "wins_a": 0,
+        "wins_b": 0,
+        "ties": 1,
+        "non_ties": 0,
+        "p_value_two_sided": 0,
+    }
+
+    accumulator = PairwiseAccumulator(["a", "b"])
+    for row in rows[:3]:
+        accumulator.add(row)
+    assert list(accumulator._pending) == ["2"]
+
+
+def _rows(count: int, start: int = 0) -> list[dict]:
+    return [
+        {
+            "system_id": system,
+            "sample_id": f"s{index}",
+            "category": f"cat{index % 2}",
+            "is_correct": (index + len(system)) % 3 == 0,
+            "latency_ms": index,
+        }
+        for index in range(start, start + count)
+        for system in ("a:m", "bb:m")
+    ]
+
+
+def _append(path: Path, rows: list[dict]) -> None:
+    with path.open("a", encoding="utf-8") as file:
+        file.writelines(json.dumps(row) + "\n" for row in rows)
+
+
+def test_scoring_state_merges_only_new_rows(tmp_path: Path) -> None:
+    results = tmp_path / "results.jsonl"
+    _append(results, _rows(5))
+    assert ScoringState.open(tmp_path).catch_up() == 0
+    score_run(tmp_path)
+    assert (tmp_path / "scoring_state.json").exists()
+
+    _append(results, _rows(3, start=5))
+    state = ScoringState.open(tmp_path)
+    assert state.offset == results.stat().st_size
+    rows = _rows(8)
+    assert state.report({}) == (
+        add_confidence_intervals(score_results(rows, {})),
+        pairwise_significance(rows),
+    )
+
+
+def test_scoring_state_checkpoint_recovers_from_foreign_rows(tmp_path: Path) -> None:
+    results = tmp_path / "results.jsonl"
+    state = ScoringState.open(tmp_path)
+    for row in _rows(2):
+        _append(results, [row])
+        state.add(row)
+    _append(results, _rows(1, start=2))  # written by another process
+    state.checkpoint()
+    assert state.scores.rows == 6
+
+    results.write_text("")  # rewritten run: the saved state no longer applies
+    _append(results, _rows(1))
+    assert score_run(tmp_path)[0]["total_rows"] == 2
+
+
+def test_scoring_state_forgets_samples_every_manifest_system_answered(tmp_path: Path) -> None:
+    manifest = {"providers": [{"provider": "a", "model": "m"}, {"provider": "bb", "model": "m"}]}
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+    _append(tmp_path / "results.jsonl", _rows(500))
+    score_run(tmp_path)
+
+    state = ScoringState.open(tmp_path)
+    assert state.pairs._pending == {}
+    assert json.loads((tmp_path / "scoring_state.json").read_text())["pairs"]["answers"] == {}
+    assert state.report({})[1] == pairwise_significance(_rows(500))
+
+
+def test_rows_repeated_after_a_sample_closed_still_replace_earlier_answers(
+    monkeypatch, tmp_path: Path
+) -> None:
+    rows = _rows(40)
+    # A resumed run re-answers samples every system had already answered.
+    late = [row | {"is_correct": not row["is_correct"]} for row in _rows(40)[::3]]
+    expected = pairwise_significance(rows + late)
+
+    accumulator = PairwiseAccumulator(["a:m", "bb:m"])
+    for row in rows:
+        accumulator.add(row)
+    assert accumulator._pending == {}
+    reloaded = PairwiseAccumulator.from_dict(json.loads(json.dumps(accumulator.to_dict())))
+    for row in late:
+        reloaded.add(row)
+    assert reloaded.comparisons() == expected
+    assert reloaded._pending == {}
+
+    monkeypatch.setattr("llm_eval.vectorized.VECTORIZE_MIN_ROWS", 1)
+    batched = PairwiseAccumulator(["a:m", "bb:m"])
+    batched.add_batch(rows)
+    batched.add_batch(late)
+    assert batched.comparisons() == expected
+    assert batched.to_dict() == reloaded.to_dict()
+
+    manifest = {"providers": [{"provider": "a", "model": "m"}, {"provider": "bb", "model": "m"}]}
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+    _append(tmp_path / "results.jsonl", rows)
+    score_run(tmp_path)
+    _append(tmp_path / "results.jsonl", late)
+    assert score_run(tmp_path)[1] == expected
+
+
+def test_latency_sketch_quantiles_are_close_and_merge_exactly() -> None:
+    rng = random.Random(11)
+    values = [rng.lognormvariate(6, 1) for _ in range(20_000)]
+    whole, left, right = LatencySketch(), LatencySketch(), LatencySketch()
+    for index, value in enumerate(values):
+        whole.add(value)
+        (left if index % 2 else right).add(value)
+    left.merge(right)
+    assert left.to_dict() == whole.to_dict()
+    assert len(whole.buckets) < 1_000  # bounded by bucket layout, not by value count
+
+    ordered = sorted(values)
+    for q in (0.5, 0.95, 0.99):
+        exact = ordered[int(q * len(ordered)) - 1]
+        assert abs(whole.quantile(q) - exact) / exact < 0.01
+    assert LatencySketch().quantile(0.5) is None
+
+
+def test_latency_percentiles_persist_and_merge_across_runs(tmp_path: Path) -> None:
+    rows = [
+        {"system_id": "groq:m", "category": ["math", "law"][i % 2], "latency_ms": i, "ttft_ms": 7}
+        for i in range(1, 101)
+    ]
+    first, second = tmp_path / "a", tmp_path / "b"
+    for run_dir, chunk in ((first, rows[:60]), (second, rows[60:])):
+        run_dir.mkdir()
+        _append(run_dir / "results.jsonl", chunk)
+        score_run(run_dir)
+
+    scored = score_run(first)[0]["providers"]["groq:m"]
+    assert scored["latency_p50_ms"] == pytest.approx(30, rel=0.01)
+    assert scored["ttft_p99_ms"] == 7  # clamped to the exact maximum
+    assert scored["categories"]["math"]["latency_p99_ms"] == 60
+
+    merged = merge_run_scores([first, second]).result({})["providers"]["groq:m"]
+    assert merged == score_results(rows, {})["providers"]["groq:m"]
+    assert 49 <= merged["latency_p50_ms"] <= 51
+    assert 98 <= merged["latency_p99_ms"] <= 100
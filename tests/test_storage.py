@@ -0,0 +1,78 @@
+import json
+import multiprocessing
+import time
+from pathlib import Path
+
+from llm_eval.config import ArtifactPolicy
+from llm_eval.storage import ArtifactStore, append_jsonl, iter_jsonl
+
+
+def _append_many(path: str, worker: int) -> None:
+    for index in range(50):
+        append_jsonl(path, {"worker": worker, "index": index, "pad": "x" * 2000})
+
+
+def test_concurrent_process_appends_never_interleave(tmp_path: Path) -> None:
+    path = tmp_path / "results.jsonl"
+    workers = [
+        multiprocessing.Process(target=_append_many, args=(str(path), worker))
+        for worker in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    rows = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(rows) == 200
+
+
+def test_append_repairs_torn_tail_and_readers_skip_it(tmp_path: Path) -> None:
+    store = ArtifactStore(tmp_path, "run")
+    store.append_result({"request_key": "a", "cost_usd": 1.0})
+    with store.results_path.open("a", encoding="utf-8") as file:
+        file.write('{"request_key": "b", "co')
+    assert store.load_completed_keys() == {"a"}
+    store.append_result({"request_key": "c", "cost_usd": 2.0})
+    assert [row["request_key"] for row in iter_jsonl(store.results_path)] == ["a", "c"]
+    assert store.load_spent_usd() == 3.0
+
+
+def test_summary_is_replaced_atomically(tmp_path: Path) -> None:
+    store = ArtifactStore(tmp_path, "run")
+    store.write_summary({"status": "running"})
+    store.write_summary({"status": "completed"})
+    assert json.loads(store.summary_path.read_text(encoding="utf-8")) == {"status": "completed"}
+    assert [path.name for path in store.run_dir.iterdir()] == ["summary.json"]
+
+
+def test_buffered_writer_flushes_on_size_and_close(tmp_path: Path) -> None:
+    policy = ArtifactPolicy(durability="on_close", flush_max_records=3, flush_interval_seconds=60)
+    store = ArtifactStore(tmp_path, "run", policy=policy)
+    store.append_result({"request_key": "a"})
+    store.append_result({"request_key": "b"})
+    assert not store.results_path.exists()
+    store.append_result({"request_key": "c"})
+    deadline = time.monotonic() + 5
+    while not store.results_path.exists() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(list(iter_jsonl(store.results_path))) == 3
+    store.append_error({"request_key": "d"})
+    store.close()
+    assert [row["request_key"] for row in iter_jsonl(store.errors_path)] == ["d"]
+
+
+def test_buffered_writer_flushes_on_interval(tmp_path: Path) -> None:
+    policy = ArtifactPolicy(durability="batched", flush_interval_seconds=0.01)
+    with ArtifactStore(tmp_path, "run", policy=policy) as store:
+        store.append_result({"request_key": "a"})
+        deadline = time.monotonic() + 5
+        while not store.results_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert store.results_path.exists()
+
+
+def test_per_record_durability_writes_through(tmp_path: Path) -> None:
+    store = ArtifactStore(tmp_path, "run", policy=ArtifactPolicy(durability="per_record"))
+    store.append_result({"request_key": "a"})
+    assert len(list(iter_jsonl(store.results_path))) == 1
+    store.close()
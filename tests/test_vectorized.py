@@ -0,0 +1,94 @@
+import json
+import random
+from math import comb
+from pathlib import Path
+
+import pytest
+
+from llm_eval import scoring, vectorized
+from llm_eval.scoring import score_results
+from llm_eval.stats import _binomial_two_sided_p_value, pairwise_significance
+
+pytest.importorskip("numpy")
+
+
+def _rows(seed: int, count: int) -> list[dict]:
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        system = rng.choice(["groq:b", "openai:a", "anthropic:c", "gemini:d"])
+        row = {
+            "provider": system.split(":")[0],
+            "model": system.split(":")[1],
+            "sample_id": f"s{rng.randint(0, count // 3)}",  # repeats exercise last-wins
+            "category": rng.choice(["math", "law", "biology"]),
+            "is_correct": rng.random() < 0.55,
+            "latency_ms": rng.randint(1, 2000),
+            "input_tokens": rng.randint(10, 90),
+            "output_tokens": rng.randint(1, 9),
+            "cost_usd": rng.random() / 1000,
+        }
+        if rng.random() < 0.8:
+            row["system_id"] = system
+        if rng.random() < 0.3:
+            row["ttft_ms"] = rng.randint(1, 400)
+        rows.append(row)
+    return rows
+
+
+def test_array_engine_matches_dict_loops(monkeypatch: pytest.MonkeyPatch) -> None:
+    rows = _rows(seed=3, count=3000)
+    summary = {"status": "completed", "provider_metrics": {"groq:b": {"errors": 2}}}
+    monkeypatch.setattr(vectorized, "VECTORIZE_MIN_ROWS", 1)
+    fast = (score_results(rows, summary), pairwise_significance(rows))
+    monkeypatch.setattr(vectorized, "VECTORIZE_MIN_ROWS", 10**9)
+    slow = (score_results(rows, summary), pairwise_significance(rows))
+    # Byte-identical, including float sums and key order.
+    assert json.dumps(fast) == json.dumps(slow)
+
+
+@pytest.mark.parametrize("with_manifest", [False, True])
+def test_scoring_state_rebuild_uses_array_engine_in_batches(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, with_manifest: bool
+) -> None:
+    rows = [{k: v for k, v in row.items() if k != "cost_usd"} for row in _rows(5, 3000)]
+    if with_manifest:
+        # Unique (system, sample) rows: once every system answered, a sample is closed.
+        rows = list({(row.get("system_id"), row["sample_id"]): row for row in rows}.values())
+        for row in rows:
+            row["system_id"] = f"{row['provider']}:{row['model']}"
+        providers = [{"provider": p, "model": m} for p, m in (("groq", "b"), ("openai", "a"))]
+        providers += [{"provider": "anthropic", "model": "c"}, {"provider": "gemini", "model": "d"}]
+        (tmp_path / "manifest.json").write_text(json.dumps({"providers": providers}))
+    with (tmp_path / "results.jsonl").open("w") as file:
+        file.writelines(json.dumps(row) + "\n" for row in rows)
+
+    monkeypatch.setattr(scoring, "CATCH_UP_BATCH_ROWS", 700)
+    monkeypatch.setattr(vectorized, "VECTORIZE_MIN_ROWS", 1)
+    fast = scoring.ScoringState.open(tmp_path)
+    monkeypatch.setattr(vectorized, "VECTORIZE_MIN_ROWS", 10**9)
+    slow = scoring.ScoringState.open(tmp_path)
+    assert fast.report({}) == slow.report({})
+    fast_pairs, slow_pairs = fast.pairs.to_dict(), slow.pairs.to_dict()
+    assert fast_pairs["answers"] == slow_pairs["answers"]
+    assert fast_pairs["finished"] == slow_pairs["finished"]
+    assert sorted(fast_pairs["counts"]) == sorted(slow_pairs["counts"])
+    if with_manifest:
+        assert len(fast.pairs._pending) < len({row["sample_id"] for row in rows})
+def test_exact_binomial_matches_float_products_and_handles_large_n() -> None:
+    def reference(k: int, n: int) -> float:
+        observed = comb(n, k) * 0.5**k * 0.5 ** (n - k)
+        total = 0.0
+        for i in range(n + 1):
+            prob = comb(n, i) * 0.5**i * 0.5 ** (n - i)
+            if prob <= observed + 1e-15:
+                total += prob
+        return min(1.0, total)
+
+    for n in range(60):
+        for k in range(n + 1):
+            assert _binomial_two_sided_p_value(k, n) == reference(k, n)
+    # The float products overflow past n ~ 1030; the exact tail does not.
+    assert _binomial_two_sided_p_value(2600, 5000) < 0.01
+    assert _binomial_two_sided_p_value(2500, 5000) == pytest.approx(1.0)
+    assert _binomial_two_sided_p_value(3, 10, 0.3) == pytest.approx(1.0)